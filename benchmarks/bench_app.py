@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark des chemins chauds du tableau de bord
+
+Génère des ligues synthétiques au format de `données/` (1x, 10x et 100x les
+joueurs réels) et mesure, pour chaque taille :
+- load    : chargement des tables (conversion CSV -> Arrow, memory-map, table résidente) ;
+- compute : calculs des pages (top N, filtre équipe, recherche, talents cachés,
+            compositions, projections...), première exécution puis requêtes répétées ;
+- figures : construction et sérialisation JSON des figures Plotly ;
+- pages   : exécution complète de chaque page (AppTest Streamlit), premier rendu
+            puis reruns, la latence que voit l'utilisateur.
+
+Les résultats sont écrits en JSON (--output). Avec --baseline, les médianes
+sont comparées à un fichier de résultats précédent et le script sort en
+erreur si l'une d'elles se dégrade au-delà de --tolerance.
+
+Usage : python benchmarks/bench_app.py [--scales 1 10 100] [--repeat 20] [--output results.json]
+                                       [--baseline previous.json] [--tolerance 1.25] [--no-pages]
+"""
+
+import argparse
+import json
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from scoutonze import data_store  # noqa: E402
+from scoutonze.data_store import DATA_DIR, TABLES, load_table  # noqa: E402
+from scoutonze.filters import Criterion, get_filter_engine  # noqa: E402
+from scoutonze.form_pipeline import OUTPUT_COLUMNS, top_by_team  # noqa: E402
+from scoutonze.leaderboard import SORT_COLUMNS, get_leaderboard  # noqa: E402
+from scoutonze.precompute import LEAGUE_ID, get_lineups, solve_scope  # noqa: E402
+from scoutonze.projections import get_projections  # noqa: E402
+from scoutonze.ranking import get_ranking_index  # noqa: E402
+from scoutonze.search import get_search_index  # noqa: E402
+from scoutonze.season import get_season_outlook  # noqa: E402
+from scoutonze.similar import get_similarity_index  # noqa: E402
+from scoutonze.teams import get_team_directory  # noqa: E402
+
+# Tables copiées telles quelles : seules les tables de joueurs sont agrandies
+COPIED_TABLES = ['standings', 'scheduled', 'recent']
+
+SCALES = [1, 10, 100]
+
+# Écart absolu (ms) en deçà duquel une dégradation est considérée comme du bruit
+MIN_DELTA_MS = 1.0
+
+
+def synthetic_league(path, scale, seed=0):
+    """Écrit dans `path` une ligue avec `scale` fois plus de joueurs que `données/`.
+
+    Les joueurs sont tirés parmi les joueurs réels (même équipe et même poste),
+    avec des noms recombinés et des statistiques bruitées ; le classement et
+    le calendrier sont ceux des données réelles.
+    """
+    rng = np.random.default_rng(seed)
+    players = real = pd.read_csv(DATA_DIR / TABLES['players']['file'])
+    if scale > 1:
+        n_players = len(real) * scale
+        source = real.iloc[rng.integers(len(real), size=n_players)].reset_index(drop=True)
+        names = real['Joueur'].str.split()
+        first, last = names.str[0].unique(), names.str[-1].unique()
+        players = source.assign(
+            Joueur=[f'{first[i]} {last[j]}' for i, j in zip(
+                rng.integers(len(first), size=n_players), rng.integers(len(last), size=n_players)
+            )],
+            Score_Forme=np.clip(source['Score_Forme'] + rng.normal(0, 0.5, n_players), 0, 10).round(2),
+            Minutes=np.maximum(source['Minutes'] + rng.integers(-90, 91, n_players), 0),
+            Buts=rng.poisson(source['Buts'].to_numpy(dtype=float)),
+        )[OUTPUT_COLUMNS]
+
+    path.mkdir(parents=True, exist_ok=True)
+    players.to_csv(path / TABLES['players']['file'], index=False)
+    top_by_team(players).to_csv(path / TABLES['top_by_team']['file'], index=False)
+    for name in COPIED_TABLES:
+        shutil.copy(DATA_DIR / TABLES[name]['file'], path / TABLES[name]['file'])
+    return players
+
+
+def _timings(function, repeat):
+    """Durées (ms) de `repeat` appels de `function(i)`"""
+    timings = np.empty(repeat)
+    for i in range(repeat):
+        start = time.perf_counter()
+        function(i)
+        timings[i] = time.perf_counter() - start
+    return timings * 1000
+
+
+def _result(section, name, timings, **extra):
+    return {
+        'section': section,
+        'name': name,
+        'runs': len(timings),
+        'median_ms': float(np.median(timings)),
+        'p95_ms': float(np.percentile(timings, 95)),
+        'min_ms': float(np.min(timings)),
+        **extra,
+    }
+
+
+def bench_load(data_dir, repeat):
+    """Conversion CSV -> Arrow, relecture par memory-map, puis table résidente"""
+    results = []
+    for name in ['players', 'top_by_team'] + COPIED_TABLES:
+        shutil.rmtree(data_dir / data_store.CACHE_DIR_NAME, ignore_errors=True)
+        data_store._RESIDENT.clear()
+        results.append(_result('load', f'{name}:convert', _timings(lambda i: load_table(name, data_dir), 1)))
+
+        def reload(i):
+            # Les fichiers Arrow sont déjà là : seul le memory-map est mesuré
+            data_store._RESIDENT.clear()
+            load_table(name, data_dir)
+
+        results.append(_result('load', f'{name}:mmap', _timings(reload, repeat)))
+        results.append(_result('load', f'{name}:resident', _timings(lambda i: load_table(name, data_dir), repeat)))
+    return results
+
+
+def bench_compute(data_dir, players, repeat):
+    """Construction des index (une fois par version des données), puis requêtes des pages"""
+    results = []
+
+    def build(name, function):
+        results.append(_result('compute', f'{name}:build', _timings(lambda i: function(), 1)))
+        return function()
+
+    teams = build('teams', lambda: get_team_directory(data_dir))
+    ranking = build('ranking', lambda: get_ranking_index(data_dir))
+    search = build('search', lambda: get_search_index(data_dir))
+    engine = build('filters', lambda: get_filter_engine(data_dir))
+    similar = build('similar', lambda: get_similarity_index(data_dir))
+    leaderboard = build('leaderboard', lambda: get_leaderboard(data_dir))
+    build('projections', lambda: get_projections(data_dir=data_dir))
+    build('season', lambda: get_season_outlook(data_dir=data_dir))
+    build('lineups:league', lambda: get_lineups(LEAGUE_ID, '4-3-3', data_dir))
+    team_ids = [int(team_id) for team_id in teams.teams.index if team_id > 0]
+    build('lineups:teams', lambda: [get_lineups(team_id, '4-3-3', data_dir) for team_id in team_ids])
+
+    positions = ['GK', 'DEF', 'MID', 'FWD']
+    sort_columns = list(SORT_COLUMNS)
+    names = players['Joueur'].to_numpy()
+    queries = [
+        names[i][:max(3, len(names[i]) // 2)] for i in np.random.default_rng(2).integers(len(names), size=repeat)
+    ]
+    labels = players.index[np.random.default_rng(3).integers(len(players), size=repeat)]
+
+    cases = {
+        'top_n': lambda i: ranking.top(10),
+        'top_n:position': lambda i: ranking.top(50, positions[i % 4]),
+        'team_filter': lambda i: ranking.top(team=team_ids[i % len(team_ids)]),
+        # Tri et page différents à chaque appel (permutations par colonne déjà calculées au premier tour)
+        'leaderboard:page': lambda i: leaderboard.page(
+            sort_columns[i % len(sort_columns)], i % 2 == 1, 1 + i % 20, 25, positions[i % 4]),
+        'search': lambda i: search.search(queries[i]),
+        'similar': lambda i: similar.nearest(labels[i]),
+        # Seuils différents à chaque appel : pas de résultat mémorisé
+        'hidden_gems': lambda i: engine.query(
+            (Criterion('Score_Forme', '>', 6.5 - i / 1000), Criterion('Pct_temps_jeu', '<', 60),
+             Criterion('Matchs', '>=', 5)), positions),
+        # Composition recalculée (sans le cache des compositions)
+        'lineup:team': lambda i: solve_scope(team_ids[i % len(team_ids)], ['4-3-3'], data_dir=data_dir),
+    }
+    for name, function in cases.items():
+        results.append(_result('compute', name, _timings(function, repeat)))
+    return results
+
+
+def bench_figures(data_dir, repeat):
+    """Figures des pages : construction, puis sérialisation (ce que fait st.plotly_chart)"""
+    import plotly.express as px
+
+    from scoutonze.lineup import lineup_frame
+    from scoutonze.pitch import render_xi
+
+    ranking = get_ranking_index(data_dir)
+    players = ranking.players
+    lineup = get_lineups(LEAGUE_ID, '4-3-3', data_dir)[0]
+    gems = get_filter_engine(data_dir).query(
+        (Criterion('Score_Forme', '>', 6.5), Criterion('Pct_temps_jeu', '<', 60), Criterion('Matchs', '>=', 5))
+    ).head(20)
+    top = ranking.top(50, 'MID')
+
+    figures = {
+        'overview:histogram': lambda i: px.histogram(players, x='Score_Forme', nbins=30),
+        'top_players:bar': lambda i: px.bar(
+            top.assign(Equipe_principale=top['Equipe_principale'].cat.remove_unused_categories()),
+            x='Joueur', y='Score_Forme', color='Equipe_principale',
+            hover_data=['Matchs', 'Minutes', 'Buts', 'Passes_decisives']),
+        'hidden_gems:scatter': lambda i: px.scatter(
+            gems.assign(Poste_simplifie=gems['Poste_simplifie'].cat.remove_unused_categories()),
+            x='Pct_temps_jeu', y='Score_Forme', size='Buts', color='Poste_simplifie', hover_name='Joueur'),
+        # Titre différent à chaque appel : la figure mémorisée n'est pas réutilisée
+        'best_xi:pitch': lambda i: render_xi('4-3-3', lineup_frame(players, lineup), f'XI {i}'),
+    }
+
+    results = []
+    for name, build in figures.items():
+        built = []
+        results.append(_result('figures', f'{name}:build', _timings(lambda i: built.append(build(i)), repeat)))
+        results.append(_result('figures', f'{name}:json', _timings(lambda i: built[i].to_json(), repeat)))
+    return results
+
+
+def bench_pages(data_dir, repeat):
+    """Chaque page exécutée par AppTest : premier rendu (calculs inclus) puis reruns"""
+    from streamlit.testing.v1 import AppTest
+
+    from scoutonze.pages import PAGES
+
+    # Les pages lisent le dossier de données par défaut
+    default_dir, data_store.DATA_DIR = data_store.DATA_DIR, data_dir
+    try:
+        app = AppTest.from_file(str(ROOT / 'app_ScoutOnze_FINAL.py'), default_timeout=600)
+        app.run()
+        results = []
+        for label, module in PAGES.items():
+            radio = app.sidebar.radio[0]
+            first = _timings(lambda i: radio.set_value(label).run(), 1)
+            if app.exception:
+                raise RuntimeError(f"Page {label} : {app.exception[0].message}")
+            results.append(_result('pages', f'{module}:first', first))
+            results.append(_result('pages', f'{module}:rerun', _timings(lambda i: app.run(), repeat)))
+        return results
+    finally:
+        data_store.DATA_DIR = default_dir
+
+
+def _environment():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+    }
+
+
+def compare(results, baseline, tolerance, min_delta_ms=MIN_DELTA_MS):
+    """Mesures dont la médiane dépasse `tolerance` x celle de la référence (et d'au moins `min_delta_ms`)"""
+    reference = {(r['scale'], r['section'], r['name']): r['median_ms'] for r in baseline['results']}
+    regressions = []
+    for result in results:
+        before = reference.get((result['scale'], result['section'], result['name']))
+        if before and result['median_ms'] > max(tolerance * before, before + min_delta_ms):
+            regressions.append((result, before))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--scales', type=int, nargs='+', default=SCALES, help="multiples du nombre de joueurs réels")
+    parser.add_argument('--repeat', type=int, default=20, help="répétitions des mesures à chaud")
+    parser.add_argument('--output', type=Path, default=None, help="fichier JSON des résultats")
+    parser.add_argument('--baseline', type=Path, default=None, help="résultats de référence à comparer")
+    parser.add_argument('--tolerance', type=float, default=1.25, help="dégradation tolérée (médiane)")
+    parser.add_argument('--no-pages', action='store_true', help="ne pas exécuter les pages Streamlit")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix='scoutonze-bench-') as tmp:
+        for scale in args.scales:
+            data_dir = Path(tmp) / f'x{scale}'
+            players = synthetic_league(data_dir, scale)
+            print(f"== {scale}x : {len(players)} joueurs", file=sys.stderr)
+
+            scale_results = bench_load(data_dir, args.repeat)
+            scale_results += bench_compute(data_dir, load_table('players', data_dir), args.repeat)
+            scale_results += bench_figures(data_dir, args.repeat)
+            if not args.no_pages:
+                scale_results += bench_pages(data_dir, args.repeat)
+
+            for result in scale_results:
+                result.update(scale=scale, players=len(players))
+                print(f"{result['section']:<8} {result['name']:<28} médiane {result['median_ms']:9.2f} ms"
+                      f"   p95 {result['p95_ms']:9.2f} ms", file=sys.stderr)
+            results += scale_results
+
+    report = {'environment': _environment(), 'results': results}
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output is not None:
+        args.output.write_text(text + '\n', encoding='utf-8')
+    else:
+        print(text)
+
+    if args.baseline is not None:
+        regressions = compare(results, json.loads(args.baseline.read_text(encoding='utf-8')), args.tolerance)
+        for result, before in regressions:
+            print(f"❌ {result['scale']}x {result['section']} {result['name']} : "
+                  f"{before:.2f} -> {result['median_ms']:.2f} ms", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
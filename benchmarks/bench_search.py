@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark de la recherche joueur (scoutonze.search)
+
+Construit un effectif synthétique (50 000 joueurs par défaut) à partir des
+prénoms et noms réels de `données/`, puis mesure la latence des requêtes
+(exactes, préfixes, fautes de frappe, sans accents).
+
+Usage : python benchmarks/bench_search.py [--players 50000] [--queries 2000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scoutonze.data_store import load_table  # noqa: E402
+from scoutonze.search import PlayerSearchIndex  # noqa: E402
+
+
+def synthetic_players(n_players, seed=0):
+    """Noms synthétiques : combinaisons prénom x nom des joueurs réels"""
+    rng = np.random.default_rng(seed)
+    names = load_table('players')['Joueur'].str.split()
+    first = names.str[0].unique()
+    last = names.str[-1].unique()
+    return pd.DataFrame({
+        'Joueur': [f'{first[i]} {last[j]}' for i, j in zip(
+            rng.integers(len(first), size=n_players), rng.integers(len(last), size=n_players)
+        )],
+        'Score_Forme': rng.uniform(0, 10, size=n_players).round(2),
+    })
+
+
+def make_queries(names, n_queries, seed=1):
+    """Mélange de requêtes : nom complet, préfixe, faute de frappe, nom seul"""
+    rng = np.random.default_rng(seed)
+    queries = []
+    for name in rng.choice(names, size=n_queries):
+        kind = rng.integers(4)
+        if kind == 0:
+            queries.append(name)
+        elif kind == 1:
+            queries.append(name[:max(2, len(name) // 3)])
+        elif kind == 2:
+            i = rng.integers(1, len(name) - 1)
+            queries.append(name[:i] + name[i + 1:])
+        else:
+            queries.append(name.split()[-1])
+    return queries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--players', type=int, default=50_000)
+    parser.add_argument('--queries', type=int, default=2_000)
+    args = parser.parse_args()
+
+    players = synthetic_players(args.players)
+
+    start = time.perf_counter()
+    index = PlayerSearchIndex(players)
+    build_s = time.perf_counter() - start
+
+    queries = make_queries(players['Joueur'].to_numpy(), args.queries)
+    timings = np.empty(len(queries))
+    for i, query in enumerate(queries):
+        start = time.perf_counter()
+        index.search_rows(query)
+        timings[i] = time.perf_counter() - start
+
+    timings_ms = timings * 1000
+    print(f"Joueurs indexés   : {len(players)}")
+    print(f"Construction      : {build_s:.2f} s")
+    print(f"Requêtes          : {len(queries)}")
+    print(f"Latence médiane   : {np.median(timings_ms):.3f} ms")
+    print(f"Latence p95       : {np.percentile(timings_ms, 95):.3f} ms")
+    print(f"Latence p99       : {np.percentile(timings_ms, 99):.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark de la recherche de joueurs similaires (scoutonze.similar)
+
+Construit un effectif synthétique (100 000 joueurs par défaut) dont les
+statistiques sont tirées autour de celles des joueurs réels de `données/`,
+puis mesure la latence des requêtes k plus proches voisins (toute la
+ligue, limitées au poste, en excluant l'équipe).
+
+Usage : python benchmarks/bench_similar.py [--players 100000] [--queries 500]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scoutonze.data_store import load_table  # noqa: E402
+from scoutonze.features import build_features  # noqa: E402
+from scoutonze.similar import SimilarityIndex  # noqa: E402
+
+
+def synthetic_players(n_players, n_teams=500, seed=0):
+    """Joueurs réels ré-échantillonnés, avec du bruit sur les statistiques"""
+    rng = np.random.default_rng(seed)
+    real = load_table('players')
+    players = real.iloc[rng.integers(len(real), size=n_players)].reset_index(drop=True)
+    noise = lambda col, scale: np.clip(players[col].to_numpy() * rng.normal(1, scale, n_players), 0, None)
+    players = players.assign(
+        Score_Forme=noise('Score_Forme', 0.1).round(2),
+        Minutes=noise('Minutes', 0.1).round().astype(int),
+        Buts=noise('Buts', 0.3).round().astype(int),
+        Passes_decisives=noise('Passes_decisives', 0.3).round().astype(int),
+    )
+    return build_features(players), rng.integers(n_teams, size=n_players)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--players', type=int, default=100_000)
+    parser.add_argument('--queries', type=int, default=500)
+    args = parser.parse_args()
+
+    players, team_ids = synthetic_players(args.players)
+
+    start = time.perf_counter()
+    index = SimilarityIndex(players, team_ids)
+    build_s = time.perf_counter() - start
+
+    rng = np.random.default_rng(1)
+    rows = rng.integers(len(players), size=args.queries)
+    positions = players['Poste_simplifie'].astype(str).to_numpy()
+
+    print(f"Joueurs indexés   : {len(players)}")
+    print(f"Construction      : {build_s:.2f} s")
+    for label, options in [
+        ("Toute la ligue", lambda row: {}),
+        ("Même poste", lambda row: {'position': positions[row]}),
+        ("Hors équipe", lambda row: {'exclude_team': True}),
+    ]:
+        timings = np.empty(len(rows))
+        for i, row in enumerate(rows):
+            start = time.perf_counter()
+            index.nearest_rows(row, 10, **options(row))
+            timings[i] = time.perf_counter() - start
+        timings_ms = timings * 1000
+        print(f"{label:<18}: médiane {np.median(timings_ms):.3f} ms, p99 {np.percentile(timings_ms, 99):.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test de charge de l'API JSON (scoutonze.api)
+
+Lance le serveur dans un sous-processus (sauf si --url est donné), puis
+envoie des requêtes en continu sur des connexions HTTP/1.1 persistantes
+et mesure le débit et la latence de chaque route.
+
+Usage : python benchmarks/load_api.py [--seconds 5] [--connections 16] [--url http://127.0.0.1:8000]
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+
+ROUTES = [
+    '/api/players/top?k=10&position=FWD',
+    '/api/players/top?k=20&team=Arsenal',
+    '/api/lineups/best?formation=4-3-3',
+    '/api/lineups/best?formation=4-4-2&team=Liverpool',
+]
+
+
+async def _connection(host, port, path, deadline, latencies, etag=None):
+    """Requêtes successives sur une connexion persistante"""
+    reader, writer = await asyncio.open_connection(host, port)
+    extra = f'If-None-Match: {etag}\r\n' if etag else ''
+    request = f'GET {path} HTTP/1.1\r\nHost: {host}\r\n{extra}\r\n'.encode()
+    try:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            writer.write(request)
+            headers = await reader.readuntil(b'\r\n\r\n')
+            length = 0
+            for line in headers.split(b'\r\n'):
+                if line.lower().startswith(b'content-length:'):
+                    length = int(line.split(b':')[1])
+            if length:
+                await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+async def _load(host, port, path, seconds, connections, etag=None):
+    latencies = []
+    deadline = time.perf_counter() + seconds
+    await asyncio.gather(*[
+        _connection(host, port, path, deadline, latencies, etag) for _ in range(connections)
+    ])
+    return np.array(latencies)
+
+
+def _wait_ready(url, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(url + '/api/version', timeout=1).read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Le serveur {url} ne répond pas")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--connections', type=int, default=16)
+    parser.add_argument('--url', default=None, help="serveur déjà lancé (sinon : lancé ici)")
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if url is None:
+        url = f'http://127.0.0.1:{args.port}'
+        server = subprocess.Popen(
+            [sys.executable, '-m', 'scoutonze.api', '--port', str(args.port)],
+            cwd=ROOT, env=dict(os.environ, PYTHONPATH=str(ROOT)), stdout=subprocess.DEVNULL,
+        )
+    try:
+        _wait_ready(url)
+        parts = urlsplit(url)
+        for path in ROUTES:
+            # Première requête : calcul et mise en cache, et ETag pour le test 304
+            response = urllib.request.urlopen(url + path)
+            response.read()
+            etag = response.headers['ETag']
+
+            for label, header in [('200', None), ('304', etag)]:
+                latencies = asyncio.run(
+                    _load(parts.hostname, parts.port, path, args.seconds, args.connections, header)
+                ) * 1000
+                print(f"{path:<50} {label} : {len(latencies) / args.seconds:7.0f} req/s, "
+                      f"médiane {np.median(latencies):.2f} ms, p99 {np.percentile(latencies, 99):.2f} ms")
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Couche données et calculs
+Modules partagés par l'interface Streamlit
+"""
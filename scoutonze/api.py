@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - API HTTP JSON
+
+Expose la couche de services (`scoutonze.service`) en lecture, avec
+Tornado (asynchrone, déjà installé avec Streamlit).
+
+Chaque réponse est mise en cache par (version des données, chemin,
+paramètres) et porte un ETag dérivé de cette clé : une requête avec
+`If-None-Match` à jour reçoit un 304 sans aucun calcul, et une réponse
+déjà servie est renvoyée telle quelle. Les calculs non encore en cache
+sont faits dans un thread pour ne pas bloquer la boucle d'événements.
+
+Chaque route accepte `league` et `season` (par défaut : championnat par
+défaut, saison la plus récente) ; seule la partition demandée est lue.
+
+Routes :
+  GET /api/partitions
+  GET /api/version
+  GET /api/teams
+  GET /api/teams/<équipe>
+  GET /api/players/top?k=10&position=FWD&team=Arsenal
+  GET /api/players/leaderboard?sort=Buts_90&order=asc&page=2&size=25&position=FWD&team=Arsenal
+  GET /api/lineups/best?formation=4-3-3&team=Arsenal&option=1
+  GET /api/projections/scorers?limit=10
+  GET /api/projections/season
+  GET /api/hidden-gems?c=Score_Forme>6.5&c=pctl:Pct_temps_jeu<40&position=MID&limit=50
+
+Usage : python -m scoutonze.api [--port 8000] [--data-dir données]
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import tornado.ioloop
+import tornado.web
+
+from scoutonze import partitions, service, watcher
+from scoutonze.filters import Criterion
+
+# Réponses gardées en mémoire (toutes versions confondues)
+RESPONSE_CACHE_SIZE = 1024
+
+_CRITERION = re.compile(r'^(?:(pctl):)?(\w+)(>=|<=|>|<)(-?\d+(?:\.\d+)?)$')
+
+
+def to_jsonable(value):
+    """Structures de la couche de services -> types JSON (NaN -> null)"""
+    if isinstance(value, pd.DataFrame):
+        frame = value.reset_index(drop=True)
+        frame = frame.astype({col: str for col in frame.columns if frame[col].dtype.name == 'category'})
+        return [to_jsonable(record) for record in frame.to_dict('records')]
+    if isinstance(value, dict):
+        return {str(key): to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(item) for item in value]
+    if isinstance(value, (np.integer, np.bool_)):
+        return value.item()
+    if isinstance(value, (float, np.floating)):
+        return None if np.isnan(value) else float(value)
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    return value
+
+
+def parse_criteria(values):
+    """["Score_Forme>6.5", "pctl:Pct_temps_jeu<40"] -> [Criterion]"""
+    criteria = []
+    for value in values:
+        match = _CRITERION.match(value)
+        if match is None:
+            raise ValueError(f"Critère invalide : {value} (ex. Score_Forme>6.5 ou pctl:Pct_temps_jeu<40)")
+        mode, column, op, threshold = match.groups()
+        criteria.append(Criterion(column, op, float(threshold), mode or 'abs'))
+    return criteria
+
+
+class ResponseCache:
+    """Corps JSON et ETag par (version, chemin, paramètres), éviction LRU"""
+
+    def __init__(self, size=RESPONSE_CACHE_SIZE):
+        self.size = size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+
+class ServiceHandler(tornado.web.RequestHandler):
+    """Appelle un service, met la réponse en cache et gère ETag / 304"""
+
+    def initialize(self, compute, cache, data_dir):
+        self.compute = compute
+        self.cache = cache
+        self.root = data_dir
+        self.data_dir = None
+
+    def compute_etag(self):
+        # L'ETag est fixé dans get() à partir de la version des données
+        return None
+
+    def arg(self, name, default=None, cast=str):
+        value = self.get_query_argument(name, None)
+        if value is None or value == '':
+            return default
+        try:
+            return cast(value)
+        except ValueError:
+            raise ValueError(f"Paramètre invalide : {name}={value}") from None
+
+    async def get(self, *path_args):
+        try:
+            partition = partitions.resolve(self.arg('league'), self.arg('season'), self.root)
+        except LookupError as e:
+            raise tornado.web.HTTPError(404, reason=str(e))
+        self.data_dir = partitions.open_partition(partition).path
+        # Nouvelles données préparées en arrière-plan, puis publiées (nouvelle version, nouveaux ETag)
+        watcher.start(self.data_dir, on_refresh=None)
+
+        version = service.current_version(self.data_dir)
+        query = tuple(sorted((name, tuple(values)) for name, values in self.request.query_arguments.items()))
+        key = (version, self.request.path, query)
+        etag = '"' + hashlib.sha1(repr(key).encode()).hexdigest()[:20] + '"'
+
+        self.set_header('ETag', etag)
+        self.set_header('Cache-Control', 'no-cache')
+        if etag in self.request.headers.get('If-None-Match', ''):
+            self.set_status(304)
+            return
+
+        body = self.cache.get(key)
+        if body is None:
+            try:
+                result = await tornado.ioloop.IOLoop.current().run_in_executor(
+                    None, partial(self.compute, self, *path_args)
+                )
+            except ValueError as e:
+                raise tornado.web.HTTPError(400, reason=str(e))
+            except LookupError as e:
+                raise tornado.web.HTTPError(404, reason=str(e))
+            body = json.dumps({'version': version, 'data': to_jsonable(result)}, ensure_ascii=False).encode()
+            self.cache.put(key, body)
+
+        self.set_header('Content-Type', 'application/json; charset=UTF-8')
+        self.write(body)
+
+    def write_error(self, status_code, **kwargs):
+        self.set_header('Content-Type', 'application/json; charset=UTF-8')
+        self.finish(json.dumps({'error': self._reason, 'status': status_code}, ensure_ascii=False))
+
+
+# Routes : motif -> fonction (handler, *arguments du chemin) -> résultat du service
+ROUTES = [
+    (r'/api/partitions', lambda h: [
+        {'league': p.league, 'name': partitions.league_name(p.league), 'season': p.season}
+        for p in partitions.discover(h.root)
+    ]),
+    (r'/api/version', lambda h: service.current_version(h.data_dir)),
+    (r'/api/teams', lambda h: service.teams(h.data_dir)),
+    (r'/api/teams/([^/]+)', lambda h, team: service.team_analysis(team, h.data_dir)),
+    (r'/api/players/top', lambda h: service.top_players(
+        h.arg('k', 10, int), h.arg('position'), h.arg('team'), h.data_dir)),
+    (r'/api/players/leaderboard', lambda h: service.leaderboard(
+        h.arg('sort', 'Score_Forme'), h.arg('order', 'desc') == 'asc', h.arg('page', 1, int), h.arg('size', 25, int),
+        h.arg('position'), h.arg('team'), h.data_dir)),
+    (r'/api/lineups/best', lambda h: service.best_xi(
+        h.arg('formation', '4-3-3'), h.arg('team'), h.arg('option', 1, int), h.data_dir)),
+    (r'/api/projections/scorers', lambda h: service.scorer_projections(h.arg('limit', 10, int), h.data_dir)),
+    (r'/api/projections/season', lambda h: service.season_outlook(h.data_dir)),
+    (r'/api/hidden-gems', lambda h: service.hidden_gems(
+        parse_criteria(h.get_query_arguments('c')), h.get_query_arguments('position') or None,
+        h.arg('limit', 50, int), h.data_dir)),
+]
+
+
+def make_app(data_dir=None):
+    """Application Tornado (un cache de réponses par application)"""
+    cache = ResponseCache()
+    return tornado.web.Application([
+        (pattern, ServiceHandler, dict(compute=compute, cache=cache, data_dir=data_dir))
+        for pattern, compute in ROUTES
+    ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API JSON ScoutOnze")
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--address', default='127.0.0.1')
+    parser.add_argument('--data-dir', type=Path, default=None, help="dossier des données")
+    args = parser.parse_args()
+
+    make_app(args.data_dir).listen(args.port, args.address)
+    print(f"✅ API ScoutOnze sur http://{args.address}:{args.port}/api/version")
+    tornado.ioloop.IOLoop.current().start()
+
+
+if __name__ == '__main__':
+    main()
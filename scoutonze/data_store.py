@@ -0,0 +1,415 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Stockage colonne des données
+
+Les CSV de `données/` sont convertis une seule fois en fichiers Arrow (IPC)
+typés, avec les équipes et les postes en colonnes catégorielles. Les fichiers
+convertis sont ensuite lus par memory-map et gardés en mémoire une seule fois
+par processus : toutes les sessions Streamlit partagent les mêmes DataFrames.
+
+Le cache est indexé par l'empreinte (taille, mtime) de chaque CSV : une table
+n'est reconvertie que lorsque le pipeline de calcul dépose un nouveau fichier.
+
+Chaque dossier (une saison d'un championnat, voir `scoutonze.partitions`)
+a son propre cache ; `release()` libère la mémoire d'un dossier inutilisé.
+
+Quand le dossier est surveillé (`scoutonze.watcher`), les sessions ne lisent
+plus les empreintes sur disque mais celles de la dernière version publiée :
+`refresh()` prépare en arrière-plan la nouvelle version (tables, puis objets
+dérivés déjà utilisés), en écartant les tables dont aucune ligne n'a changé,
+et la publie d'un coup.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+DATA_DIR = Path(__file__).resolve().parent.parent / 'données'
+CACHE_DIR_NAME = '.cache'
+
+# Schéma des tables : fichier source, clé d'une ligne, colonnes catégorielles, colonnes dates
+TABLES = {
+    'players': {
+        'file': 'player_form_scores.csv',
+        'key': ['Joueur', 'Equipe_principale'],
+        'categories': ['Equipe_principale', 'Poste_simplifie'],
+    },
+    'top_by_team': {
+        'file': 'top_players_by_team.csv',
+        'key': ['Joueur', 'Equipe_principale'],
+        'categories': ['Equipe_principale', 'Poste_simplifie'],
+    },
+    'scheduled': {
+        'file': 'matches_scheduled.csv',
+        'key': ['match_id'],
+        'categories': ['status', 'home_team_name', 'away_team_name'],
+        'dates': ['datetime'],
+    },
+    'standings': {
+        'file': 'standings.csv',
+        'key': ['team_id'],
+        'categories': ['team_name'],
+    },
+    'recent': {
+        'file': 'matches_recent.csv',
+        'key': ['Date', 'Equipe_Domicile', 'Equipe_Exterieur'],
+        'categories': ['Equipe_Domicile', 'Equipe_Exterieur', 'Statut'],
+        'dates': ['Date'],
+    },
+    # Statistiques brutes par match, entrée de scoutonze.form_pipeline
+    'match_stats': {
+        'file': 'player_match_stats.csv',
+        'key': ['Joueur', 'Equipe', 'Date'],
+        'categories': ['Equipe', 'Poste'],
+        'dates': ['Date'],
+    },
+}
+
+# Tables résidentes : (dossier, table) -> {empreinte: DataFrame}
+_RESIDENT = {}
+_LOCK = threading.Lock()
+
+# Objets dérivés (index, features...) : (dossier, nom) -> {empreintes: objet}
+_DERIVED = {}
+_DERIVED_LOCK = threading.RLock()
+
+# Construction des objets dérivés, pour les préparer lors d'un rechargement : (dossier, nom) -> (builder, tables)
+_BUILDERS = {}
+
+# Dossiers surveillés : (dossier, table) -> empreinte publiée et dernière empreinte vue sur
+# disque, et dossier -> génération
+_PINNED = {}
+_SEEN = {}
+_GENERATION = {}
+_REFRESH_LOCK = threading.Lock()
+
+# Empreintes de la version en préparation (visibles du seul fil qui la prépare),
+# et dossiers en cours de préparation
+_STAGING = threading.local()
+_STAGING_ROOTS = set()
+
+# Lignes ajoutées, supprimées et modifiées d'une table (listes de clés)
+TableChanges = namedtuple('TableChanges', ['added', 'removed', 'updated'])
+
+# Résultat d'un rechargement : génération publiée, {table: TableChanges}, durée de préparation
+Refresh = namedtuple('Refresh', ['generation', 'changes', 'seconds'])
+
+
+def _data_dir(data_dir):
+    return Path(data_dir) if data_dir is not None else DATA_DIR
+
+
+def cache_dir(data_dir=None):
+    """Dossier des fichiers convertis et pré-calculés (créé au besoin)"""
+    path = _data_dir(data_dir) / CACHE_DIR_NAME
+    path.mkdir(exist_ok=True)
+    return path
+
+
+def table_exists(name, data_dir=None):
+    """Vrai si le CSV source de la table est présent"""
+    return (_data_dir(data_dir) / TABLES[name]['file']).exists()
+
+
+def disk_fingerprint(name, data_dir=None):
+    """Empreinte (taille, mtime) du CSV source d'une table, tel qu'il est sur disque"""
+    stat = os.stat(_data_dir(data_dir) / TABLES[name]['file'])
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _staging():
+    return getattr(_STAGING, 'fingerprints', None)
+
+
+def fingerprint(name, data_dir=None):
+    """Empreinte de la version servie d'une table.
+
+    C'est celle du CSV sur disque, sauf quand le dossier est surveillé :
+    c'est alors celle de la dernière version publiée par `refresh()`.
+    """
+    key = (str(_data_dir(data_dir)), name)
+    staged = _staging()
+    if staged is not None and key in staged:
+        return staged[key]
+    pinned = _PINNED.get(key)
+    if pinned is not None:
+        return pinned
+    return disk_fingerprint(name, data_dir)
+
+
+def data_generation(data_dir=None):
+    """Nombre de versions publiées par `refresh()` depuis le démarrage (0 sans surveillance)"""
+    return _GENERATION.get(str(_data_dir(data_dir)), 0)
+
+
+def data_version(names=None, data_dir=None):
+    """Identifiant court des données actuellement sur disque"""
+    names = sorted(names or TABLES)
+    digest = hashlib.sha1()
+    for name in names:
+        digest.update(f"{name}:{fingerprint(name, data_dir)};".encode())
+    return digest.hexdigest()[:12]
+
+
+def _read_csv(name, data_dir):
+    """Lit un CSV source et applique le typage de la table"""
+    spec = TABLES[name]
+    df = pd.read_csv(_data_dir(data_dir) / spec['file'])
+
+    for col in spec.get('categories', []):
+        df[col] = df[col].astype('category')
+    for col in spec.get('dates', []):
+        df[col] = pd.to_datetime(df[col], utc=True)
+
+    return df
+
+
+def _convert(name, data_dir, path):
+    """Convertit un CSV en fichier Arrow (écriture atomique)"""
+    table = pa.Table.from_pandas(_read_csv(name, data_dir), preserve_index=False)
+
+    tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+    with pa.OSFile(str(tmp_path), 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, path)
+
+    # Pendant une préparation, le nettoyage attend la publication (voir `refresh()`)
+    if str(_data_dir(data_dir)) not in _STAGING_ROOTS:
+        _remove_stale(name, data_dir, path)
+
+
+def _arrow_file(name, data_dir, fp):
+    return cache_dir(data_dir) / f'{name}-{fp[0]:x}-{fp[1]:x}.arrow'
+
+
+def _remove_stale(name, data_dir, keep=None):
+    """Supprime les anciennes conversions d'une table, sauf celles encore utilisées.
+
+    Sont gardées : `keep`, la version publiée, les versions résidentes et la
+    version en préparation du fil courant.
+    """
+    key = (str(_data_dir(data_dir)), name)
+    used = set(_RESIDENT.get(key, {})) | {_PINNED.get(key), (_staging() or {}).get(key)}
+    kept = {_arrow_file(name, data_dir, fp) for fp in used if fp is not None} | {keep}
+    for stale in cache_dir(data_dir).glob(f'{name}-*.arrow'):
+        if stale not in kept:
+            stale.unlink(missing_ok=True)
+
+
+def _arrow_path(name, data_dir, fp):
+    path = _arrow_file(name, data_dir, fp)
+    if not path.exists():
+        _convert(name, data_dir, path)
+    return path
+
+
+def arrow_path(name, data_dir=None):
+    """Fichier Arrow de la version servie d'une table (converti au besoin), pour des lectures partielles"""
+    return _arrow_path(name, data_dir, fingerprint(name, data_dir))
+
+
+def _load(name, data_dir, fp):
+    path = _arrow_path(name, data_dir, fp)
+
+    # Lecture par memory-map : les colonnes numériques pointent dans le fichier
+    source = pa.memory_map(str(path), 'r')
+    table = pa.ipc.open_file(source).read_all()
+    return table.to_pandas(split_blocks=True)
+
+
+def load_table(name, data_dir=None):
+    """Retourne la table `name`, partagée entre toutes les sessions.
+
+    Le DataFrame retourné ne doit pas être modifié en place.
+    """
+    key = (str(_data_dir(data_dir)), name)
+    fp = fingerprint(name, data_dir)
+
+    df = _RESIDENT.get(key, {}).get(fp)
+    if df is not None:
+        return df
+
+    with _LOCK:
+        versions = _RESIDENT.get(key, {})
+        if fp not in versions:
+            # Pendant une préparation, la version publiée reste résidente à côté de la nouvelle
+            staging = key[0] in _STAGING_ROOTS
+            _RESIDENT[key] = {**(versions if staging else {}), fp: _load(name, data_dir, fp)}
+            if versions and not staging:
+                # Version remplacée : sa conversion n'est plus utilisée
+                _remove_stale(name, data_dir)
+        return _RESIDENT[key][fp]
+
+
+def derived(name, builder, tables, data_dir=None, refresh=True):
+    """Retourne `builder(*tables)`, calculé une fois par version des données.
+
+    L'objet est partagé entre les sessions et recalculé seulement quand
+    l'un des fichiers des tables `tables` change. Avec `refresh`, il est
+    reconstruit à l'avance lors d'un rechargement du dossier surveillé.
+    """
+    key = (str(_data_dir(data_dir)), name)
+    version = tuple(fingerprint(table, data_dir) for table in tables)
+
+    versions = _DERIVED.get(key, {})
+    if version in versions:
+        return versions[version]
+
+    with _DERIVED_LOCK:
+        versions = _DERIVED.get(key, {})
+        if version not in versions:
+            value = builder(*[load_table(table, data_dir) for table in tables])
+            kept = versions if key[0] in _STAGING_ROOTS else {}
+            _DERIVED[key] = {**kept, version: value}
+            if refresh:
+                _BUILDERS[key] = (builder, tables)
+        return _DERIVED[key][version]
+
+
+def release(data_dir=None):
+    """Libère les tables et objets dérivés d'un dossier (rechargés à la prochaine lecture)"""
+    root = str(_data_dir(data_dir))
+    with _DERIVED_LOCK, _LOCK:
+        for cache in (_RESIDENT, _DERIVED, _BUILDERS):
+            for key in [key for key in cache if key[0] == root]:
+                del cache[key]
+
+
+def digest_rows(rows, previous=None):
+    """Empreinte (hashlib.sha1) du contenu des lignes `rows`, dans leur ordre.
+
+    Avec `previous` (empreinte des lignes qui précèdent, non modifiée), le
+    résultat est celui de toutes les lignes à la suite : une table qui n'a
+    fait que s'allonger se vérifie sans relire ses anciennes lignes.
+    """
+    digest = previous.copy() if previous is not None else hashlib.sha1()
+    digest.update(pd.util.hash_pandas_object(rows, index=False).to_numpy().tobytes())
+    return digest
+
+
+def diff_rows(old, new, key):
+    """Lignes de `new` ajoutées, supprimées ou modifiées par rapport à `old`, par clé"""
+    old_keyed, new_keyed = old.set_index(key), new.set_index(key)
+    if (not old_keyed.index.is_unique or not new_keyed.index.is_unique
+            or list(old_keyed.columns) != list(new_keyed.columns)):
+        # Clé ambiguë ou colonnes différentes : toute la table est remplacée
+        return TableChanges(list(new_keyed.index), list(old_keyed.index), [])
+
+    common = old_keyed.index.intersection(new_keyed.index)
+    before, after = old_keyed.loc[common], new_keyed.loc[common]
+    differs = np.zeros(len(common), dtype=bool)
+    for col in before.columns:
+        x, y = before[col].to_numpy(dtype=object), after[col].to_numpy(dtype=object)
+        differs |= ~((x == y) | (pd.isna(x) & pd.isna(y)))
+
+    return TableChanges(
+        list(new_keyed.index.difference(old_keyed.index)),
+        list(old_keyed.index.difference(new_keyed.index)),
+        list(common[differs]),
+    )
+
+
+def _prune(root):
+    """Ne garde en mémoire que la version publiée des tables et objets dérivés d'un dossier"""
+    for (folder, name), versions in list(_RESIDENT.items()):
+        if folder == root:
+            pinned = _PINNED.get((folder, name))
+            _RESIDENT[(folder, name)] = {fp: df for fp, df in versions.items() if pinned in (None, fp)}
+    for (folder, name), versions in list(_DERIVED.items()):
+        if folder == root and (folder, name) in _BUILDERS:
+            current = tuple(_PINNED.get((folder, table)) for table in _BUILDERS[(folder, name)][1])
+            _DERIVED[(folder, name)] = {version: value for version, value in versions.items() if version == current}
+
+
+def _rekey(root, moved):
+    """Reprend les objets dérivés d'un dossier sous les nouvelles empreintes des tables réécrites à l'identique.
+
+    `moved` : {table: (ancienne empreinte, nouvelle empreinte)}.
+    """
+    for (folder, name), (_, tables) in _BUILDERS.items():
+        if folder != root or not set(tables) & set(moved):
+            continue
+        versions = _DERIVED.get((folder, name), {})
+        renamed = {}
+        for version, value in versions.items():
+            renamed[tuple(
+                moved[table][1] if table in moved and moved[table][0] == fp else fp
+                for table, fp in zip(tables, version)
+            )] = value
+        _DERIVED[(folder, name)] = {**renamed, **versions}
+
+
+def refresh(data_dir=None):
+    """Prépare la version des tables présente sur disque, puis la publie d'un coup.
+
+    Les sessions continuent de lire la version publiée pendant la préparation.
+    Une table réécrite sans qu'aucune ligne change prend la nouvelle empreinte
+    (comme les autres processus, ex. le pré-calcul des compositions) mais
+    garde ses objets dérivés, sans nouvelle génération ; les objets dérivés
+    déjà construits qui dépendent d'une table modifiée sont reconstruits avant
+    la publication.
+
+    Retourne un `Refresh`, ou None si aucune table n'a changé.
+    """
+    root = str(_data_dir(data_dir))
+
+    with _REFRESH_LOCK:
+        start = time.perf_counter()
+        served = {name: fingerprint(name, data_dir) for name in TABLES if table_exists(name, data_dir)}
+        on_disk = {(root, name): disk_fingerprint(name, data_dir) for name in served}
+        if all(_SEEN.get(key) == fp for key, fp in on_disk.items()):
+            return None
+        staged = dict(on_disk)
+
+        changes = {}
+        moved = {}
+        _STAGING.fingerprints = staged
+        _STAGING_ROOTS.add(root)
+        try:
+            for (_, name), fp in staged.items():
+                if fp == served[name]:
+                    continue
+                old = _RESIDENT.get((root, name), {}).get(served[name])
+                if old is None:
+                    # Table pas encore chargée : rien à comparer
+                    changes[name] = None
+                    continue
+                diff = diff_rows(old, load_table(name, data_dir), TABLES[name]['key'])
+                if any(diff):
+                    changes[name] = diff
+                else:
+                    moved[name] = (served[name], fp)
+
+            # Objets dérivés déjà construits (version publiée) qui dépendent d'une table modifiée
+            for (folder, name), (builder, tables) in list(_BUILDERS.items()):
+                built = tuple(served.get(table) for table in tables)
+                if folder == root and set(tables) & set(changes) and built in _DERIVED.get((folder, name), {}):
+                    derived(name, builder, tables, data_dir)
+        finally:
+            del _STAGING.fingerprints
+            _STAGING_ROOTS.discard(root)
+
+        _SEEN.update(on_disk)
+        with _DERIVED_LOCK, _LOCK:
+            # Nouvelle génération seulement si une table a changé de contenu
+            unchanged = {**staged, **{(root, name): old for name, (old, _) in moved.items()}}
+            published = not all(_PINNED.get(key) == fp for key, fp in unchanged.items())
+            _PINNED.update(staged)
+            if published:
+                _GENERATION[root] = _GENERATION.get(root, 0) + 1
+            _rekey(root, moved)
+            _prune(root)
+            for name in served:
+                _remove_stale(name, data_dir)
+
+        if not published:
+            return None
+        return Refresh(_GENERATION[root], changes, time.perf_counter() - start)
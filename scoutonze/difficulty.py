@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Difficulté du calendrier
+
+Chaque équipe reçoit une force entre 0 et 1 qui combine sa place au
+classement, sa différence de buts par match et sa forme récente (points
+sur ses derniers matchs). La difficulté d'un match est la force de
+l'adversaire ramenée sur une échelle de 1 (facile) à 5 (très difficile),
+corrigée de l'avantage du terrain.
+
+Les difficultés sont rangées une fois en matrice équipes x journées, avec
+des sommes cumulées le long des journées : la difficulté moyenne de
+n'importe quelle fenêtre de journées se lit en O(1) par équipe.
+"""
+
+import numpy as np
+import pandas as pd
+
+from scoutonze.data_store import derived
+from scoutonze.history import get_match_history
+
+# Poids des composantes de la force d'une équipe
+STRENGTH_WEIGHTS = {'position': 0.4, 'goal_difference': 0.3, 'form': 0.3}
+
+# Nombre de matchs pris en compte pour la forme récente
+FORM_MATCHES = 5
+
+# Correction de difficulté : plus facile à domicile, plus dure à l'extérieur
+VENUE_ADJUSTMENT = 0.25
+
+MIN_DIFFICULTY, MAX_DIFFICULTY = 1.0, 5.0
+
+
+def short_name(name):
+    """Nom d'équipe sans les mentions FC / AFC"""
+    return ' '.join(word for word in str(name).split() if word not in ('FC', 'AFC'))
+
+
+def _scaled(values):
+    """Valeurs ramenées entre 0 et 1 (0.5 si toutes égales)"""
+    values = np.asarray(values, dtype=float)
+    spread = values.max() - values.min()
+    return (values - values.min()) / spread if spread > 0 else np.full(len(values), 0.5)
+
+
+def team_strengths(standings, history):
+    """Force (0 à 1) et composantes de chaque équipe, indexées par team_id"""
+    team_ids = standings['team_id'].to_numpy()
+    n_teams = len(team_ids)
+    played = standings['played_games'].to_numpy(dtype=float)
+
+    position = (n_teams - standings['position'].to_numpy(dtype=float)) / max(n_teams - 1, 1)
+    goal_difference = _scaled(np.divide(standings['goal_difference'].to_numpy(dtype=float), played,
+                                        out=np.zeros(n_teams), where=played > 0))
+
+    # Points par match sur les derniers matchs (forme de la saison à défaut)
+    form = np.divide(standings['points'].to_numpy(dtype=float), 3 * played,
+                     out=np.zeros(n_teams), where=played > 0)
+    for i, team_id in enumerate(team_ids):
+        last = history.last(int(team_id), FORM_MATCHES)
+        if len(last):
+            form[i] = last['Points'].sum() / (3 * len(last))
+
+    components = pd.DataFrame({'position': position, 'goal_difference': goal_difference, 'form': form},
+                              index=team_ids)
+    strength = sum(weight * components[name] for name, weight in STRENGTH_WEIGHTS.items())
+    return components.assign(strength=strength)
+
+
+class FixtureDifficulty:
+    """Matrice équipes x journées de la difficulté des matchs restants"""
+
+    def __init__(self, standings, scheduled, history):
+        self.strengths = team_strengths(standings, history)
+        self.team_ids = standings['team_id'].to_numpy()
+        self.names = [short_name(name) for name in standings['team_name'].astype(str)]
+        self.matchdays = np.sort(scheduled['matchday'].unique())
+
+        strength = self.strengths['strength']
+        home_id = scheduled['home_team_id'].to_numpy()
+        away_id = scheduled['away_team_id'].to_numpy()
+        name_of = dict(zip(self.team_ids, self.names))
+
+        # Une ligne par (équipe, match) : difficulté = force de l'adversaire (1 à 5)
+        fixtures = pd.DataFrame({
+            'team_id': np.concatenate([home_id, away_id]),
+            'matchday': np.tile(scheduled['matchday'].to_numpy(), 2),
+            'difficulty': np.concatenate([
+                strength.reindex(away_id).to_numpy() - VENUE_ADJUSTMENT / 4,
+                strength.reindex(home_id).to_numpy() + VENUE_ADJUSTMENT / 4,
+            ]) * (MAX_DIFFICULTY - MIN_DIFFICULTY) + MIN_DIFFICULTY,
+            'opponent': [f'{name_of.get(t, t)} (D)' for t in away_id] + [f'{name_of.get(t, t)} (E)' for t in home_id],
+        })
+        fixtures['difficulty'] = fixtures['difficulty'].clip(MIN_DIFFICULTY, MAX_DIFFICULTY)
+
+        rows = pd.Index(self.team_ids).get_indexer(fixtures['team_id'])
+        cols = np.searchsorted(self.matchdays, fixtures['matchday'].to_numpy())
+        known = rows >= 0
+        shape = (len(self.team_ids), len(self.matchdays))
+
+        # Somme et nombre de matchs par case (une journée peut compter 0 ou 2 matchs)
+        totals = np.zeros(shape)
+        counts = np.zeros(shape)
+        np.add.at(totals, (rows[known], cols[known]), fixtures['difficulty'].to_numpy()[known])
+        np.add.at(counts, (rows[known], cols[known]), 1)
+        labels = np.full(shape, '', dtype=object)
+        for row, col, label in zip(rows[known], cols[known], fixtures['opponent'].to_numpy()[known]):
+            labels[row, col] = f'{labels[row, col]} + {label}' if labels[row, col] else label
+
+        with np.errstate(invalid='ignore'):
+            self.values = totals / counts
+        self.opponents = labels
+        self._cum_total = np.concatenate([np.zeros((shape[0], 1)), totals.cumsum(axis=1)], axis=1)
+        self._cum_count = np.concatenate([np.zeros((shape[0], 1)), counts.cumsum(axis=1)], axis=1)
+
+    @property
+    def matrix(self):
+        """DataFrame équipes x journées (NaN sans match)"""
+        return pd.DataFrame(self.values, index=self.names, columns=self.matchdays)
+
+    def window(self, n=5, start=None):
+        """Difficulté moyenne et nombre de matchs sur `n` journées à partir de `start`"""
+        first = 0 if start is None else int(np.searchsorted(self.matchdays, start))
+        last = min(first + n, len(self.matchdays))
+        total = self._cum_total[:, last] - self._cum_total[:, first]
+        count = self._cum_count[:, last] - self._cum_count[:, first]
+        with np.errstate(invalid='ignore'):
+            mean = total / count
+        return pd.DataFrame({'Difficulte_moyenne': mean, 'Matchs': count.astype(int)},
+                            index=pd.Index(self.team_ids, name='team_id'))
+
+    def easiest(self, n=5, start=None):
+        """Équipes classées du calendrier le plus facile au plus difficile sur `n` journées"""
+        first = 0 if start is None else int(np.searchsorted(self.matchdays, start))
+        window = self.window(n, start).assign(
+            Equipe=self.names,
+            Adversaires=[' · '.join(label for label in row if label) for row in self.opponents[:, first:first + n]],
+        )
+        return window.sort_values(['Difficulte_moyenne', 'Matchs'], ascending=[True, False])[
+            ['Equipe', 'Matchs', 'Difficulte_moyenne', 'Adversaires']
+        ]
+
+
+def get_fixture_difficulty(data_dir=None):
+    """Difficulté du calendrier, calculée une fois par version des données"""
+    return derived(
+        'difficulty',
+        lambda standings, scheduled, recent: FixtureDifficulty(standings, scheduled, get_match_history(data_dir)),
+        ['standings', 'scheduled', 'recent'],
+        data_dir,
+    )
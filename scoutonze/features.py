@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Variables dérivées des joueurs
+
+Les colonnes dérivées (part du temps de jeu, buts et passes par match et
+par 90 minutes, percentiles au poste) sont calculées une seule fois au
+chargement, de façon vectorisée, dans un DataFrame de features partagé
+entre les sessions. Ses colonnes sont en lecture seule : les pages le
+lisent sans le copier ni le modifier.
+"""
+
+import numpy as np
+import pandas as pd
+
+from scoutonze.data_store import derived
+
+# Colonnes dont on calcule le percentile au sein de chaque poste (Pctl_<colonne>)
+PERCENTILE_COLUMNS = ['Score_Forme', 'Pct_temps_jeu', 'Buts_par_match', 'Passes_par_match']
+
+
+def _ratio(numerator, denominator, scale=1.0):
+    """numerator / denominator * scale, 0 quand le dénominateur est nul"""
+    numerator = np.asarray(numerator, dtype=float)
+    denominator = np.asarray(denominator, dtype=float)
+    out = np.zeros_like(numerator)
+    np.divide(numerator * scale, denominator, out=out, where=denominator > 0)
+    return out
+
+
+def _read_only(values):
+    if isinstance(values, np.ndarray):
+        values.flags.writeable = False
+    return values
+
+
+def build_features(players):
+    """DataFrame des joueurs + colonnes dérivées, en lecture seule"""
+    matchs = players['Matchs'].to_numpy()
+    minutes = players['Minutes'].to_numpy()
+    buts = players['Buts'].to_numpy()
+    passes = players['Passes_decisives'].to_numpy()
+
+    derived_columns = {
+        # Part des minutes jouées sur les matchs disputés (%)
+        'Pct_temps_jeu': _ratio(minutes, matchs * 90, 100).round(1),
+        'Buts_par_match': _ratio(buts, matchs),
+        'Passes_par_match': _ratio(passes, matchs),
+        'Buts_90': _ratio(buts, minutes, 90),
+        'Passes_90': _ratio(passes, minutes, 90),
+    }
+
+    positions = players['Poste_simplifie']
+    for col in PERCENTILE_COLUMNS:
+        values = derived_columns[col] if col in derived_columns else players[col].to_numpy()
+        derived_columns[f'Pctl_{col}'] = (
+            pd.Series(values, index=players.index)
+            .groupby(positions, observed=True)
+            .rank(pct=True)
+            .mul(100)
+            .to_numpy()
+        )
+
+    # Un bloc par colonne (copy=False) : aucune copie des colonnes d'origine
+    columns = {col: players[col].array for col in players.columns}
+    columns.update({col: _read_only(values) for col, values in derived_columns.items()})
+    return pd.DataFrame(columns, index=players.index, copy=False)
+
+
+def get_features(data_dir=None):
+    """Features des joueurs, partagées entre les sessions"""
+    return derived('features', build_features, ['players'], data_dir)
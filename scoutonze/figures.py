@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Cache des figures Plotly
+
+Une figure est construite et sérialisée en JSON une seule fois par
+(partition, version des données, page, figure, paramètres) : les
+exécutions suivantes (un autre widget a changé, une autre session ouvre la
+page) envoient directement le JSON mémorisé au navigateur, sans
+reconstruire ni revalider la figure. Le cache est partagé entre les
+sessions et limité en octets (éviction LRU).
+
+Les nuages de points sur de grands ensembles de joueurs passent en WebGL
+(Scattergl) et sont réduits côté serveur à un point par case d'une grille,
+pour que la taille envoyée au navigateur reste bornée.
+
+L'envoi du JSON déjà prêt passe par une API interne de Streamlit, vérifiée
+avec la version de requirements.txt (1.31) ; si elle n'est pas disponible,
+la figure est affichée par `st.plotly_chart` à partir du JSON mémorisé.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import plotly.io
+import streamlit as st
+
+try:
+    from streamlit.proto.PlotlyChart_pb2 import PlotlyChart as PlotlyChartProto
+except ImportError:
+    PlotlyChartProto = None
+
+from scoutonze.data_store import TABLES, data_version, table_exists
+
+# Taille maximale du cache (JSON des figures, toutes sessions confondues)
+MAX_BYTES = 64 * 1024 * 1024
+
+# Nombre de points au-delà duquel un nuage est rendu en WebGL
+WEBGL_POINTS = 1000
+
+# Points affichés au plus par nuage (au-delà : un point par case de la grille)
+MAX_POINTS = 2000
+
+_CONFIG = json.dumps({'showLink': False, 'linkText': False})
+
+
+class FigureCache:
+    """JSON des figures par clé, éviction LRU au-delà de `max_bytes`"""
+
+    def __init__(self, max_bytes=MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            spec = self._entries.get(key)
+            if spec is not None:
+                self._entries.move_to_end(key)
+            return spec
+
+    def put(self, key, spec):
+        with self._lock:
+            if key in self._entries:
+                self.size -= len(self._entries.pop(key))
+            self._entries[key] = spec
+            self.size += len(spec)
+            while self.size > self.max_bytes and len(self._entries) > 1:
+                self.size -= len(self._entries.popitem(last=False)[1])
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+_CACHE = FigureCache()
+
+
+def figure_json(page, name, params, build, data_dir=None):
+    """JSON de la figure `build()`, mémorisé par (dossier, version des données, page, figure, paramètres).
+
+    `params` (hashable) doit contenir tout ce dont dépend la figure en dehors
+    des données de la partition.
+    """
+    version = data_version([table for table in TABLES if table_exists(table, data_dir)], data_dir)
+    key = (str(data_dir), version, page, name, params)
+    spec = _CACHE.get(key)
+    if spec is None:
+        spec = plotly.io.to_json(build(), validate=False)
+        _CACHE.put(key, spec)
+    return spec
+
+
+def plotly_chart(spec, use_container_width=True):
+    """Affiche une figure déjà sérialisée (comme st.plotly_chart, sans reconstruction)"""
+    # Pas d'API publique pour un JSON déjà prêt : même message que st.plotly_chart,
+    # dans le conteneur actif (colonne, barre latérale...)
+    if PlotlyChartProto is not None and hasattr(getattr(st, '_main', None), '_enqueue'):
+        proto = PlotlyChartProto()
+        proto.use_container_width = use_container_width
+        proto.figure.spec = spec
+        proto.figure.config = _CONFIG
+        proto.theme = 'streamlit'
+        try:
+            return st._main._enqueue('plotly_chart', proto)
+        except (AttributeError, TypeError, ValueError):
+            # API interne modifiée : affichage standard ci-dessous
+            pass
+    return st.plotly_chart(json.loads(spec), use_container_width=use_container_width)
+
+
+def chart(page, name, params, build, data_dir=None, use_container_width=True):
+    """Affiche la figure `build()`, construite une fois par version des données et paramètres"""
+    return plotly_chart(figure_json(page, name, params, build, data_dir), use_container_width)
+
+
+def cache_info():
+    """(figures en cache, octets)"""
+    return len(_CACHE), _CACHE.size
+
+
+def render_mode(n_points):
+    """Rendu Plotly d'un nuage de `n_points` points : SVG, ou WebGL (Scattergl) pour les grands nuages"""
+    return 'webgl' if n_points > WEBGL_POINTS else 'svg'
+
+
+def downsample(df, x, y, by=None, max_points=MAX_POINTS):
+    """Au plus `max_points` lignes de `df` : la première ligne de chaque case d'une grille sur (x, y).
+
+    La grille est découpée séparément pour chaque groupe `by` (couleur du
+    nuage). La colonne `Points` donne le nombre de lignes représentées par
+    chaque point. `df` doit être trié par intérêt décroissant.
+    """
+    if len(df) <= max_points:
+        return df.assign(Points=1)
+
+    groups = df[by].astype(str).to_numpy() if by is not None else np.zeros(len(df), dtype=int)
+    n_groups = len(np.unique(groups))
+    bins = max(int(np.sqrt(max_points / n_groups)), 1)
+
+    cells = [groups]
+    for col in (x, y):
+        values = df[col].to_numpy(dtype=float)
+        low, high = np.nanmin(values), np.nanmax(values)
+        scaled = (values - low) / (high - low) if high > low else np.zeros(len(values))
+        cells.append(np.minimum((np.nan_to_num(scaled) * bins).astype(np.int64), bins - 1))
+
+    keys = df.assign(_group=cells[0], _x=cells[1], _y=cells[2]).groupby(['_group', '_x', '_y'], sort=False)
+    first = keys.cumcount().to_numpy() == 0
+    counts = keys['_x'].transform('size').to_numpy()
+    return df[first].assign(Points=counts[first])
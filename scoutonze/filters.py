@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Moteur de filtres multi-critères
+
+Les colonnes numériques des features (valeurs absolues et percentiles au
+poste `Pctl_<colonne>`) sont rangées une fois dans une matrice colonnes x
+joueurs. Une liste de critères est compilée en une seule expression
+vectorisée : toutes les comparaisons sont évaluées d'un coup sur les lignes
+de la matrice concernées, puis combinées en un masque.
+
+Les résultats sont mémorisés par tuple de critères : revenir sur un réglage
+déjà vu (glissement d'un curseur) ne refait pas le parcours.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+from scoutonze.data_store import derived
+from scoutonze.features import PERCENTILE_COLUMNS, get_features
+
+# Un critère : colonne, opérateur ('>', '>=', '<', '<='), seuil, et mode :
+# 'abs' (valeur de la colonne) ou 'pctl' (percentile du joueur à son poste, 0-100)
+Criterion = namedtuple('Criterion', ['column', 'op', 'value', 'mode'], defaults=['abs'])
+
+OPERATORS = {'>': (1, True), '>=': (1, False), '<': (-1, True), '<=': (-1, False)}
+
+# Nombre de combinaisons de critères mémorisées
+CACHE_SIZE = 256
+
+
+def percentile_column(column):
+    """Colonne des percentiles au poste d'une colonne"""
+    return f'Pctl_{column}'
+
+
+class FilterEngine:
+    """Filtres sur les colonnes numériques d'un DataFrame de joueurs"""
+
+    def __init__(self, players, sort_col='Score_Forme'):
+        self.players = players
+        numeric = [col for col in players.columns if players[col].dtype.kind in 'iuf']
+        self.columns = {col: i for i, col in enumerate(numeric)}
+        self.values = np.vstack([players[col].to_numpy(dtype=float) for col in numeric])
+        self.positions = players['Poste_simplifie'].astype(str).to_numpy()
+        self.order = np.argsort(-players[sort_col].to_numpy(dtype=float), kind='stable')
+        self.select = lru_cache(maxsize=CACHE_SIZE)(self._select)
+
+    def _row(self, criterion):
+        column = criterion.column
+        if criterion.mode == 'pctl':
+            if column not in PERCENTILE_COLUMNS:
+                raise ValueError(f"Pas de percentile au poste pour la colonne {column}")
+            column = percentile_column(column)
+        if column not in self.columns:
+            raise KeyError(column)
+        return self.columns[column]
+
+    def mask(self, criteria, positions=None):
+        """Masque booléen des joueurs qui vérifient tous les critères"""
+        criteria = list(criteria)
+        if criteria:
+            rows = np.array([self._row(criterion) for criterion in criteria])
+            signs, strict = np.array([OPERATORS[criterion.op] for criterion in criteria]).T
+            bounds = signs * np.array([criterion.value for criterion in criteria], dtype=float)
+
+            # x < v <=> -x > -v : toutes les comparaisons deviennent des « > » ou « >= »
+            signed = self.values[rows] * signs[:, None]
+            passed = np.where(strict[:, None].astype(bool), signed > bounds[:, None], signed >= bounds[:, None])
+            mask = passed.all(axis=0)
+        else:
+            mask = np.ones(len(self.players), dtype=bool)
+
+        # Aucun poste sélectionné (tuple vide) : aucun joueur ; None : pas de filtre
+        if positions is not None:
+            mask &= np.isin(self.positions, list(positions))
+        return mask
+
+    def _select(self, criteria, positions=None):
+        rows = self.order[self.mask(criteria, positions)[self.order]]
+        rows.flags.writeable = False
+        return rows
+
+    def query(self, criteria, positions=None):
+        """Joueurs qui vérifient les critères, triés par score décroissant (mémorisé)"""
+        positions = tuple(sorted(positions)) if positions is not None else None
+        return self.players.iloc[self.select(tuple(criteria), positions)]
+
+
+def describe(criterion):
+    """Libellé lisible d'un critère"""
+    if criterion.mode == 'pctl':
+        return f"{criterion.column} {criterion.op} {criterion.value:g}e percentile du poste"
+    return f"{criterion.column} {criterion.op} {criterion.value:g}"
+
+
+def get_filter_engine(data_dir=None):
+    """Moteur de filtres sur les features, partagé entre les sessions"""
+    return derived('filters', lambda players: FilterEngine(get_features(data_dir)), ['players'], data_dir)
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Calcul des scores de forme
+
+Produit `player_form_scores.csv` et `top_players_by_team.csv` à partir des
+statistiques brutes par match (`données/player_match_stats.csv`, une ligne
+par joueur et par match : Joueur, Equipe, Poste, Date, Minutes, Buts,
+Passes_decisives).
+
+- Note d'un match (0 à 10) : 6 points pour 90 minutes jouées (au prorata),
+  plus les buts et passes décisives pondérés selon le poste.
+- `Score_Forme` : moyenne des notes sur les 6 derniers matchs de l'équipe
+  actuelle du joueur, pondérée vers les plus récents ; un match sans jouer
+  compte 0.
+- `Matchs_6_derniers` : matchs joués parmi ces 6 derniers matchs.
+- Top par équipe : les 5 meilleurs scores de chaque `Equipe_principale`.
+
+Les fenêtres sont calculées pour tous les joueurs à la fois (grille
+joueurs x 6 derniers matchs). Quand le fichier brut n'a fait que s'allonger
+depuis le dernier calcul, seuls les joueurs des équipes qui ont joué depuis
+sont recalculés : les autres lignes de la sortie sont reprises telles quelles.
+
+Usage : python -m scoutonze.form_pipeline [--full] [--data-dir données]
+"""
+
+import argparse
+import json
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from scoutonze.data_store import DATA_DIR, TABLES, cache_dir, digest_rows, load_table
+
+# Matchs de l'équipe pris en compte pour la forme, et pondération (le plus récent d'abord)
+FORM_WINDOW = 6
+RECENCY_DECAY = 0.85
+
+# Points d'un match complet, puis par but (selon le poste) et par passe décisive
+MINUTES_POINTS = 6.0
+GOAL_POINTS = {'GK': 3.0, 'DEF': 2.5, 'MID': 2.0, 'FWD': 1.5}
+ASSIST_POINTS = 1.5
+MAX_RATING = 10.0
+
+# Joueurs retenus par équipe dans top_players_by_team.csv
+TOP_PER_TEAM = 5
+
+OUTPUT_COLUMNS = ['Joueur', 'Equipe_principale', 'Poste_simplifie', 'Score_Forme', 'Matchs', 'Minutes',
+                  'Buts', 'Passes_decisives', 'Matchs_6_derniers']
+
+STATE_FILE = 'form_pipeline.json'
+
+
+def match_ratings(stats):
+    """Note (0 à 10) de chaque ligne joueur x match"""
+    minutes = stats['Minutes'].to_numpy(dtype=float)
+    goal_points = stats['Poste'].astype(str).map(GOAL_POINTS).fillna(GOAL_POINTS['MID']).to_numpy()
+    ratings = (
+        MINUTES_POINTS * np.minimum(minutes, 90) / 90
+        + stats['Buts'].to_numpy(dtype=float) * goal_points
+        + stats['Passes_decisives'].to_numpy(dtype=float) * ASSIST_POINTS
+    )
+    return np.clip(np.where(minutes > 0, ratings, 0.0), 0, MAX_RATING)
+
+
+def compute_form(stats, players=None):
+    """Une ligne par joueur (colonnes de `player_form_scores.csv`).
+
+    `players` restreint le calcul à ces joueurs ; les matchs de leurs équipes
+    sont lus dans tout `stats`.
+    """
+    played = stats[stats['Minutes'] > 0]
+    team_matches = stats[['Equipe', 'Date']].drop_duplicates()
+    if players is not None:
+        played = played[played['Joueur'].isin(players)]
+    if played.empty:
+        return pd.DataFrame(columns=OUTPUT_COLUMNS)
+
+    played = played.assign(Note=match_ratings(played)).sort_values(['Joueur', 'Date'], kind='stable')
+    by_player = played.groupby('Joueur', sort=True)
+
+    # Équipe et poste actuels : ceux du dernier match joué
+    latest = by_player.tail(1).set_index('Joueur')
+    current_team = latest['Equipe'].astype(str)
+
+    # Clubs du joueur, le plus récent d'abord ("Arsenal,Crystal Palace")
+    clubs = (
+        played.assign(Equipe=played['Equipe'].astype(str))
+        .groupby(['Joueur', 'Equipe'], sort=False)['Date'].max()
+        .reset_index()
+        .sort_values(['Joueur', 'Date'], ascending=[True, False], kind='stable')
+        .groupby('Joueur', sort=True)['Equipe'].agg(','.join)
+    )
+
+    # Derniers matchs de chaque équipe : rang 0 = le plus récent
+    team_matches = team_matches.assign(
+        Equipe=team_matches['Equipe'].astype(str),
+        Rang=team_matches.groupby('Equipe', observed=True)['Date'].rank(method='dense', ascending=False)
+        .astype(int) - 1,
+    )
+    window = team_matches[team_matches['Rang'] < FORM_WINDOW]
+
+    # Grille joueurs x FORM_WINDOW : note du joueur à chaque match récent de son équipe (0 s'il n'a pas joué)
+    names = current_team.index.to_numpy()
+    slots = current_team.rename('Equipe').reset_index().merge(window, on='Equipe')
+    notes = slots.merge(
+        played.assign(Equipe=played['Equipe'].astype(str))[['Joueur', 'Equipe', 'Date', 'Note']],
+        on=['Joueur', 'Equipe', 'Date'], how='left',
+    )
+    grid = np.zeros((len(names), FORM_WINDOW))
+    appeared = np.zeros((len(names), FORM_WINDOW), dtype=bool)
+    rows = pd.Index(names).get_indexer(notes['Joueur'])
+    grid[rows, notes['Rang'].to_numpy()] = notes['Note'].fillna(0).to_numpy()
+    appeared[rows, notes['Rang'].to_numpy()] = notes['Note'].notna().to_numpy()
+
+    # Une équipe ayant joué moins de FORM_WINDOW matchs n'a pas de poids pour les cases vides
+    n_team_matches = current_team.map(window.groupby('Equipe')['Rang'].size()).fillna(0).to_numpy()
+    weights = RECENCY_DECAY ** np.arange(FORM_WINDOW) * (np.arange(FORM_WINDOW) < n_team_matches[:, None])
+    score = np.divide((grid * weights).sum(axis=1), weights.sum(axis=1),
+                      out=np.zeros(len(names)), where=weights.sum(axis=1) > 0)
+
+    totals = by_player[['Minutes', 'Buts', 'Passes_decisives']].sum().reindex(names)
+    return pd.DataFrame({
+        'Joueur': names,
+        'Equipe_principale': clubs.reindex(names).to_numpy(),
+        'Poste_simplifie': latest['Poste'].astype(str).to_numpy(),
+        'Score_Forme': score.round(2),
+        'Matchs': by_player.size().reindex(names).to_numpy(),
+        'Minutes': totals['Minutes'].to_numpy().astype(int),
+        'Buts': totals['Buts'].to_numpy().astype(int),
+        'Passes_decisives': totals['Passes_decisives'].to_numpy().astype(int),
+        'Matchs_6_derniers': appeared.sum(axis=1),
+    })
+
+
+def top_by_team(scores, per_team=TOP_PER_TEAM):
+    """Les `per_team` meilleurs joueurs de chaque Equipe_principale, équipes par meilleur score"""
+    ranked = scores.sort_values('Score_Forme', ascending=False, kind='stable')
+    top = ranked.groupby('Equipe_principale', sort=False).head(per_team)
+    team_order = top.groupby('Equipe_principale', sort=False)['Score_Forme'].transform('max')
+    return top.assign(_best=team_order).sort_values('_best', ascending=False, kind='stable').drop(columns='_best')
+
+
+def _write_csv(df, path):
+    """Écriture atomique (l'application ne lit jamais un fichier à moitié écrit)"""
+    tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+    df.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def _state_path(data_dir):
+    return cache_dir(data_dir) / STATE_FILE
+
+
+def _read_state(data_dir):
+    try:
+        return json.loads(_state_path(data_dir).read_text())
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _digest(stats, n_rows):
+    """Empreinte du contenu des `n_rows` premières lignes (sensible à leur ordre)"""
+    return digest_rows(stats.iloc[:n_rows]).hexdigest()
+
+
+def run(data_dir=None, full=False):
+    """Met à jour les fichiers de sortie. Retourne (joueurs recalculés, total joueurs)."""
+    stats = load_table('match_stats', data_dir)
+    data_path = Path(data_dir) if data_dir else DATA_DIR
+    scores_path = data_path / TABLES['players']['file']
+    top_path = data_path / TABLES['top_by_team']['file']
+
+    # Incrémental si le fichier brut n'a fait que s'allonger depuis le dernier calcul
+    state = None if full else _read_state(data_dir)
+    incremental = (
+        state is not None
+        and scores_path.exists()
+        and len(stats) >= state['rows'] > 0
+        and _digest(stats, state['rows']) == state.get('digest')
+    )
+
+    if incremental:
+        new_rows = stats.iloc[state['rows']:]
+        teams = set(new_rows['Equipe'].astype(str))
+        previous = pd.read_csv(scores_path)
+        # Joueurs des équipes qui ont joué (leur fenêtre a glissé) et joueurs des nouvelles lignes
+        current_team = previous['Equipe_principale'].astype(str).str.split(',').str[0]
+        affected = set(previous.loc[current_team.isin(teams), 'Joueur']) | set(new_rows['Joueur'].astype(str))
+        kept = previous[~previous['Joueur'].isin(affected)]
+        scores = pd.concat([kept, compute_form(stats, affected)], ignore_index=True) if affected else kept
+    else:
+        affected = None
+        scores = compute_form(stats)
+
+    # Joueurs actifs : au moins un match joué parmi les derniers matchs de leur équipe
+    scores = scores[scores['Matchs_6_derniers'] > 0]
+    scores = scores.sort_values(['Score_Forme', 'Joueur'], ascending=[False, True], kind='stable')[OUTPUT_COLUMNS]
+
+    _write_csv(scores, scores_path)
+    _write_csv(top_by_team(scores), top_path)
+    if len(stats):
+        _state_path(data_dir).write_text(json.dumps({'rows': len(stats), 'digest': _digest(stats, len(stats))}))
+
+    return (len(scores) if affected is None else len(affected)), len(scores)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calcul des scores de forme ScoutOnze")
+    parser.add_argument('--full', action='store_true', help="tout recalculer (sinon : incrémental si possible)")
+    parser.add_argument('--data-dir', type=Path, default=None, help="dossier des données")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    recomputed, total = run(args.data_dir, args.full)
+    print(f"✅ {recomputed} joueurs recalculés sur {total} en {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == '__main__':
+    main()
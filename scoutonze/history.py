@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Historique des matchs par équipe
+
+Les résultats de `matches_recent.csv` sont rangés en tableaux NumPy (une
+ligne par match, équipes en `team_id` entiers). Pour chaque équipe et chaque
+confrontation, un index trie les numéros de match par date : « les N
+derniers matchs de X » ou « les confrontations X - Y avant telle date »
+sont une recherche dichotomique suivie d'une tranche.
+
+Quand de nouveaux résultats sont ajoutés à la fin du fichier, seules les
+nouvelles lignes sont insérées dans les index existants.
+"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+from scoutonze.data_store import digest_rows, fingerprint, load_table
+from scoutonze.teams import match_team_name
+
+# Points d'un match gagné / nul / perdu, et lettre du résultat
+RESULTS = {3: 'V', 1: 'N', 0: 'D'}
+
+_EMPTY = np.empty(0, dtype=np.int64)
+
+
+class MatchHistory:
+    """Résultats indexés par équipe et par confrontation, triés par date"""
+
+    def __init__(self, standings):
+        self.names = dict(zip(standings['team_id'].astype(int), standings['team_name'].astype(str)))
+        self._ids = {name: team_id for team_id, name in self.names.items()}
+
+        self.date = np.empty(0, dtype='datetime64[ns]')
+        self.home = _EMPTY
+        self.away = _EMPTY
+        self.home_goals = np.empty(0, dtype=np.int16)
+        self.away_goals = np.empty(0, dtype=np.int16)
+
+        # team_id -> numéros de match triés par date ; idem par paire (petit id, grand id)
+        self.by_team = {}
+        self.by_pair = {}
+        self.source_rows = 0
+        # Empreinte des lignes sources déjà lues (data_store.digest_rows)
+        self._source_digest = digest_rows(pd.DataFrame())
+
+    def team_id(self, team):
+        """Identifiant d'une équipe à partir de son id, nom officiel ou nom court"""
+        if isinstance(team, (int, np.integer)):
+            return int(team)
+        name = str(team).strip()
+        if name not in self._ids:
+            name = match_team_name(name, self._ids)
+        return self._ids.get(name)
+
+    def _team_ids(self, names):
+        """team_id de chaque nom ; les équipes inconnues reçoivent un id négatif"""
+        ids = np.empty(len(names), dtype=np.int64)
+        for i, name in enumerate(names):
+            if name not in self._ids:
+                team_id = min(min(self.names, default=0), 0) - 1
+                self.names[team_id] = name
+                self._ids[name] = team_id
+            ids[i] = self._ids[name]
+        return ids
+
+    def _insert(self, index, key, rows):
+        """Insère `rows` (triés par date) dans l'entrée `key` d'un index"""
+        current = index.get(key, _EMPTY)
+        positions = np.searchsorted(self.date[current], self.date[rows], side='right')
+        index[key] = np.insert(current, positions, rows)
+
+    def _add(self, results):
+        finished = results[results['Statut'].astype(str) == 'FINISHED']
+        first = len(self.date)
+
+        self.date = np.concatenate([self.date, finished['Date'].dt.tz_localize(None).to_numpy('datetime64[ns]')])
+        self.home = np.concatenate([self.home, self._team_ids(finished['Equipe_Domicile'].astype(str).tolist())])
+        self.away = np.concatenate([self.away, self._team_ids(finished['Equipe_Exterieur'].astype(str).tolist())])
+        self.home_goals = np.concatenate([self.home_goals, finished['Score_Domicile'].to_numpy(dtype=np.int16)])
+        self.away_goals = np.concatenate([self.away_goals, finished['Score_Exterieur'].to_numpy(dtype=np.int16)])
+
+        new_rows = first + np.argsort(self.date[first:], kind='stable')
+        teams = np.concatenate([self.home[new_rows], self.away[new_rows]])
+        rows = np.concatenate([new_rows, new_rows])
+        for team_id in np.unique(teams):
+            team_rows = rows[teams == team_id]
+            self._insert(self.by_team, int(team_id), team_rows[np.argsort(self.date[team_rows], kind='stable')])
+
+        low = np.minimum(self.home[new_rows], self.away[new_rows])
+        high = np.maximum(self.home[new_rows], self.away[new_rows])
+        for pair in set(zip(low.tolist(), high.tolist())):
+            self._insert(self.by_pair, pair, new_rows[(low == pair[0]) & (high == pair[1])])
+
+        self.source_rows += len(results)
+        self._source_digest = digest_rows(results, self._source_digest)
+
+    def extends(self, recent):
+        """Vrai si `recent` reprend à l'identique les lignes déjà lues et en ajoute de nouvelles"""
+        return (
+            len(recent) > self.source_rows > 0
+            and digest_rows(recent.iloc[:self.source_rows]).digest() == self._source_digest.digest()
+        )
+
+    def append(self, results):
+        """Nouvel historique avec les résultats `results` en plus (l'original est inchangé)"""
+        history = MatchHistory.__new__(MatchHistory)
+        history.__dict__.update(self.__dict__)
+        history.names = dict(self.names)
+        history._ids = dict(self._ids)
+        history.by_team = dict(self.by_team)
+        history.by_pair = dict(self.by_pair)
+        history._add(results)
+        return history
+
+    def _slice(self, rows, n=None, before=None):
+        """Les `n` derniers matchs de `rows`, joués strictement avant `before`"""
+        end = len(rows)
+        if before is not None:
+            end = np.searchsorted(self.date[rows], np.datetime64(pd.Timestamp(before).tz_localize(None), 'ns'))
+        start = 0 if n is None else max(end - n, 0)
+        return rows[start:end]
+
+    def last_rows(self, team, n=5, before=None):
+        """Numéros des `n` derniers matchs d'une équipe (du plus ancien au plus récent)"""
+        return self._slice(self.by_team.get(self.team_id(team), _EMPTY), n, before)
+
+    def head_to_head_rows(self, team_a, team_b, n=None, before=None):
+        """Numéros des confrontations entre deux équipes (du plus ancien au plus récent)"""
+        a, b = self.team_id(team_a), self.team_id(team_b)
+        if a is None or b is None:
+            return _EMPTY
+        return self._slice(self.by_pair.get((min(a, b), max(a, b)), _EMPTY), n, before)
+
+    def matches(self, rows):
+        """DataFrame des matchs `rows`, au format de `matches_recent.csv`"""
+        return pd.DataFrame({
+            'Date': self.date[rows],
+            'Equipe_Domicile': [self.names[t] for t in self.home[rows]],
+            'Equipe_Exterieur': [self.names[t] for t in self.away[rows]],
+            'Score_Domicile': self.home_goals[rows],
+            'Score_Exterieur': self.away_goals[rows],
+        })
+
+    def last(self, team, n=5, before=None):
+        """Derniers matchs d'une équipe, de son point de vue"""
+        team_id = self.team_id(team)
+        rows = self.last_rows(team_id, n, before)
+        at_home = self.home[rows] == team_id
+        scored = np.where(at_home, self.home_goals[rows], self.away_goals[rows])
+        conceded = np.where(at_home, self.away_goals[rows], self.home_goals[rows])
+        points = np.where(scored > conceded, 3, np.where(scored == conceded, 1, 0))
+        return pd.DataFrame({
+            'Date': self.date[rows],
+            'Adversaire': [self.names[t] for t in np.where(at_home, self.away[rows], self.home[rows])],
+            'Domicile': at_home,
+            'Buts_pour': scored,
+            'Buts_contre': conceded,
+            'Resultat': [RESULTS[p] for p in points],
+            'Points': points,
+        })
+
+    def head_to_head(self, team_a, team_b, n=None, before=None):
+        """Confrontations entre deux équipes"""
+        return self.matches(self.head_to_head_rows(team_a, team_b, n, before))
+
+    def form(self, team, n=5, before=None):
+        """Suite des résultats (ex. "VVNDV", du plus ancien au plus récent) et points"""
+        last = self.last(team, n, before)
+        return ''.join(last['Resultat']), int(last['Points'].sum())
+
+
+def build_history(recent, standings):
+    """Historique complet à partir de la table des résultats"""
+    history = MatchHistory(standings)
+    history._add(recent)
+    return history
+
+
+# Historiques partagés : dossier -> {empreintes: MatchHistory}
+_HISTORIES = {}
+_LOCK = threading.Lock()
+
+# Versions gardées par dossier (la version publiée et celle en préparation, voir data_store.refresh)
+MAX_VERSIONS = 2
+
+
+def get_match_history(data_dir=None):
+    """Historique des matchs, partagé entre les sessions.
+
+    Si seuls des résultats ont été ajoutés à la fin de `matches_recent.csv`,
+    ils sont insérés dans l'historique existant au lieu de tout reconstruire.
+    """
+    key = str(data_dir)
+    version = (fingerprint('recent', data_dir), fingerprint('standings', data_dir))
+
+    history = _HISTORIES.get(key, {}).get(version)
+    if history is not None:
+        return history
+
+    with _LOCK:
+        versions = _HISTORIES.get(key, {})
+        if version not in versions:
+            recent = load_table('recent', data_dir)
+            previous = next(
+                (h for v, h in reversed(versions.items()) if v[1] == version[1] and h.extends(recent)), None
+            )
+            if previous is not None:
+                history = previous.append(recent.iloc[previous.source_rows:])
+            else:
+                history = build_history(recent, load_table('standings', data_dir))
+            kept = list(versions.items())[-(MAX_VERSIONS - 1):]
+            _HISTORIES[key] = dict(kept + [(version, history)])
+        return _HISTORIES[key][version]
+
+
+def release(data_dir=None):
+    """Libère les historiques d'un dossier"""
+    with _LOCK:
+        _HISTORIES.pop(str(data_dir), None)
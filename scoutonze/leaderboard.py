@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Classement paginé des joueurs
+
+Le classement porte sur toute la table des joueurs (features) et se trie
+sur n'importe quelle colonne numérique. Chaque colonne est triée une seule
+fois par sens (permutation argsort stable, valeurs manquantes en dernier),
+à la première demande. Un filtre poste / équipe reprend les groupes de
+lignes de l'index de classement et les ordonne par rang dans la
+permutation ; le résultat est mémorisé par (colonne, sens, poste, équipe).
+Changer de page ou revenir sur un tri déjà vu n'est alors qu'une tranche
+de la permutation : O(taille de page), sans retrier le DataFrame.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from scoutonze.data_store import derived
+from scoutonze.ranking import get_ranking_index
+
+# Colonnes triables -> libellé affiché
+SORT_COLUMNS = {
+    'Score_Forme': 'Score de forme',
+    'Buts': 'Buts',
+    'Passes_decisives': 'Passes décisives',
+    'Minutes': 'Minutes',
+    'Matchs': 'Matchs',
+    'Pct_temps_jeu': 'Temps de jeu (%)',
+    'Buts_90': 'Buts / 90 min',
+    'Passes_90': 'Passes / 90 min',
+    'Buts_par_match': 'Buts / match',
+    'Passes_par_match': 'Passes / match',
+}
+
+PAGE_SIZE = 25
+
+# Combinaisons (colonne, sens, poste, équipe) mémorisées
+CACHE_SIZE = 256
+
+
+class Leaderboard:
+    """Joueurs triés sur une colonne numérique, filtrables par poste et par équipe"""
+
+    def __init__(self, ranking):
+        self.ranking = ranking
+        self.players = ranking.players
+        self.order = lru_cache(maxsize=2 * len(SORT_COLUMNS))(self._order)
+        self.select = lru_cache(maxsize=CACHE_SIZE)(self._select)
+
+    def _order(self, column, ascending):
+        """(permutation triée de tous les joueurs, rang de chaque ligne dans la permutation)"""
+        values = self.players[column].to_numpy(dtype=float)
+        # NaN en dernier dans les deux sens (argsort place les NaN à la fin)
+        order = np.argsort(values if ascending else -values, kind='stable')
+        rank = np.empty(len(order), dtype=np.int64)
+        rank[order] = np.arange(len(order))
+        order.flags.writeable = False
+        return order, rank
+
+    def _select(self, column, ascending, position, team):
+        order, rank = self.order(column, ascending)
+        if position is None and team is None:
+            return order
+        rows = self.ranking.rows(position, team)
+        rows = rows[np.argsort(rank[rows], kind='stable')]
+        rows.flags.writeable = False
+        return rows
+
+    def rows(self, column='Score_Forme', ascending=False, position=None, team=None):
+        """Positions de lignes des joueurs retenus, dans l'ordre du tri (mémorisé)"""
+        if column not in SORT_COLUMNS:
+            raise KeyError(column)
+        if team is None:
+            return self.select(column, bool(ascending), position, None)
+        team_id = self.ranking.teams.team_id(team)
+        if team_id is None:
+            # Équipe inconnue : aucun joueur (comme RankingIndex.rows)
+            return np.empty(0, dtype=np.int64)
+        return self.select(column, bool(ascending), position, team_id)
+
+    def page(self, column='Score_Forme', ascending=False, page=1, page_size=PAGE_SIZE, position=None, team=None):
+        """(joueurs de la page `page` avec leur rang `Rang`, nombre total de joueurs retenus)"""
+        rows = self.rows(column, ascending, position, team)
+        start = (max(page, 1) - 1) * page_size
+        players = self.players.iloc[rows[start:start + page_size]]
+        return players.assign(Rang=np.arange(start + 1, start + len(players) + 1)), len(rows)
+
+
+def get_leaderboard(data_dir=None):
+    """Classement paginé des joueurs, partagé entre les sessions"""
+    return derived(
+        'leaderboard',
+        lambda players, standings: Leaderboard(get_ranking_index(data_dir)),
+        ['players', 'standings'],
+        data_dir,
+    )
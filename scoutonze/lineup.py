@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Optimisation de composition
+
+Choisit le XI qui maximise la somme des `Score_Forme` sous les contraintes
+d'une formation. Un joueur peut être aligné hors de son poste naturel
+(ex. un milieu en attaque) avec un score réduit (`SECONDARY_POSITIONS`).
+
+Le problème est résolu exactement comme une affectation postes -> joueurs
+(algorithme hongrois par plus courts chemins augmentants, en NumPy). Les
+K meilleures compositions suivantes sont énumérées par séparation et
+évaluation (algorithme de Murty) sur les couples (joueur, poste).
+"""
+
+import heapq
+from collections import namedtuple
+
+import numpy as np
+
+POSITIONS = ['GK', 'DEF', 'MID', 'FWD']
+
+FORMATIONS = ['4-3-3', '4-2-3-1', '3-5-2', '4-4-2', '3-4-3', '5-3-2', '4-5-1', '4-1-4-1', '5-4-1']
+
+# Postes secondaires : poste naturel -> {poste possible: coefficient appliqué au score}
+SECONDARY_POSITIONS = {
+    'DEF': {'MID': 0.85},
+    'MID': {'FWD': 0.9, 'DEF': 0.85},
+    'FWD': {'MID': 0.9},
+}
+
+# Coût d'une affectation interdite (joueur inéligible ou exclu)
+_FORBIDDEN = 1e9
+
+# Une composition : formation, score total, et (index joueur, poste occupé, valeur) par titulaire
+Lineup = namedtuple('Lineup', ['formation', 'total', 'picks'])
+
+
+def formation_needs(formation):
+    """Nombre de joueurs par poste pour une formation ("4-2-3-1" -> 4 DEF, 5 MID, 1 FWD)"""
+    lines = [int(n) for n in formation.split('-')]
+    return {'GK': 1, 'DEF': lines[0], 'MID': sum(lines[1:-1]), 'FWD': lines[-1]}
+
+
+def position_values(scores, positions, secondary=None):
+    """Matrice joueurs x postes des scores effectifs (-inf si poste impossible)"""
+    secondary = SECONDARY_POSITIONS if secondary is None else secondary
+    scores = np.asarray(scores, dtype=float)
+    positions = np.asarray(positions, dtype=object)
+
+    values = np.full((len(scores), len(POSITIONS)), -np.inf)
+    for col, position in enumerate(POSITIONS):
+        values[positions == position, col] = scores[positions == position]
+        for natural, factors in secondary.items():
+            if position in factors:
+                mask = positions == natural
+                values[mask, col] = scores[mask] * factors[position]
+    return values
+
+
+def assign(cost):
+    """Affectation de coût minimal : chaque ligne reçoit une colonne distincte.
+
+    `cost` est une matrice n_lignes x n_colonnes avec n_lignes <= n_colonnes.
+    Retourne la colonne choisie pour chaque ligne.
+    """
+    n_rows, n_cols = cost.shape
+    u = np.zeros(n_rows)
+    v = np.zeros(n_cols)
+    col_of_row = np.full(n_rows, -1)
+    row_of_col = np.full(n_cols, -1)
+
+    for start in range(n_rows):
+        shortest = np.full(n_cols, np.inf)
+        path = np.full(n_cols, -1)
+        seen_rows = np.zeros(n_rows, dtype=bool)
+        seen_cols = np.zeros(n_cols, dtype=bool)
+        row, min_val, sink = start, 0.0, -1
+
+        # Plus court chemin augmentant depuis la ligne `start`
+        while sink < 0:
+            seen_rows[row] = True
+            reduced = min_val + cost[row] - u[row] - v
+            better = ~seen_cols & (reduced < shortest)
+            path[better] = row
+            shortest[better] = reduced[better]
+
+            col = int(np.argmin(np.where(seen_cols, np.inf, shortest)))
+            min_val = shortest[col]
+            seen_cols[col] = True
+            if row_of_col[col] < 0:
+                sink = col
+            else:
+                row = row_of_col[col]
+
+        # Mise à jour des potentiels
+        u[start] += min_val
+        others = seen_rows.copy()
+        others[start] = False
+        u[others] += min_val - shortest[col_of_row[others]]
+        v[seen_cols] -= min_val - shortest[seen_cols]
+
+        # Inversion du chemin
+        col = sink
+        while True:
+            row = path[col]
+            row_of_col[col] = row
+            col_of_row[row], col = col, col_of_row[row]
+            if row == start:
+                break
+
+    return col_of_row
+
+
+class LineupSolver:
+    """Compositions optimales pour un ensemble de joueurs (une équipe, ou la ligue)"""
+
+    def __init__(self, players, secondary=None, score_col='Score_Forme'):
+        self.labels = players.index.to_numpy()
+        self.values = position_values(players[score_col], players['Poste_simplifie'], secondary)
+        # Joueurs triés par score effectif décroissant, pour chaque poste
+        self.orders = [np.argsort(-self.values[:, col], kind='stable') for col in range(len(POSITIONS))]
+
+    def _solve(self, needs, forced=(), excluded=()):
+        """XI optimal avec des couples (joueur, poste) imposés ou interdits.
+
+        Retourne (total, couples) ou None si les contraintes sont infaisables.
+        """
+        needs = list(needs)
+        taken = set()
+        total = 0.0
+        for player, col in forced:
+            needs[col] -= 1
+            taken.add(player)
+            total += self.values[player, col]
+        if min(needs) < 0:
+            return None
+
+        banned = {}
+        for player, col in excluded:
+            banned.setdefault(col, set()).add(player)
+
+        # Seuls les `remaining` meilleurs joueurs autorisés d'un poste peuvent y être
+        # titulaires : tout autre choix s'échange contre l'un d'eux sans perte
+        remaining = sum(needs)
+        if remaining == 0:
+            return total, list(forced)
+        pool = set()
+        for col, need in enumerate(needs):
+            if need == 0:
+                continue
+            kept = 0
+            for player in self.orders[col]:
+                if kept == remaining or self.values[player, col] == -np.inf:
+                    break
+                if player in taken or player in banned.get(col, ()):
+                    continue
+                pool.add(player)
+                kept += 1
+
+        pool = np.array(sorted(pool), dtype=np.int64)
+        slot_cols = np.repeat(np.arange(len(POSITIONS)), needs)
+        if len(pool) < len(slot_cols):
+            return None
+
+        cost = -self.values[np.ix_(pool, slot_cols)].T
+        for col, players in banned.items():
+            cost[np.ix_(slot_cols == col, np.isin(pool, list(players)))] = np.inf
+        cost[~np.isfinite(cost)] = _FORBIDDEN
+
+        chosen = assign(cost)
+        slot_cost = cost[np.arange(len(slot_cols)), chosen]
+        if (slot_cost >= _FORBIDDEN).any():
+            return None
+
+        pairs = list(forced) + [(int(pool[c]), int(col)) for c, col in zip(chosen, slot_cols)]
+        return total - slot_cost.sum(), pairs
+
+    def _lineup(self, formation, total, pairs):
+        pairs = sorted(pairs, key=lambda pair: (pair[1], -self.values[pair]))
+        return Lineup(
+            formation,
+            float(total),
+            tuple((self.labels[player], POSITIONS[col], float(self.values[player, col])) for player, col in pairs),
+        )
+
+    def best(self, formation, k=1):
+        """Les `k` meilleures compositions distinctes, de la meilleure à la moins bonne.
+
+        Liste vide si l'effectif ne permet pas d'aligner la formation.
+        """
+        needs = [formation_needs(formation)[position] for position in POSITIONS]
+        first = self._solve(needs)
+        if first is None:
+            return []
+
+        # Algorithme de Murty : chaque solution retenue partage l'espace restant
+        # en sous-problèmes disjoints (couples imposés + un couple interdit)
+        counter = 0
+        heap = [(-first[0], counter, first[1], (), ())]
+        lineups = []
+        while heap and len(lineups) < k:
+            neg_total, _, pairs, forced, excluded = heapq.heappop(heap)
+            lineups.append(self._lineup(formation, -neg_total, pairs))
+            if len(lineups) == k:
+                break
+
+            free = [pair for pair in pairs if pair not in forced]
+            for i, pair in enumerate(free):
+                sub_forced = forced + tuple(free[:i])
+                sub_excluded = excluded + (pair,)
+                solution = self._solve(needs, sub_forced, sub_excluded)
+                if solution is not None:
+                    counter += 1
+                    heapq.heappush(heap, (-solution[0], counter, solution[1], sub_forced, sub_excluded))
+
+        return lineups
+
+
+def lineup_frame(players, lineup):
+    """Titulaires d'une composition avec leur poste occupé (`Poste_XI`) et leur valeur"""
+    labels = [label for label, _, _ in lineup.picks]
+    return players.loc[labels].assign(
+        Poste_XI=[position for _, position, _ in lineup.picks],
+        Valeur_XI=[value for _, _, value in lineup.picks],
+    )
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Registre des pages
+
+Chaque page est un module importé seulement quand elle est affichée. Il
+déclare dans `DATASETS` les données dont il a besoin et expose
+`render(data)`. Seules ces données sont chargées, pour la seule partition
+(championnat, saison) sélectionnée, et seules les dépendances de tracé de
+la page sont importées.
+"""
+
+import importlib
+
+import pandas as pd
+
+from scoutonze import perf
+
+# Libellé de navigation -> module de la page (dans l'ordre du menu)
+PAGES = {
+    "📊 Vue d'ensemble": 'overview',
+    "⚽ Meilleur XI": 'best_xi',
+    "👥 Analyse par équipe": 'team_analysis',
+    "🏆 Top joueurs": 'top_players',
+    "🔍 Recherche joueur": 'player_search',
+    "🔮 Prédictions": 'predictions',
+    "💎 Talents cachés": 'hidden_gems',
+    "📈 Évolution forme": 'form_evolution',
+    "📅 Prochains matchs": 'fixtures',
+    "⚽ Générateur de composition": 'lineup_builder',
+}
+
+# Données disponibles -> (module, fonction de chargement, arguments...)
+DATASET_LOADERS = {
+    'players': ('scoutonze.data_store', 'load_table', 'players'),
+    'top_by_team': ('scoutonze.data_store', 'load_table', 'top_by_team'),
+    'scheduled': ('scoutonze.data_store', 'load_table', 'scheduled'),
+    'standings': ('scoutonze.data_store', 'load_table', 'standings'),
+    'recent': ('scoutonze.data_store', 'load_table', 'recent'),
+    'features': ('scoutonze.features', 'get_features'),
+    'ranking': ('scoutonze.ranking', 'get_ranking_index'),
+    'leaderboard': ('scoutonze.leaderboard', 'get_leaderboard'),
+    'teams': ('scoutonze.teams', 'get_team_directory'),
+    'search': ('scoutonze.search', 'get_search_index'),
+    'similar': ('scoutonze.similar', 'get_similarity_index'),
+    'filters': ('scoutonze.filters', 'get_filter_engine'),
+    'history': ('scoutonze.history', 'get_match_history'),
+    'difficulty': ('scoutonze.difficulty', 'get_fixture_difficulty'),
+    'fixtures': ('scoutonze.schedule', 'get_fixture_list'),
+    'form_series': ('scoutonze.timeseries', 'get_form_series'),
+    'projections': ('scoutonze.projections', 'get_projections'),
+    'season': ('scoutonze.season', 'get_season_outlook'),
+}
+
+
+def load_page(label):
+    """Module de la page `label` (importé à la première utilisation)"""
+    return importlib.import_module(f'{__name__}.{PAGES[label]}')
+
+
+def load_datasets(names, partition, partitions=None):
+    """{nom: données} pour les seules données demandées de `partition` (aussi sous la clé 'partition').
+
+    `partitions` (toutes les partitions découvertes, ou None) est repris sous la clé 'partitions'.
+    """
+    data = {'partition': partition, 'partitions': partitions}
+    for name in names:
+        module, function, *args = DATASET_LOADERS[name]
+        with perf.span(f'data:{name}') as span:
+            data[name] = getattr(importlib.import_module(module), function)(*args, data_dir=partition.path)
+            span.rows = len(data[name]) if isinstance(data[name], pd.DataFrame) else None
+    return data
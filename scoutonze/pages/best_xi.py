@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Page « ⚽ Meilleur XI »
+"""
+
+import streamlit as st
+
+from scoutonze import figures, perf, service
+from scoutonze.partitions import league_name
+from scoutonze.lineup import FORMATIONS
+from scoutonze.pitch import render_xi
+
+DATASETS = []
+
+
+def render(data):
+    """Meilleur XI de la ligue sur un terrain"""
+    partition = data['partition']
+    league = league_name(partition.league)
+    
+    st.header(f"⚽ Meilleur XI en forme - {league}")
+    
+    formation = st.selectbox("Choisir une formation", FORMATIONS)
+    
+    st.markdown(f"""
+    **Formation {formation}** | Basé sur les scores de forme des 6 derniers matchs
+    """)
+    
+    # Meilleurs joueurs par poste (XI de la ligue pré-calculé, trié GK -> FWD)
+    with perf.span('compute:best_xi') as span:
+        all_xi = service.best_xi(formation, data_dir=partition.path)['players']
+        span.rows = len(all_xi)
+    
+    # Terrain (figure sérialisée une fois par version des données et formation)
+    with perf.span('chart:pitch'):
+        figures.chart(
+            'best_xi', 'pitch', formation,
+            lambda: render_xi(formation, all_xi, f'Meilleur XI - {league}'), partition.path,
+        )
+    
+    # Stats du XI
+    st.markdown("---")
+    st.subheader("📊 Statistiques du XI")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        avg_score = all_xi['Score_Forme'].mean()
+        st.metric("Score moyen du XI", f"{avg_score:.1f}/10")
+    
+    with col2:
+        total_goals = all_xi['Buts'].sum()
+        st.metric("Buts totaux", int(total_goals))
+    
+    with col3:
+        total_assists = all_xi['Passes_decisives'].sum()
+        st.metric("Passes décisives", int(total_assists))
+    
+    # Tableau détaillé
+    st.markdown("### 📋 Détails du XI")
+    
+    xi_display = all_xi[[
+        'Joueur', 'Equipe_principale', 'Poste_simplifie', 'Score_Forme',
+        'Matchs', 'Buts', 'Passes_decisives'
+    ]].copy()
+    
+    xi_display.columns = ['Joueur', 'Équipe', 'Poste', 'Score', 'Matchs', 'Buts', 'Passes']
+    
+    st.dataframe(
+        xi_display.reset_index(drop=True),
+        use_container_width=True
+    )
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Page « 📅 Prochains matchs »
+"""
+
+import streamlit as st
+import plotly.graph_objects as go
+
+from scoutonze import figures, perf
+from scoutonze.schedule import PAGE_SIZE
+
+DATASETS = ['fixtures', 'difficulty']
+
+
+def _difficulty_chart(difficulty):
+    matrix = difficulty.matrix
+    fig = go.Figure(go.Heatmap(
+        z=matrix.to_numpy(),
+        x=[f"J{matchday}" for matchday in matrix.columns],
+        y=matrix.index,
+        text=difficulty.opponents,
+        colorscale=[[0, '#00ff87'], [0.5, '#f0f0f0'], [1, '#ff4444']],
+        zmin=1,
+        zmax=5,
+        colorbar=dict(title='Difficulté'),
+        hovertemplate='%{y} - %{x}<br>%{text}<br>Difficulté : %{z:.1f}<extra></extra>',
+    ))
+    fig.update_layout(
+        title="Difficulté des matchs restants (1 = facile, 5 = très difficile)",
+        yaxis=dict(autorange='reversed'),
+        height=700
+    )
+    return fig
+
+
+def render(data):
+    """Calendrier des prochains matchs"""
+    fixtures = data['fixtures']
+    difficulty = data['difficulty']
+    
+    st.header("📅 Prochains matchs")
+    
+    st.subheader("🗓️ Calendrier")
+    
+    # Filtres (le calendrier est déjà trié et indexé par journée et par équipe)
+    col1, col2, col3 = st.columns([1, 2, 1])
+    
+    with col1:
+        matchday = st.selectbox("Journée", ['Toutes'] + [int(m) for m in fixtures.matchdays])
+    
+    with col2:
+        team = st.selectbox("Équipe", ['Toutes'] + fixtures.teams)
+    
+    matchday = None if matchday == 'Toutes' else matchday
+    team = None if team == 'Toutes' else team
+    n_pages = max(1, -(-len(fixtures.rows(matchday, team)) // PAGE_SIZE))
+    
+    with col3:
+        # Clé liée aux filtres : la page revient à 1 quand ils changent
+        page = st.number_input("Page", min_value=1, max_value=n_pages, value=1, key=f"fixtures_page_{matchday}_{team}")
+    
+    with perf.span('compute:fixtures_page', rows=PAGE_SIZE):
+        fixtures_page, total = fixtures.page(page, PAGE_SIZE, matchday, team)
+    
+    st.dataframe(fixtures_page, use_container_width=True, hide_index=True)
+    st.caption(f"{total} matchs · page {page}/{n_pages}")
+    
+    st.markdown("---")
+    
+    # Difficulté du calendrier (matrice pré-calculée équipes x journées)
+    st.subheader("🔥 Difficulté du calendrier")
+    
+    window = st.slider("Nombre de journées", 1, len(difficulty.matchdays), min(5, len(difficulty.matchdays)))
+    
+    with perf.span('compute:easiest_fixtures'):
+        easiest = difficulty.easiest(window)
+    st.markdown(f"**✅ Calendriers les plus faciles sur les {window} prochaines journées**")
+    st.dataframe(
+        easiest.assign(Difficulte_moyenne=easiest['Difficulte_moyenne'].round(2)).rename(columns={
+            'Equipe': 'Équipe', 'Difficulte_moyenne': 'Difficulté moyenne (1-5)',
+        }).reset_index(drop=True),
+        use_container_width=True,
+        hide_index=True
+    )
+    
+    with perf.span('chart:difficulty'):
+        figures.chart(
+            'fixtures', 'difficulty', (),
+            lambda: _difficulty_chart(difficulty), data['partition'].path,
+        )
+    
+    st.info("💡 **Méthodologie :** La difficulté d'un match dépend de la force de l'adversaire "
+            "(place au classement, différence de buts par match, points sur les 5 derniers matchs), "
+            "corrigée de l'avantage du terrain. (D) = domicile, (E) = extérieur.")
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Page « 📈 Évolution forme »
+"""
+
+import streamlit as st
+import plotly.graph_objects as go
+
+from scoutonze import figures, perf
+
+DATASETS = ['players', 'form_series']
+
+
+def _curves_chart(curves, window):
+    fig_curves = go.Figure()
+    for name, curve in curves.iterrows():
+        fig_curves.add_trace(go.Scatter(
+            x=curves.columns,
+            y=curve.to_numpy(),
+            mode='lines+markers',
+            name=name,
+            connectgaps=False,
+        ))
+    fig_curves.update_layout(
+        title=f"Forme glissante ({window} derniers matchs)",
+        xaxis_title="Match de l'équipe",
+        yaxis_title="Forme",
+        yaxis=dict(range=[0, 10]),
+        height=450
+    )
+    return fig_curves
+
+
+def _comparison_chart(comparison_data):
+    fig = go.Figure()
+    
+    for _, player in comparison_data.iterrows():
+        fig.add_trace(go.Bar(
+            name=player['Joueur'],
+            x=['Score Forme', 'Buts', 'Passes', 'Matchs/10'],
+            y=[
+                player['Score_Forme'],
+                player['Buts'],
+                player['Passes_decisives'],
+                player['Matchs'] / 10  # Divisé par 10 pour l'échelle
+            ],
+        ))
+    
+    fig.update_layout(
+        barmode='group',
+        title="Comparaison des statistiques",
+        yaxis_title="Valeur",
+        height=400
+    )
+    return fig
+
+
+def _radar_chart(comparison_data):
+    fig_radar = go.Figure()
+    
+    for _, player in comparison_data.iterrows():
+        # Normaliser les valeurs pour le radar
+        buts_norm = min(player['Buts'] / 10 * 10, 10)
+        passes_norm = min(player['Passes_decisives'] / 5 * 10, 10)
+        matchs_norm = min(player['Matchs'] / 24 * 10, 10)
+    
+        fig_radar.add_trace(go.Scatterpolar(
+            r=[player['Score_Forme'], buts_norm, passes_norm, matchs_norm, player['Score_Forme']],
+            theta=['Score Forme', 'Buts', 'Passes', 'Régularité', 'Score Forme'],
+            fill='toself',
+            name=player['Joueur']
+        ))
+    
+    fig_radar.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 10]
+            )),
+        showlegend=True,
+        height=500
+    )
+    return fig_radar
+
+
+def render(data):
+    """Comparaison de joueurs"""
+    df_players = data['players']
+    form_series = data['form_series']
+    
+    st.header("📈 Évolution de la forme des joueurs")
+    
+    st.markdown("### 📊 Sélectionner des joueurs à comparer")
+    
+    # Sélection de joueurs
+    all_players_names = sorted(df_players['Joueur'].unique())
+    
+    selected_players = st.multiselect(
+        "Choisir jusqu'à 5 joueurs",
+        all_players_names,
+        default=all_players_names[:3] if len(all_players_names) >= 3 else all_players_names,
+        max_selections=5
+    )
+    
+    if selected_players:
+        if form_series is None:
+            st.info("📝 Note : Les courbes match par match nécessitent `données/player_match_stats.csv` "
+                    "(voir `python -m scoutonze.form_pipeline`). Seules les statistiques de saison sont affichées.")
+        else:
+            # Courbes de forme réelles (lignes de la matrice joueurs x journées)
+            st.markdown("### 📈 Forme match par match")
+            
+            window = st.slider("Fenêtre de forme (matchs)", 1, 10, 6)
+            with perf.span('compute:form_curves', rows=len(selected_players)):
+                deltas = form_series.delta(selected_players)
+            cols = st.columns(max(len(deltas), 1))
+            for col, (name, row) in zip(cols, deltas.iterrows()):
+                col.metric(name, f"{row['Forme']:.2f}", f"{row['Variation']:+.2f}")
+            
+            with perf.span('chart:form_curves'):
+                figures.chart(
+                    'form_evolution', 'form_curves', (tuple(selected_players), window),
+                    lambda: _curves_chart(form_series.curves(selected_players, window), window), data['partition'].path,
+                )
+        
+        # Affichage des stats actuelles des joueurs sélectionnés
+        comparison_data = df_players[df_players['Joueur'].isin(selected_players)][[
+            'Joueur', 'Equipe_principale', 'Poste_simplifie', 'Score_Forme', 
+            'Matchs', 'Minutes', 'Buts', 'Passes_decisives'
+        ]]
+        
+        st.markdown("### 📋 Comparaison des joueurs sélectionnés")
+        
+        # Graphique en barres comparatif
+        with perf.span('chart:comparison'):
+            figures.chart(
+                'form_evolution', 'comparison', tuple(selected_players),
+                lambda: _comparison_chart(comparison_data), data['partition'].path,
+            )
+        
+        # Tableau détaillé
+        st.dataframe(
+            comparison_data.reset_index(drop=True),
+            use_container_width=True
+        )
+        
+        # Radar chart des compétences
+        st.markdown("### 🎯 Profil de performance")
+        
+        with perf.span('chart:radar'):
+            figures.chart(
+                'form_evolution', 'radar', tuple(selected_players),
+                lambda: _radar_chart(comparison_data), data['partition'].path,
+            )
+        
+    else:
+        st.info("👆 Sélectionnez des joueurs pour voir leur évolution")
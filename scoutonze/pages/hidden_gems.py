@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Page « 💎 Talents cachés »
+"""
+
+import streamlit as st
+import plotly.express as px
+
+from scoutonze import figures, perf
+from scoutonze.filters import Criterion, describe
+
+DATASETS = ['filters', 'teams']
+
+
+def _sidebar_criteria(season_matches):
+    """Critères composés depuis la barre latérale (seuils absolus ou percentiles au poste)"""
+    st.sidebar.markdown("---")
+    st.sidebar.markdown("### 💎 Critères des talents cachés")
+    
+    mode = st.sidebar.radio("Seuils", ["Absolus", "Percentiles au poste"], horizontal=True)
+    
+    if mode == "Absolus":
+        min_score = st.sidebar.slider("Score de forme minimum", 0.0, 10.0, 6.5, 0.1)
+        max_time = st.sidebar.slider("Temps de jeu maximum (%)", 0, 100, 60, 5)
+        criteria = [
+            Criterion('Score_Forme', '>', min_score),
+            Criterion('Pct_temps_jeu', '<', max_time),
+        ]
+    else:
+        min_score = st.sidebar.slider("Score de forme : percentile minimum", 0, 100, 90, 5)
+        max_time = st.sidebar.slider("Temps de jeu : percentile maximum", 0, 100, 40, 5)
+        criteria = [
+            Criterion('Score_Forme', '>=', min_score, 'pctl'),
+            Criterion('Pct_temps_jeu', '<=', max_time, 'pctl'),
+        ]
+    
+    min_matches = st.sidebar.slider("Matchs joués minimum", 0, season_matches, min(5, season_matches))
+    criteria.append(Criterion('Matchs', '>=', min_matches))
+    
+    positions = st.sidebar.multiselect("Postes", ['GK', 'DEF', 'MID', 'FWD'], default=['GK', 'DEF', 'MID', 'FWD'])
+    return tuple(criteria), positions
+
+
+def _gems_scatter(hidden_gems):
+    """Nuage score / temps de jeu : WebGL et un point par case de grille pour les grandes sélections"""
+    points = figures.downsample(hidden_gems, 'Pct_temps_jeu', 'Score_Forme', by='Poste_simplifie')
+    title = "Talents cachés : Score vs Temps de jeu"
+    if len(points) < len(hidden_gems):
+        title += f" ({len(points)} points pour {len(hidden_gems)} joueurs)"
+    
+    # plotly n'accepte pas les catégories absentes de la sélection
+    return px.scatter(
+        points.assign(
+            Poste_simplifie=points['Poste_simplifie'].cat.remove_unused_categories()
+        ),
+        x='Pct_temps_jeu',
+        y='Score_Forme',
+        size='Buts',
+        color='Poste_simplifie',
+        hover_name='Joueur',
+        hover_data={
+            'Equipe_principale': True,
+            'Buts': True,
+            'Passes_decisives': True,
+            'Pct_temps_jeu': ':.1f',
+            'Score_Forme': ':.1f',
+            'Points': len(points) < len(hidden_gems),
+        },
+        title=title,
+        labels={
+            'Pct_temps_jeu': 'Temps de jeu (%)',
+            'Score_Forme': 'Score de forme (/10)',
+            'Poste_simplifie': 'Poste',
+            'Points': 'Joueurs représentés',
+        },
+        render_mode=figures.render_mode(len(points)),
+        height=500
+    )
+
+
+def render(data):
+    """Détecteur de talents cachés"""
+    engine = data['filters']
+    
+    st.header("💎 Détecteur de talents cachés")
+    
+    criteria, positions = _sidebar_criteria(data['teams'].season_matches)
+    
+    st.markdown("**Critères de détection (réglables dans la barre latérale) :**\n" + "\n".join(
+        f"- {describe(criterion)}" for criterion in criteria
+    ))
+    
+    # Un seul masque pour tous les critères, mémorisé par combinaison de critères
+    with perf.span('compute:hidden_gems') as span:
+        hidden_gems = engine.query(criteria, positions)
+        span.rows = len(hidden_gems)
+    
+    if len(hidden_gems) == 0:
+        st.warning("Aucun talent caché détecté avec ces critères.")
+    else:
+        st.success(f"🔍 **{len(hidden_gems)} talents cachés** détectés !")
+        
+        # Nuage de tous les talents détectés (construit une fois par version des données et critères)
+        with perf.span('chart:hidden_gems', rows=len(hidden_gems)):
+            figures.chart(
+                'hidden_gems', 'scatter', (criteria, tuple(positions)),
+                lambda: _gems_scatter(hidden_gems), data['partition'].path,
+            )
+        
+        # Top 10 talents cachés
+        st.markdown("### 🌟 Top 10 talents cachés")
+        
+        for idx, player in hidden_gems.head(10).iterrows():
+            with st.expander(f"⭐ {player['Joueur']} - {player['Equipe_principale']} ({player['Poste_simplifie']})"):
+                col1, col2, col3, col4 = st.columns(4)
+                
+                with col1:
+                    st.metric("Score de forme", f"{player['Score_Forme']:.1f}/10")
+                
+                with col2:
+                    st.metric("Temps de jeu", f"{player['Pct_temps_jeu']:.1f}%")
+                
+                with col3:
+                    st.metric("Buts", player['Buts'])
+                
+                with col4:
+                    st.metric("Passes", player['Passes_decisives'])
+                
+                st.markdown(f"""
+                **Analyse :**
+                - {player['Matchs']} matchs joués ({player['Minutes']} minutes)
+                - Malgré un temps de jeu limité, affiche un excellent score de forme
+                - Pourrait devenir titulaire avec plus d'opportunités
+                """)
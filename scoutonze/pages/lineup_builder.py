@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Page « ⚽ Générateur de composition »
+"""
+
+import streamlit as st
+
+from scoutonze import perf
+from scoutonze.lineup import FORMATIONS, POSITIONS, lineup_frame
+from scoutonze.precompute import get_lineups
+
+DATASETS = ['teams', 'ranking']
+
+
+def render(data):
+    """Générateur de composition optimale"""
+    teams = data['teams']
+    ranking = data['ranking']
+    
+    st.header("⚽ Générateur de composition optimale")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        selected_team = st.selectbox("Choisir une équipe", teams.names())
+    
+    with col2:
+        formation = st.selectbox("Choisir une formation", FORMATIONS)
+    
+    # Compositions pré-calculées (optimum exact + alternatives)
+    with perf.span('compute:lineups') as span:
+        team_players = ranking.top(team=selected_team)
+        lineups = get_lineups(selected_team, formation, data['partition'].path)
+        span.rows = len(team_players)
+    
+    if len(team_players) == 0:
+        st.error(f"Aucun joueur trouvé pour {selected_team}")
+    elif not lineups:
+        st.error(f"Effectif insuffisant pour aligner un {formation} avec {selected_team}")
+    else:
+        st.markdown(f"### 🏟️ {selected_team} - Formation {formation}")
+        st.markdown("---")
+        
+        best_xi = lineup_frame(team_players, lineups[0])
+        
+        # Joueurs alignés hors de leur poste naturel
+        out_of_position = best_xi[best_xi['Poste_XI'] != best_xi['Poste_simplifie']]
+        if len(out_of_position) > 0:
+            moves = ", ".join(
+                f"{player['Joueur']} ({player['Poste_simplifie']} → {player['Poste_XI']})"
+                for _, player in out_of_position.iterrows()
+            )
+            st.info(f"⚠️ {len(out_of_position)} joueur(s) aligné(s) hors de leur poste : {moves}")
+        
+        for poste in POSITIONS:
+            players_at_pos = best_xi[best_xi['Poste_XI'] == poste]
+            
+            st.subheader(f"**{poste}**")
+            
+            for _, player in players_at_pos.iterrows():
+                col1, col2, col3, col4 = st.columns([3, 1, 1, 2])
+                
+                with col1:
+                    st.markdown(f"**{player['Joueur']}**")
+                
+                with col2:
+                    st.metric("Score", f"{player['Score_Forme']:.1f}")
+                
+                with col3:
+                    st.markdown(f"{player['Matchs']} matchs")
+                
+                with col4:
+                    st.markdown(f"⚽ {player['Buts']} | 🎯 {player['Passes_decisives']}")
+            
+            st.markdown("---")
+        
+        # Score moyen du XI
+        st.success(f"✅ Score moyen du XI : {best_xi['Score_Forme'].mean():.1f}/10")
+        
+        # Compositions alternatives
+        if len(lineups) > 1:
+            st.markdown("### 🔁 Compositions alternatives")
+            
+            best_ids = set(best_xi.index)
+            for rank, lineup in enumerate(lineups[1:], start=2):
+                alt_xi = lineup_frame(team_players, lineup)
+                changes = [name for label, name in alt_xi['Joueur'].items() if label not in best_ids]
+                with st.expander(
+                    f"Option {rank} - écart {lineup.total - lineups[0].total:+.2f} pts"
+                    + (f" - entrants : {', '.join(changes)}" if changes else " - mêmes joueurs, postes différents")
+                ):
+                    st.dataframe(
+                        alt_xi[['Joueur', 'Poste_XI', 'Poste_simplifie', 'Score_Forme']].reset_index(drop=True),
+                        use_container_width=True
+                    )
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Page « 📊 Vue d'ensemble »
+"""
+
+import streamlit as st
+import plotly.express as px
+
+from scoutonze import figures, perf
+
+DATASETS = ['players', 'ranking']
+
+
+def _score_histogram(df_players):
+    return px.histogram(
+        df_players, 
+        x='Score_Forme', 
+        nbins=30,
+        title="Distribution des scores de forme (tous joueurs)",
+        labels={'Score_Forme': 'Score de forme', 'count': 'Nombre de joueurs'},
+        color_discrete_sequence=['#1f77b4']
+    )
+
+
+def _position_means(df_players):
+    avg_by_position = df_players.groupby('Poste_simplifie', observed=True)['Score_Forme'].mean().sort_values(ascending=False)
+    return px.bar(
+        x=avg_by_position.index,
+        y=avg_by_position.values,
+        title="Score moyen par poste",
+        labels={'x': 'Poste', 'y': 'Score moyen'},
+        color=avg_by_position.values,
+        color_continuous_scale='Viridis'
+    )
+
+
+def render(data):
+    """Vue d'ensemble de la saison"""
+    df_players = data['players']
+    ranking = data['ranking']
+    data_dir = data['partition'].path
+    
+    st.header("📊 Vue d'ensemble de la saison")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Joueurs analysés", len(df_players))
+    
+    with col2:
+        best_player = ranking.top(1).iloc[0]
+        st.metric("Meilleur score", f"{best_player['Score_Forme']:.1f}", best_player['Joueur'])
+    
+    with col3:
+        avg_score = df_players['Score_Forme'].mean()
+        st.metric("Score moyen", f"{avg_score:.1f}/10")
+    
+    with col4:
+        st.metric("Équipes", len(df_players['Equipe_principale'].unique()))
+    
+    st.markdown("---")
+    
+    # Distribution des scores
+    st.subheader("📈 Distribution des scores de forme")
+    
+    # Figures construites une fois par version des données (scoutonze.figures)
+    with perf.span('chart:score_histogram', rows=len(df_players)):
+        figures.chart('overview', 'score_histogram', (), lambda: _score_histogram(df_players), data_dir)
+    
+    # Scores par poste
+    st.subheader("🎯 Scores moyens par poste")
+    
+    with perf.span('chart:position_means'):
+        figures.chart('overview', 'position_means', (), lambda: _position_means(df_players), data_dir)
+    
+    # Top 10 global
+    st.subheader("🔥 Top 10 joueurs en forme (tous postes confondus)")
+    
+    top_10 = ranking.top(10)[
+        ['Joueur', 'Equipe_principale', 'Poste_simplifie', 'Score_Forme', 'Matchs', 'Minutes', 'Buts', 'Passes_decisives']
+    ]
+    
+    st.dataframe(
+        top_10.reset_index(drop=True),
+        use_container_width=True,
+        height=400
+    )
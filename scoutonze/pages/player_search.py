@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Page « 🔍 Recherche joueur »
+"""
+
+import streamlit as st
+
+from scoutonze import perf
+from scoutonze.partitions import league_name, player_seasons
+
+DATASETS = ['search', 'ranking', 'similar']
+
+
+def render(data):
+    """Recherche de joueur et fiche détaillée"""
+    search_index = data['search']
+    ranking = data['ranking']
+    similar = data['similar']
+    partition = data['partition']
+    
+    st.header("🔍 Recherche de joueur")
+    
+    # Barre de recherche
+    search_query = st.text_input("Rechercher un joueur par nom", placeholder="Ex: Bruno Fernandes")
+    
+    if search_query:
+        # Recherche approximative (casse, accents, fautes de frappe), par pertinence
+        with perf.span('compute:search') as span:
+            results = search_index.search(search_query)
+            span.rows = len(results)
+        
+        if len(results) == 0:
+            st.warning(f"Aucun joueur trouvé pour '{search_query}'")
+        else:
+            st.success(f"**{len(results)} joueur(s) trouvé(s)**")
+            
+            # Options des joueurs similaires (communes à tous les résultats)
+            col1, col2 = st.columns(2)
+            with col1:
+                same_position = st.checkbox("Similaires : même poste uniquement", value=True)
+            with col2:
+                exclude_team = st.checkbox("Similaires : exclure son équipe", value=False)
+            st.markdown("---")
+            
+            # Saisons des joueurs trouvés : seules leurs lignes et quelques colonnes sont lues,
+            # une fois par version des données (partitions déjà découvertes par l'application)
+            with perf.span('compute:player_seasons') as span:
+                seasons = player_seasons(results['Joueur'], partition.league, partitions=data['partitions'])
+                span.rows = len(seasons)
+            
+            # Afficher chaque joueur
+            for idx, player in results.iterrows():
+                with st.expander(f"⚽ {player['Joueur']} - {player['Equipe_principale']} ({player['Poste_simplifie']}) - Score: {player['Score_Forme']:.1f}/10"):
+                    
+                    col1, col2, col3 = st.columns(3)
+                    
+                    with col1:
+                        st.metric("Score de forme", f"{player['Score_Forme']:.1f}/10")
+                        st.metric("Poste", player['Poste_simplifie'])
+                    
+                    with col2:
+                        st.metric("Équipe", player['Equipe_principale'])
+                        st.metric("Matchs joués", player['Matchs'])
+                    
+                    with col3:
+                        st.metric("Minutes", player['Minutes'])
+                        st.metric("Buts", f"⚽ {player['Buts']}")
+                    
+                    st.markdown("---")
+                    
+                    # Stats détaillées
+                    st.subheader("📊 Statistiques détaillées")
+                    
+                    col1, col2, col3, col4 = st.columns(4)
+                    
+                    with col1:
+                        st.metric("Passes décisives", f"🎯 {player['Passes_decisives']}")
+                    
+                    with col2:
+                        if 'Matchs_6_derniers' in player:
+                            st.metric("Matchs (6 derniers)", player['Matchs_6_derniers'])
+                        else:
+                            st.metric("Minutes/match", f"{player['Minutes']/player['Matchs']:.0f}")
+                    
+                    with col3:
+                        st.metric("Buts/match", f"{player['Buts_par_match']:.2f}")
+                    
+                    with col4:
+                        st.metric("Passes/match", f"{player['Passes_par_match']:.2f}")
+                    
+                    # Comparaison avec la moyenne du poste
+                    st.markdown("---")
+                    st.subheader("📈 Comparaison avec la moyenne du poste")
+                    
+                    avg_score_poste = ranking.position_mean[player['Poste_simplifie']]
+                    diff_score = player['Score_Forme'] - avg_score_poste
+                    
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        st.metric(
+                            f"Score moyen ({player['Poste_simplifie']})",
+                            f"{avg_score_poste:.1f}/10"
+                        )
+                    
+                    with col2:
+                        st.metric(
+                            "Différence",
+                            f"{diff_score:+.1f}",
+                            delta=f"{diff_score:+.1f}",
+                            delta_color="normal"
+                        )
+                    
+                    # Classement au poste
+                    rank, total_at_position = ranking.rank(idx)
+                    
+                    st.info(f"🏆 Classement : **{rank}e / {total_at_position}** {player['Poste_simplifie']} de {league_name(partition.league)}")
+                    
+                    # Historique sur les saisons du championnat
+                    player_history = seasons[seasons['Joueur'] == player['Joueur']]
+                    if player_history['season'].nunique() > 1:
+                        st.subheader("📅 Saisons")
+                        history_display = player_history[[
+                            'season', 'Equipe_principale', 'Score_Forme', 'Matchs', 'Buts', 'Passes_decisives'
+                        ]].sort_values('season', ascending=False)
+                        history_display.columns = ['Saison', 'Équipe', 'Score', 'Matchs', 'Buts', 'Passes']
+                        st.dataframe(history_display, use_container_width=True, hide_index=True)
+                    
+                    # Joueurs au profil le plus proche (forme, temps de jeu, buts et passes / 90, matchs)
+                    st.subheader("👥 Joueurs similaires")
+                    
+                    with perf.span('compute:similar'):
+                        neighbours = similar.nearest(
+                            idx,
+                            position=player['Poste_simplifie'] if same_position else None,
+                            exclude_team=exclude_team,
+                        )
+                    neighbours_display = neighbours[[
+                        'Joueur', 'Equipe_principale', 'Poste_simplifie', 'Score_Forme',
+                        'Pct_temps_jeu', 'Buts_90', 'Passes_90', 'Similarite'
+                    ]].round({'Buts_90': 2, 'Passes_90': 2, 'Similarite': 0})
+                    neighbours_display.columns = [
+                        'Joueur', 'Équipe', 'Poste', 'Score', '% temps de jeu', 'Buts/90', 'Passes/90', 'Similarité (%)'
+                    ]
+                    st.dataframe(neighbours_display.reset_index(drop=True), use_container_width=True, hide_index=True)
+    
+    else:
+        st.info("👆 Tapez un nom de joueur pour commencer la recherche")
+        
+        # Afficher quelques exemples
+        st.markdown("### 💡 Exemples de recherche :")
+        
+        top_3 = ranking.top(3)
+        
+        for _, player in top_3.iterrows():
+            st.markdown(f"- {player['Joueur']} ({player['Equipe_principale']}) - {player['Score_Forme']:.1f}/10")
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Page « 🔮 Prédictions »
+"""
+
+import streamlit as st
+import plotly.graph_objects as go
+
+from scoutonze import figures, perf
+
+DATASETS = ['features', 'projections', 'season']
+
+
+def _projections_chart(top_10_projections):
+    fig = go.Figure()
+    
+    fig.add_trace(go.Bar(
+        x=top_10_projections['Joueur'],
+        y=top_10_projections['Buts'],
+        name='Buts actuels',
+        marker_color='lightblue',
+        text=top_10_projections['Buts'],
+        textposition='auto',
+    ))
+    
+    fig.add_trace(go.Bar(
+        x=top_10_projections['Joueur'],
+        y=top_10_projections['Buts_restants'],
+        name='Buts supplémentaires projetés',
+        marker_color='darkblue',
+        text=top_10_projections['Buts_restants'].round(1),
+        textposition='auto',
+        error_y=dict(
+            type='data',
+            symmetric=False,
+            array=top_10_projections['Projection_P90'] - top_10_projections['Projection_buts'],
+            arrayminus=top_10_projections['Projection_buts'] - top_10_projections['Projection_P10'],
+            color='gray',
+        ),
+    ))
+    
+    fig.update_layout(
+        barmode='stack',
+        title="Projection de buts en fin de saison (intervalle 10 % - 90 %)",
+        xaxis_title="Joueur",
+        yaxis_title="Nombre de buts",
+        xaxis_tickangle=-45,
+        height=500
+    )
+    return fig
+
+
+def _positions_chart(season):
+    fig = go.Figure(go.Heatmap(
+        z=season.positions.to_numpy() * 100,
+        x=season.positions.columns,
+        y=season.positions.index,
+        colorscale='Blues',
+        colorbar=dict(title='%'),
+        hovertemplate='%{y}<br>Place %{x} : %{z:.1f} %<extra></extra>',
+    ))
+    fig.update_layout(
+        title="Probabilité de chaque place finale",
+        xaxis_title="Place",
+        xaxis=dict(dtick=1),
+        yaxis=dict(autorange='reversed'),
+        height=650
+    )
+    return fig
+
+
+def render(data):
+    """Projection du meilleur buteur et du classement final"""
+    df_players = data['features']
+    projections = data['projections']
+    season = data['season']
+    
+    st.header("🔮 Prédictions de fin de saison")
+    
+    st.markdown("### ⚽ Qui va finir meilleur buteur ?")
+    
+    # Projections simulées sur le calendrier restant (une fois par version des données)
+    with perf.span('compute:scorer_projections', rows=len(df_players)):
+        top_scorers = df_players[['Joueur', 'Equipe_principale', 'Poste_simplifie', 'Buts', 'Matchs', 'Buts_par_match']].join(projections)
+        top_scorers = top_scorers[top_scorers['Buts'] > 0]
+    
+    if len(top_scorers) == 0:
+        st.warning("Pas assez de données pour faire des prédictions.")
+    else:
+        # Top 10 des projections
+        top_10_projections = top_scorers.nlargest(10, 'Projection_buts')
+        
+        # Graphique des projections (barre d'erreur : intervalle P10 - P90)
+        with perf.span('chart:scorer_projections'):
+            figures.chart(
+                'predictions', 'scorer_projections', (),
+                lambda: _projections_chart(top_10_projections), data['partition'].path,
+            )
+        
+        # Tableau détaillé
+        st.markdown("### 📊 Détails des projections")
+        
+        st.info("💡 **Méthodologie :** Simulation de Monte-Carlo des matchs restants du calendrier. "
+                "À chaque match, le joueur joue selon sa disponibilité (part des matchs de son équipe disputés) "
+                "et marque selon une loi de Poisson (buts par 90 minutes x temps de jeu x défense adverse x domicile/extérieur).")
+        
+        projection_display = top_10_projections[[
+            'Joueur', 'Equipe_principale', 'Poste_simplifie', 'Buts', 'Matchs', 
+            'Buts_par_match', 'Matchs_restants', 'Disponibilite', 'Projection_buts',
+            'Projection_P10', 'Projection_P90', 'Proba_meilleur_buteur'
+        ]].copy()
+        
+        projection_display['Buts_par_match'] = projection_display['Buts_par_match'].round(2)
+        projection_display['Disponibilite'] = (projection_display['Disponibilite'] * 100).round(0)
+        projection_display['Projection_buts'] = projection_display['Projection_buts'].round(1)
+        projection_display['Proba_meilleur_buteur'] = (projection_display['Proba_meilleur_buteur'] * 100).round(1)
+        projection_display.columns = [
+            'Joueur', 'Équipe', 'Poste', 'Buts actuels', 'Matchs joués', 
+            'Moy. buts/match', 'Matchs restants', 'Disponibilité (%)', 'Total projeté',
+            'Bas (P10)', 'Haut (P90)', 'Meilleur buteur (%)'
+        ]
+        
+        st.dataframe(
+            projection_display.reset_index(drop=True),
+            use_container_width=True,
+            height=400
+        )
+        
+        # Insights
+        best_projection = top_10_projections.iloc[0]
+        st.success(f"""
+        🎯 **Meilleur buteur projeté :** {best_projection['Joueur']} ({best_projection['Equipe_principale']})
+        - Buts actuels : {best_projection['Buts']:.0f}
+        - Projection totale : **{best_projection['Projection_buts']:.1f} buts** (entre {best_projection['Projection_P10']:.0f} et {best_projection['Projection_P90']:.0f})
+        - Moyenne : {best_projection['Buts_par_match']:.2f} buts/match
+        - Probabilité de finir meilleur buteur : {best_projection['Proba_meilleur_buteur']:.0%}
+        """)
+    
+    # Classement final simulé
+    st.markdown("---")
+    st.markdown("### 🏆 Classement final simulé")
+    
+    summary = season.summary
+    col1, col2, col3 = st.columns(3)
+    favorite = summary.iloc[summary['Proba_titre'].to_numpy().argmax()]
+    col1.metric("Favori pour le titre", favorite['Equipe'], f"{favorite['Proba_titre']:.0%}")
+    col2.metric("Points projetés du favori", f"{favorite['Points_projetes']:.1f}")
+    col3.metric("Équipes menacées (> 50 %)", int((summary['Proba_relegation'] > 0.5).sum()))
+    
+    with perf.span('chart:season_positions'):
+        figures.chart(
+            'predictions', 'season_positions', (),
+            lambda: _positions_chart(season), data['partition'].path,
+        )
+    
+    table_display = summary[['Equipe', 'Points', 'Points_projetes', 'Place_moyenne',
+                             'Proba_titre', 'Proba_top4', 'Proba_relegation']].copy()
+    table_display['Points_projetes'] = table_display['Points_projetes'].round(1)
+    table_display['Place_moyenne'] = table_display['Place_moyenne'].round(1)
+    for col in ['Proba_titre', 'Proba_top4', 'Proba_relegation']:
+        table_display[col] = (table_display[col] * 100).round(1)
+    table_display.columns = ['Équipe', 'Points actuels', 'Points projetés', 'Place moyenne',
+                             'Titre (%)', 'Top 4 (%)', 'Relégation (%)']
+    
+    st.dataframe(table_display.reset_index(drop=True), use_container_width=True, height=400)
+    
+    st.info("💡 **Méthodologie :** Forces d'attaque et de défense ajustées sur les buts de la saison "
+            "et les derniers résultats, puis simulation de tous les matchs restants du calendrier.")
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Page « 👥 Analyse par équipe »
+"""
+
+import streamlit as st
+
+from scoutonze import perf
+
+DATASETS = ['teams', 'ranking', 'history']
+
+
+def render(data):
+    """Effectif et meilleurs joueurs d'une équipe"""
+    teams = data['teams']
+    ranking = data['ranking']
+    history = data['history']
+    
+    st.header("👥 Analyse par équipe")
+    
+    # Sélection de l'équipe (un joueur passé par plusieurs clubs compte dans chacun)
+    selected_team = st.selectbox("Choisir une équipe", teams.names())
+    
+    if selected_team:
+        # Joueurs de l'équipe (même si multiples équipes), déjà triés par score
+        with perf.span('compute:squad') as span:
+            team_players = ranking.top(team=selected_team)
+            span.rows = len(team_players)
+        
+        st.markdown(f"### ⚽ {selected_team}")
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.metric("Effectif analysé", len(team_players))
+        
+        with col2:
+            avg_team_score = team_players['Score_Forme'].mean()
+            st.metric("Score moyen équipe", f"{avg_team_score:.1f}/10")
+        
+        with col3:
+            best_player_team = team_players.iloc[0]
+            st.metric("Meilleur joueur", best_player_team['Joueur'], f"{best_player_team['Score_Forme']:.1f}")
+        
+        # Derniers résultats de l'équipe
+        with perf.span('compute:last_results'):
+            last_matches = history.last(teams.team_id(selected_team), 5)
+        if len(last_matches) > 0:
+            form, points = history.form(teams.team_id(selected_team), 5)
+            st.markdown(f"**📅 Forme récente :** {' '.join(form)} ({points} pts sur {3 * len(form)})")
+            
+            last_display = last_matches.assign(
+                Date=last_matches['Date'].dt.strftime('%d/%m/%Y'),
+                Lieu=last_matches['Domicile'].map({True: 'Domicile', False: 'Extérieur'}),
+                Score=last_matches['Buts_pour'].astype(str) + ' - ' + last_matches['Buts_contre'].astype(str),
+            )[['Date', 'Adversaire', 'Lieu', 'Score', 'Resultat']].iloc[::-1]
+            st.dataframe(last_display.reset_index(drop=True), use_container_width=True, hide_index=True)
+        
+        st.markdown("---")
+        
+        # Top joueurs par poste
+        st.subheader("🔥 Meilleurs joueurs par poste")
+        
+        for poste in ['GK', 'DEF', 'MID', 'FWD']:
+            players_at_pos = ranking.top(5, poste, selected_team)
+            
+            if len(players_at_pos) > 0:
+                st.markdown(f"**{poste}**")
+                
+                cols = st.columns(len(players_at_pos))
+                for idx, (_, player) in enumerate(players_at_pos.iterrows()):
+                    with cols[idx]:
+                        st.metric(
+                            player['Joueur'][:15] + "..." if len(player['Joueur']) > 15 else player['Joueur'],
+                            f"{player['Score_Forme']:.1f}",
+                            f"{player['Buts']}⚽ {player['Passes_decisives']}🎯"
+                        )
+        
+        st.markdown("---")
+        
+        # Tableau détaillé
+        st.subheader("📋 Effectif complet")
+        
+        team_players_display = team_players[
+            ['Joueur', 'Poste_simplifie', 'Score_Forme', 'Matchs', 'Minutes', 'Buts', 'Passes_decisives']
+        ]
+        
+        st.dataframe(
+            team_players_display.reset_index(drop=True),
+            use_container_width=True,
+            height=500
+        )
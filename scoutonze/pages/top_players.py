@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Page « 🏆 Top joueurs »
+"""
+
+import streamlit as st
+import plotly.express as px
+
+from scoutonze import figures, perf
+from scoutonze.leaderboard import PAGE_SIZE, SORT_COLUMNS
+
+DATASETS = ['leaderboard', 'teams']
+
+# Libellé affiché -> colonne triable
+_SORT_LABELS = {label: column for column, label in SORT_COLUMNS.items()}
+
+
+def _leaderboard_chart(players, sort):
+    # plotly n'accepte pas les catégories absentes de la sélection
+    fig = px.bar(
+        players.assign(
+            Equipe_principale=players['Equipe_principale'].cat.remove_unused_categories()
+        ),
+        x='Joueur',
+        y=sort,
+        color='Equipe_principale',
+        title=f"{SORT_COLUMNS[sort]} - rangs {players['Rang'].iat[0]} à {players['Rang'].iat[-1]}",
+        labels={sort: SORT_COLUMNS[sort], 'Joueur': 'Joueur', 'Equipe_principale': 'Équipe'},
+        hover_data=['Rang', 'Score_Forme', 'Matchs', 'Minutes', 'Buts', 'Passes_decisives']
+    )
+    
+    fig.update_layout(xaxis_tickangle=-45)
+    return fig
+
+
+def render(data):
+    """Classement de tous les joueurs : tri sur une colonne, filtres poste / équipe, pagination"""
+    leaderboard = data['leaderboard']
+    teams = data['teams']
+    
+    st.header("🏆 Top joueurs")
+    
+    # Filtres et tri (permutations par colonne pré-calculées : tri et pages en O(taille de page))
+    col1, col2, col3, col4, col5 = st.columns([1, 2, 2, 2, 1])
+    
+    with col1:
+        position = st.selectbox("Poste", ['Tous', 'GK', 'DEF', 'MID', 'FWD'])
+    
+    with col2:
+        team = st.selectbox("Équipe", ['Toutes'] + teams.names())
+    
+    with col3:
+        sort = _SORT_LABELS[st.selectbox("Trier par", list(_SORT_LABELS))]
+    
+    with col4:
+        ascending = st.radio("Ordre", ["Décroissant", "Croissant"], horizontal=True) == "Croissant"
+    
+    position = None if position == 'Tous' else position
+    team = None if team == 'Toutes' else team
+    n_pages = max(1, -(-len(leaderboard.rows(sort, ascending, position, team)) // PAGE_SIZE))
+    
+    with col5:
+        # Clé liée aux filtres et au tri : la page revient à 1 quand ils changent
+        page = st.number_input("Page", min_value=1, max_value=n_pages, value=1,
+                               key=f"leaderboard_page_{position}_{team}_{sort}_{ascending}")
+    
+    with perf.span('compute:leaderboard', rows=PAGE_SIZE):
+        players, total = leaderboard.page(sort, ascending, page, PAGE_SIZE, position, team)
+    
+    if total == 0:
+        st.warning("Aucun joueur ne correspond à ces filtres.")
+        return
+    
+    st.caption(f"{total} joueurs · page {page}/{n_pages}")
+    
+    # Graphique de la page affichée (construit une fois par version des données, tri, filtres et page)
+    with perf.span('chart:leaderboard', rows=len(players)):
+        figures.chart(
+            'top_players', 'leaderboard', (sort, ascending, position, team, page),
+            lambda: _leaderboard_chart(players, sort), data['partition'].path,
+        )
+    
+    # Tableau détaillé
+    columns = ['Rang', 'Joueur', 'Equipe_principale', 'Poste_simplifie', 'Score_Forme', 'Matchs', 'Minutes',
+               'Buts', 'Passes_decisives']
+    st.dataframe(
+        players[columns + [sort] * (sort not in columns)],
+        use_container_width=True,
+        hide_index=True
+    )
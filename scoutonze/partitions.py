@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Championnats et saisons
+
+Les données sont rangées par partition, une saison d'un championnat par
+dossier, avec les mêmes CSV que le dossier historique :
+
+    données/premier-league/2025-2026/player_form_scores.csv
+    données/ligue-1/2024-2025/...
+
+Les CSV posés directement dans `données/` forment la partition par défaut
+(DEFAULT_LEAGUE, DEFAULT_SEASON).
+
+Chaque partition a son propre cache dans `scoutonze.data_store` : seules les
+saisons sélectionnées sont lues et gardées en mémoire, le démarrage ne fait
+que lister les dossiers. Au-delà de MAX_OPEN partitions utilisées, la moins
+récemment utilisée est libérée. `scan()` lit une table sur plusieurs
+partitions en ne gardant que les colonnes et les lignes demandées ; les
+saisons d'un groupe de joueurs (`player_seasons`) sont mémorisées par
+version des partitions lues.
+"""
+
+import os
+import threading
+from collections import OrderedDict, namedtuple
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.dataset as ds
+
+from scoutonze import data_store, history
+from scoutonze.data_store import TABLES, arrow_path, fingerprint, release, table_exists
+
+# Partition des CSV posés directement dans le dossier de données
+DEFAULT_LEAGUE = 'premier-league'
+DEFAULT_SEASON = '2025-2026'
+
+# Noms affichés des championnats (sinon : dossier avec majuscules)
+LEAGUE_NAMES = {
+    'premier-league': 'Premier League',
+    'ligue-1': 'Ligue 1',
+    'la-liga': 'La Liga',
+    'serie-a': 'Serie A',
+    'bundesliga': 'Bundesliga',
+}
+
+# Colonnes lues pour l'historique d'un joueur sur plusieurs saisons
+SEASON_COLUMNS = ['Joueur', 'Equipe_principale', 'Score_Forme', 'Matchs', 'Minutes', 'Buts', 'Passes_decisives']
+
+# Partitions gardées en mémoire (les sessions d'un processus les partagent)
+MAX_OPEN = 4
+
+# Résultats de `player_seasons` mémorisés (toutes sessions confondues)
+MAX_SEASON_QUERIES = 64
+
+# Une partition : championnat, saison et dossier de ses CSV
+Partition = namedtuple('Partition', ['league', 'season', 'path'])
+
+# Partitions ouvertes, de la moins à la plus récemment utilisée : dossier -> Partition
+_OPEN = OrderedDict()
+_LOCK = threading.Lock()
+
+# (partitions et empreintes de leur table des joueurs, joueurs, colonnes) -> DataFrame
+_SEASON_QUERIES = OrderedDict()
+
+
+def league_name(league):
+    """Nom affiché d'un championnat"""
+    return LEAGUE_NAMES.get(league, league.replace('-', ' ').title())
+
+
+def describe(partition):
+    """« Premier League 2025-2026 »"""
+    return f"{league_name(partition.league)} {partition.season}"
+
+
+def _is_partition(path):
+    return table_exists('players', path) or table_exists('match_stats', path)
+
+
+def discover(data_dir=None):
+    """Partitions présentes, par championnat puis de la saison la plus récente à la plus ancienne"""
+    root = Path(data_dir) if data_dir is not None else data_store.DATA_DIR
+    found = []
+    for league in (os.scandir(root) if root.is_dir() else []):
+        # Dossiers cachés (dont le cache .cache) ignorés
+        if league.is_dir() and not league.name.startswith('.'):
+            found += [
+                Partition(league.name, season.name, Path(season.path))
+                for season in os.scandir(league.path)
+                if season.is_dir() and _is_partition(Path(season.path))
+            ]
+    if _is_partition(root) and not select(found, DEFAULT_LEAGUE, [DEFAULT_SEASON]):
+        found.append(Partition(DEFAULT_LEAGUE, DEFAULT_SEASON, root))
+
+    found.sort(key=lambda partition: partition.season, reverse=True)
+    return sorted(found, key=lambda partition: partition.league)
+
+
+def select(partitions, league=None, seasons=None):
+    """Partitions d'un championnat (toutes si None) et des saisons `seasons` (toutes si None)"""
+    return [
+        partition for partition in partitions
+        if (league is None or partition.league == league) and (seasons is None or partition.season in seasons)
+    ]
+
+
+def default_league(partitions):
+    """Championnat sélectionné par défaut : DEFAULT_LEAGUE s'il est présent, sinon le premier"""
+    if select(partitions, DEFAULT_LEAGUE):
+        return DEFAULT_LEAGUE
+    return partitions[0].league if partitions else None
+
+
+def resolve(league=None, season=None, data_dir=None):
+    """Partition d'un championnat et d'une saison (par défaut : la saison la plus récente).
+
+    LookupError si elle n'existe pas.
+    """
+    partitions = discover(data_dir)
+    league = league or default_league(partitions)
+    matching = select(partitions, league, None if season is None else [season])
+    if not matching:
+        raise LookupError(f"Données introuvables : {league or '?'} {season or ''}".strip())
+    return matching[0]
+
+
+def open_partition(partition):
+    """Marque une partition comme utilisée et libère la moins récente au-delà de MAX_OPEN"""
+    key = str(partition.path)
+    with _LOCK:
+        _OPEN[key] = partition
+        _OPEN.move_to_end(key)
+        evicted = []
+        while len(_OPEN) > MAX_OPEN:
+            evicted.append(_OPEN.popitem(last=False)[1])
+    for stale in evicted:
+        release(stale.path)
+        history.release(stale.path)
+    return partition
+
+
+def open_partitions():
+    """Partitions actuellement gardées en mémoire"""
+    with _LOCK:
+        return list(_OPEN.values())
+
+
+def scan(name, partitions, columns=None, filter=None):
+    """Lignes de la table `name` sur plusieurs partitions, avec colonnes `league` et `season`.
+
+    Seules les colonnes `columns` sont lues des fichiers Arrow, et les lignes
+    retenues par l'expression `filter` (ex. `pyarrow.dataset.field('Joueur') == nom`)
+    sont filtrées pendant la lecture : les tables complètes ne sont pas chargées.
+    Les partitions sans cette table sont ignorées.
+    """
+    frames = []
+    for partition in partitions:
+        if not table_exists(name, partition.path):
+            continue
+        dataset = ds.dataset(str(arrow_path(name, partition.path)), format='ipc')
+        frame = dataset.to_table(columns=columns, filter=filter).to_pandas()
+        frames.append(frame.assign(league=partition.league, season=partition.season))
+
+    if not frames:
+        return pd.DataFrame(columns=list(columns or TABLES[name].get('key', [])) + ['league', 'season'])
+    return pd.concat(frames, ignore_index=True)
+
+
+def player_seasons(players, league, columns=SEASON_COLUMNS, data_dir=None, partitions=None):
+    """Lignes des joueurs `players` (noms) dans toutes les saisons d'un championnat.
+
+    `partitions` : partitions déjà découvertes (sinon `discover(data_dir)`).
+    Le résultat est mémorisé tant que la table des joueurs d'aucune de ces
+    saisons ne change ; il ne doit pas être modifié en place.
+    """
+    seasons = [
+        partition for partition in select(discover(data_dir) if partitions is None else partitions, league)
+        if table_exists('players', partition.path)
+    ]
+    key = (
+        tuple((str(partition.path), fingerprint('players', partition.path)) for partition in seasons),
+        tuple(sorted(set(players))),
+        tuple(columns),
+    )
+    with _LOCK:
+        frame = _SEASON_QUERIES.get(key)
+        if frame is not None:
+            _SEASON_QUERIES.move_to_end(key)
+            return frame
+
+    frame = scan('players', seasons, list(columns), ds.field('Joueur').isin(list(key[1])))
+    with _LOCK:
+        _SEASON_QUERIES[key] = frame
+        while len(_SEASON_QUERIES) > MAX_SEASON_QUERIES:
+            _SEASON_QUERIES.popitem(last=False)
+    return frame
@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Mesures de performance
+
+Chaque exécution du script (`run`) est découpée en spans nommés (`span`) :
+chargement des données, calculs et graphiques de chaque page. Un span
+relève sa durée, le nombre de lignes traitées (renseigné par l'appelant)
+et la mémoire allouée pendant son exécution : variation de la mémoire
+résidente du processus, ou mémoire suivie par tracemalloc s'il est actif
+(plus précis, mais trop coûteux pour rester activé).
+
+Un span coûte quelques microsecondes : les mesures restent activées en
+production (SCOUTONZE_PERF=0 pour les couper). Les exécutions sont
+ajoutées par lots (toutes les EXPORT_INTERVAL secondes) à `perf.jsonl`, et
+les cumuls par span réécrits au format texte Prometheus dans
+`metrics.prom` (dossier SCOUTONZE_PERF_DIR, par défaut
+`données/.cache/perf`). `profile()` capture un profil cProfile
+d'une seule exécution.
+"""
+
+import atexit
+import cProfile
+import io
+import json
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from scoutonze.data_store import cache_dir
+
+ENABLED = os.environ.get('SCOUTONZE_PERF', '1') != '0'
+
+# Exécutions gardées en mémoire pour le panneau de la barre latérale
+RECENT_RUNS = 50
+
+# Taille au-delà de laquelle perf.jsonl est renommé en perf.jsonl.1
+MAX_LOG_BYTES = 10 * 1024 * 1024
+
+# Intervalle minimal entre deux exports (secondes) : les exécutions sont écrites par lots
+EXPORT_INTERVAL = 10.0
+
+# Fonctions affichées dans un profil
+PROFILE_LINES = 30
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+try:
+    _STATM = os.open('/proc/self/statm', os.O_RDONLY)
+except OSError:
+    _STATM = None
+
+_LOCAL = threading.local()
+_LOCK = threading.Lock()
+_RECENT = deque(maxlen=RECENT_RUNS)
+# Cumuls par span : nom -> [nombre, secondes, secondes max, lignes, octets]
+_TOTALS = {}
+# Exécutions pas encore écrites, et date (monotonic) du dernier export
+_PENDING = []
+_flushed = [0.0]
+
+
+def _memory():
+    """Mémoire allouée : suivie par tracemalloc s'il est actif, sinon mémoire résidente"""
+    if tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[0]
+    if _STATM is not None:
+        return int(os.pread(_STATM, 64, 0).split()[1]) * _PAGE_SIZE
+    return 0
+
+
+def export_dir():
+    """Dossier des fichiers exportés (créé au besoin)"""
+    path = Path(os.environ['SCOUTONZE_PERF_DIR']) if 'SCOUTONZE_PERF_DIR' in os.environ else cache_dir() / 'perf'
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+class Span:
+    """Mesure d'un bloc (gestionnaire de contexte) ; `rows` peut être renseigné dans le bloc"""
+
+    __slots__ = ['name', 'parent', 'depth', 'start', 'seconds', 'rows', 'bytes', '_memory']
+
+    def __init__(self, name, rows=None):
+        self.name = name
+        self.rows = rows
+        self.parent = None
+        self.depth = 0
+        self.seconds = None
+        self.bytes = None
+
+    def __enter__(self):
+        stack = _LOCAL.stack
+        if stack:
+            self.parent = stack[-1]
+            self.depth = len(stack)
+        stack.append(self)
+        self._memory = _memory()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.seconds = time.perf_counter() - self.start
+        self.bytes = _memory() - self._memory
+        _LOCAL.stack.pop()
+        _LOCAL.spans.append(self)
+
+    def as_dict(self):
+        parent = self.parent.name if self.parent is not None else None
+        return {'name': self.name, 'parent': parent, 'depth': self.depth, 'seconds': self.seconds,
+                'rows': self.rows, 'bytes': self.bytes}
+
+
+class _NoSpan:
+    """Span sans mesure (hors exécution, ou mesures coupées)"""
+
+    __slots__ = ['name', 'rows']
+
+    def __init__(self, name=None, rows=None):
+        self.name = name
+        self.rows = rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+def span(name, rows=None):
+    """Mesure le bloc `with span(name):` dans l'exécution en cours du fil"""
+    if not ENABLED or getattr(_LOCAL, 'stack', None) is None:
+        return _NoSpan(name, rows)
+    return Span(name, rows)
+
+
+@contextmanager
+def run(name):
+    """Une exécution du script : span racine, puis enregistrement et export des spans"""
+    if not ENABLED:
+        yield _NoSpan(name)
+        return
+
+    _LOCAL.stack, _LOCAL.spans = [], []
+    try:
+        with Span(name) as root:
+            yield root
+    finally:
+        spans = _LOCAL.spans
+        del _LOCAL.stack, _LOCAL.spans
+        _record({
+            'time': time.time(),
+            'run': root.name,
+            'spans': [s.as_dict() for s in sorted(spans, key=lambda s: s.start)],
+        })
+
+
+def current_spans():
+    """Spans terminés de l'exécution en cours du fil, dans l'ordre de début"""
+    return sorted(getattr(_LOCAL, 'spans', []), key=lambda s: s.start)
+
+
+def recent_runs():
+    """Dernières exécutions enregistrées (la plus récente en dernier)"""
+    return list(_RECENT)
+
+
+def _record(record):
+    with _LOCK:
+        _RECENT.append(record)
+        _PENDING.append(record)
+        for s in record['spans']:
+            totals = _TOTALS.setdefault(s['name'], [0, 0.0, 0.0, 0, 0])
+            totals[0] += 1
+            totals[1] += s['seconds']
+            totals[2] = max(totals[2], s['seconds'])
+            totals[3] += s['rows'] or 0
+            totals[4] += max(s['bytes'], 0)
+
+        if time.monotonic() - _flushed[0] >= EXPORT_INTERVAL:
+            _flush()
+
+
+def _flush():
+    """Écrit les exécutions en attente dans perf.jsonl et réécrit metrics.prom"""
+    _flushed[0] = time.monotonic()
+    records = list(_PENDING)
+    _PENDING.clear()
+    try:
+        path = export_dir() / 'perf.jsonl'
+        if path.exists() and path.stat().st_size > MAX_LOG_BYTES:
+            os.replace(path, path.with_name('perf.jsonl.1'))
+        with open(path, 'a', encoding='utf-8') as f:
+            f.writelines(json.dumps(record, ensure_ascii=False) + '\n' for record in records)
+        _write_atomic(export_dir() / 'metrics.prom', _prometheus_text())
+    except OSError:
+        # Un disque plein ou en lecture seule ne doit pas casser l'application
+        pass
+
+
+def flush():
+    """Exporte tout de suite les exécutions en attente (appelé aussi à la sortie du processus)"""
+    with _LOCK:
+        _flush()
+
+
+def _write_atomic(path, text):
+    tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+    tmp_path.write_text(text, encoding='utf-8')
+    os.replace(tmp_path, path)
+
+
+def _prometheus_text():
+    lines = [
+        '# HELP scoutonze_span_seconds Durée des spans ScoutOnze',
+        '# TYPE scoutonze_span_seconds summary',
+    ]
+    for name, (count, seconds, _, _, _) in sorted(_TOTALS.items()):
+        lines.append(f'scoutonze_span_seconds_count{{span="{name}"}} {count}')
+        lines.append(f'scoutonze_span_seconds_sum{{span="{name}"}} {seconds:.6f}')
+    for metric, index, kind, help_text in [
+        ('scoutonze_span_seconds_max', 2, 'gauge', 'Durée maximale des spans'),
+        ('scoutonze_span_rows_total', 3, 'counter', 'Lignes traitées par les spans'),
+        ('scoutonze_span_bytes_total', 4, 'counter', 'Mémoire allouée par les spans (octets)'),
+    ]:
+        lines += [f'# HELP {metric} {help_text}', f'# TYPE {metric} {kind}']
+        lines += [f'{metric}{{span="{name}"}} {totals[index]:g}' for name, totals in sorted(_TOTALS.items())]
+    return '\n'.join(lines) + '\n'
+
+
+def prometheus_text():
+    """Cumuls par span au format texte Prometheus"""
+    with _LOCK:
+        return _prometheus_text()
+
+
+class Profile:
+    """Résultat de `profile()` : texte des fonctions les plus coûteuses et fichier .prof"""
+
+    text = None
+    path = None
+
+
+@contextmanager
+def profile(enabled=True):
+    """Profile le bloc avec cProfile (si `enabled`) et écrit le fichier .prof"""
+    result = Profile()
+    if not enabled:
+        yield result
+        return
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield result
+    finally:
+        profiler.disable()
+        stream = io.StringIO()
+        pstats.Stats(profiler, stream=stream).sort_stats('cumulative').print_stats(PROFILE_LINES)
+        result.text = stream.getvalue()
+        try:
+            result.path = export_dir() / f"profile-{datetime.now():%Y%m%d-%H%M%S}.prof"
+            profiler.dump_stats(result.path)
+        except OSError:
+            result.path = None
+
+
+atexit.register(flush)
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Panneau « ⏱️ Performances » de la barre latérale
+
+Affiche les spans de l'exécution en cours (scoutonze.perf), la durée
+médiane des dernières exécutions de la même page et, sur demande, le
+profil cProfile d'une exécution.
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from scoutonze import figures, perf
+
+
+def controls():
+    """Case d'affichage du panneau et bouton de profilage : (afficher, profiler cette exécution)"""
+    st.sidebar.markdown("---")
+    show = st.sidebar.checkbox("⏱️ Performances", value=False, disabled=not perf.ENABLED)
+    profile = show and st.sidebar.button("🔬 Profiler une exécution (cProfile)")
+    return show, profile
+
+
+def show(run_name, profiled=None):
+    """Spans de l'exécution en cours, historique de la page et profil éventuel"""
+    spans = perf.current_spans()
+    if spans:
+        st.markdown("**Exécution en cours**")
+        st.dataframe(pd.DataFrame({
+            'Span': [' ' * (s.depth - 1) + s.name for s in spans],
+            'ms': [round(s.seconds * 1000, 2) for s in spans],
+            'Lignes': [s.rows for s in spans],
+            'Ko': [round(s.bytes / 1024) for s in spans],
+        }), use_container_width=True, hide_index=True)
+
+    durations = [
+        record['spans'][0]['seconds'] * 1000 for record in perf.recent_runs() if record['run'] == run_name
+    ]
+    if durations:
+        st.caption(f"{len(durations)} dernières exécutions de la page : médiane {np.median(durations):.0f} ms, "
+                   f"max {max(durations):.0f} ms")
+    n_figures, size = figures.cache_info()
+    st.caption(f"Cache des figures : {n_figures} figures, {size / 1024 / 1024:.1f} Mo")
+    st.caption(f"Export : `{perf.export_dir()}` (perf.jsonl, metrics.prom)")
+
+    if profiled is not None and profiled.text:
+        st.markdown("**Profil cProfile de cette exécution**")
+        if profiled.path is not None:
+            st.caption(f"Fichier : `{profiled.path}` (snakeviz, pstats)")
+        st.code(profiled.text)
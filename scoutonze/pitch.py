@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Rendu du terrain et des compositions (Plotly)
+
+Le terrain (lignes, surfaces, rond central, légende) est une mise en page
+Plotly construite une seule fois. Les joueurs sont superposés en une seule
+trace scatter (marqueurs + score) et une trace de texte (noms, équipes),
+placés selon la formation. La figure obtenue est mémorisée par composition :
+tant que le XI ne change pas, le rendu ne coûte rien.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+import plotly.graph_objects as go
+
+FIELD_COLOR = '#1a5f3a'
+
+POSITION_COLORS = {'GK': '#ffd700', 'DEF': '#4169e1', 'MID': '#00ff87', 'FWD': '#ff4444'}
+
+# Terrain de 10 x 14 (le but défendu en bas)
+WIDTH, HEIGHT = 10, 14
+
+_LINE = dict(color='white', width=2)
+
+
+@lru_cache(maxsize=1)
+def field_layout():
+    """Mise en page du terrain vide (construite une fois)"""
+    segments = [
+        # Contour et ligne médiane
+        ((1, 0.5), (9, 0.5)), ((1, 13.5), (9, 13.5)), ((1, 0.5), (1, 13.5)), ((9, 0.5), (9, 13.5)),
+        ((1, 7), (9, 7)),
+        # Surfaces de réparation
+        ((2.5, 0.5), (2.5, 2.5)), ((7.5, 0.5), (7.5, 2.5)), ((2.5, 2.5), (7.5, 2.5)),
+        ((2.5, 13.5), (2.5, 11.5)), ((7.5, 13.5), (7.5, 11.5)), ((2.5, 11.5), (7.5, 11.5)),
+    ]
+    shapes = [
+        dict(type='line', x0=x0, y0=y0, x1=x1, y1=y1, line=_LINE, layer='below')
+        for (x0, y0), (x1, y1) in segments
+    ]
+    shapes.append(dict(type='circle', x0=3.8, y0=5.8, x1=6.2, y1=8.2, line=_LINE, layer='below'))
+
+    axis = dict(visible=False, fixedrange=True)
+    return go.Layout(
+        shapes=shapes,
+        xaxis=dict(axis, range=[0, WIDTH]),
+        yaxis=dict(axis, range=[-0.2, HEIGHT], scaleanchor='x', scaleratio=1),
+        plot_bgcolor=FIELD_COLOR,
+        paper_bgcolor=FIELD_COLOR,
+        margin=dict(l=10, r=10, t=10, b=10),
+        height=900,
+        showlegend=False,
+    )
+
+
+@lru_cache(maxsize=1)
+def legend_trace():
+    """Légende des couleurs de poste, en bas du terrain"""
+    xs = [1.5, 3.2, 5.0, 7.0]
+    return go.Scatter(
+        x=xs, y=[0.1] * 4,
+        mode='markers+text',
+        marker=dict(size=14, color=list(POSITION_COLORS.values())),
+        text=[f'<b>{position}</b>' for position in POSITION_COLORS],
+        textposition='middle right',
+        textfont=dict(color='white', size=12),
+        hoverinfo='skip',
+    )
+
+
+def formation_coordinates(formation):
+    """Coordonnées des 10 joueurs de champ, ligne par ligne (défense -> attaque)"""
+    lines = [int(n) for n in formation.split('-')]
+    ys = np.linspace(3.7, 10.5, len(lines))
+    coordinates = []
+    for count, y in zip(lines, ys):
+        spacing = min(2.2, 6.5 / (count - 1)) if count > 1 else 0
+        xs = 5 + (np.arange(count) - (count - 1) / 2) * spacing
+        coordinates.append([(float(x), float(y)) for x in xs])
+    return coordinates
+
+
+def _place(formation, positions):
+    """Coordonnées de chaque joueur selon son poste dans le XI.
+
+    Les milieux remplissent les lignes intermédiaires dans l'ordre des picks.
+    """
+    lines = formation_coordinates(formation)
+    queues = {
+        'GK': [(5.0, 1.5)],
+        'DEF': list(lines[0]),
+        'MID': [xy for line in lines[1:-1] for xy in line],
+        'FWD': list(lines[-1]),
+    }
+    return [queues[position].pop(0) for position in positions]
+
+
+@lru_cache(maxsize=256)
+def _render(formation, title, picks):
+    positions = [position for _, _, _, _, position in picks]
+    xs, ys = zip(*_place(formation, positions)) if picks else ((), ())
+
+    players = go.Scatter(
+        x=xs, y=ys,
+        mode='markers+text',
+        marker=dict(size=42, color=[POSITION_COLORS[p] for p in positions], line=dict(color='white', width=2)),
+        text=[f'<b>{score:.1f}</b>' for _, _, _, score, _ in picks],
+        textfont=dict(color='black', size=13),
+        hovertext=[f'{name} ({team}) - {score:.1f}' for _, name, team, score, _ in picks],
+        hoverinfo='text',
+    )
+    labels = go.Scatter(
+        x=xs, y=[y - 0.55 for y in ys],
+        mode='text',
+        text=[f'<b>{name}</b><br><i>{team}</i>' for _, name, team, _, _ in picks],
+        textposition='bottom center',
+        textfont=dict(color='white', size=11),
+        hoverinfo='skip',
+    )
+
+    fig = go.Figure(data=[players, labels, legend_trace()], layout=field_layout())
+    fig.add_annotation(
+        x=5, y=13.2, text=f'<b>{title}</b>', showarrow=False,
+        font=dict(color='white', size=18), bgcolor='black', bordercolor='white', borderwidth=2,
+    )
+    return fig
+
+
+def render_xi(formation, xi, title):
+    """Figure du XI `xi` (DataFrame avec `Poste_XI`), mémorisée par composition.
+
+    La figure retournée est partagée : ne pas la modifier.
+    """
+    picks = tuple(
+        (label, row['Joueur'], str(row['Equipe_principale']).split(',')[0], float(row['Score_Forme']), row['Poste_XI'])
+        for label, row in xi.iterrows()
+    )
+    return _render(formation, title, picks)
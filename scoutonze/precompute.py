@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Pré-calcul des compositions
+
+Calcule en lot, avec un pool de processus, les compositions de chaque
+équipe pour chaque formation (meilleur XI + alternatives) ainsi que le
+meilleur XI de la ligue, et les écrit dans un fichier Arrow compact
+(`données/.cache/lineups-<version>.arrow`). Les pages Streamlit se
+contentent ensuite de lire ce fichier ; sans fichier à jour, les
+compositions sont calculées à la demande.
+
+Usage : python -m scoutonze.precompute [--workers 4] [--options 4]
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby
+from pathlib import Path
+
+import pyarrow as pa
+
+from scoutonze.data_store import cache_dir, data_version, derived
+from scoutonze.lineup import FORMATIONS, Lineup, LineupSolver
+from scoutonze.ranking import get_ranking_index
+from scoutonze.teams import get_team_directory
+
+# Identifiant réservé au meilleur XI de la ligue (toutes équipes confondues)
+LEAGUE_ID = 0
+
+# Nombre de compositions conservées par équipe et par formation (meilleure + alternatives)
+DEFAULT_OPTIONS = 4
+
+# Tables dont dépendent les compositions
+SOURCE_TABLES = ['players', 'standings']
+
+
+def artifact_path(data_dir=None):
+    """Chemin du fichier de compositions pour la version actuelle des données"""
+    version = data_version(SOURCE_TABLES, data_dir)
+    return cache_dir(data_dir) / f'lineups-{version}.arrow'
+
+
+def solve_scope(team_id, formations=None, options=DEFAULT_OPTIONS, data_dir=None):
+    """Compositions d'une équipe (ou de la ligue) pour chaque formation.
+
+    Pour la ligue, les joueurs restent à leur poste naturel (meilleurs par poste).
+    """
+    ranking = get_ranking_index(data_dir)
+    if team_id == LEAGUE_ID:
+        solver = LineupSolver(ranking.players, secondary={})
+    else:
+        solver = LineupSolver(ranking.top(team=team_id))
+    return {
+        formation: solver.best(formation, k=options)
+        for formation in (formations or FORMATIONS)
+    }
+
+
+def _solve_task(args):
+    team_id, formations, options, data_dir = args
+    return team_id, solve_scope(team_id, formations, options, data_dir)
+
+
+def _to_table(results):
+    """Aplatit {team_id: {formation: [Lineup]}} en une table Arrow"""
+    columns = {name: [] for name in ['team_id', 'formation', 'option', 'total', 'player', 'position', 'value']}
+    for team_id, by_formation in sorted(results.items()):
+        for formation, lineups in by_formation.items():
+            for option, lineup in enumerate(lineups, start=1):
+                for player, position, value in lineup.picks:
+                    columns['team_id'].append(team_id)
+                    columns['formation'].append(formation)
+                    columns['option'].append(option)
+                    columns['total'].append(lineup.total)
+                    columns['player'].append(player)
+                    columns['position'].append(position)
+                    columns['value'].append(value)
+
+    return pa.table({
+        'team_id': pa.array(columns['team_id'], pa.int32()),
+        'formation': pa.array(columns['formation'], pa.string()).dictionary_encode(),
+        'option': pa.array(columns['option'], pa.int8()),
+        'total': pa.array(columns['total'], pa.float64()),
+        'player': pa.array(columns['player'], pa.int64()),
+        'position': pa.array(columns['position'], pa.string()).dictionary_encode(),
+        'value': pa.array(columns['value'], pa.float64()),
+    })
+
+
+def precompute(workers=None, options=DEFAULT_OPTIONS, data_dir=None):
+    """Calcule toutes les compositions et écrit le fichier. Retourne son chemin."""
+    path = artifact_path(data_dir)
+    team_ids = [LEAGUE_ID] + [int(team_id) for team_id in get_team_directory(data_dir).teams.index]
+    tasks = [(team_id, FORMATIONS, options, data_dir) for team_id in team_ids]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = dict(pool.map(_solve_task, tasks))
+
+    table = _to_table(results)
+    tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+    with pa.OSFile(str(tmp_path), 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, path)
+
+    # Supprimer les fichiers des versions précédentes
+    for stale in path.parent.glob('lineups-*.arrow'):
+        if stale != path:
+            stale.unlink(missing_ok=True)
+
+    return path
+
+
+def _read_artifact(path):
+    """{(team_id, formation): [Lineup]} lu depuis le fichier de compositions"""
+    source = pa.memory_map(str(path), 'r')
+    table = pa.ipc.open_file(source).read_all()
+    rows = zip(*(table.column(name).to_pylist() for name in
+                 ['team_id', 'formation', 'option', 'total', 'player', 'position', 'value']))
+
+    lineups = {}
+    for (team_id, formation, _, total), picks in groupby(rows, key=lambda row: row[:4]):
+        lineups.setdefault((team_id, formation), []).append(
+            Lineup(formation, total, tuple((player, position, value) for *_, player, position, value in picks))
+        )
+    return lineups
+
+
+def _precomputed(data_dir=None):
+    """Compositions pré-calculées pour la version actuelle des données ({} si absentes)"""
+    path = artifact_path(data_dir)
+    if not path.exists():
+        return {}
+    return derived(f'lineups:{path.name}', lambda *tables: _read_artifact(path), SOURCE_TABLES, data_dir)
+
+
+def get_lineups(team, formation, data_dir=None):
+    """Compositions d'une équipe (nom ou id, ou LEAGUE_ID) : lues, ou calculées à défaut.
+
+    LookupError si l'équipe est inconnue.
+    """
+    if team == LEAGUE_ID:
+        team_id = LEAGUE_ID
+    else:
+        directory = get_team_directory(data_dir)
+        team_id = directory.team_id(team)
+        if team_id is None or team_id not in directory.teams.index:
+            raise LookupError(f"Équipe inconnue : {team}")
+    lineups = _precomputed(data_dir).get((team_id, formation))
+    if lineups is None:
+        lineups = derived(
+            f'lineups:{team_id}:{formation}',
+            lambda *tables: solve_scope(team_id, [formation], data_dir=data_dir)[formation],
+            SOURCE_TABLES,
+            data_dir,
+        )
+    return lineups
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pré-calcul des compositions ScoutOnze")
+    parser.add_argument('--workers', type=int, default=None, help="processus (défaut : nombre de CPU)")
+    parser.add_argument('--options', type=int, default=DEFAULT_OPTIONS,
+                        help="compositions conservées par équipe et formation")
+    parser.add_argument('--data-dir', type=Path, default=None, help="dossier des données")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    path = precompute(args.workers, args.options, args.data_dir)
+    table_rows = pa.ipc.open_file(pa.memory_map(str(path), 'r')).read_all().num_rows
+    print(f"✅ {table_rows} lignes ({len(FORMATIONS)} formations) écrites dans {path} "
+          f"en {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == '__main__':
+    main()
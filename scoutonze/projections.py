@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Projections de fin de saison des buteurs
+
+Les buts restants de chaque joueur sont simulés sur le calendrier restant
+(`matches_scheduled.csv`), match par match :
+- le joueur joue un match avec la probabilité Matchs / matchs joués par son
+  équipe (disponibilité) ;
+- s'il joue, ses buts suivent une loi de Poisson de paramètre
+  buts par 90 min x part des minutes x faiblesse défensive de l'adversaire
+  x avantage du terrain.
+
+La loi des buts restants de chaque joueur est obtenue exactement en
+convoluant les lois de ses matchs, pour tous les joueurs à la fois
+(tableau joueurs x matchs x buts). Les simulations tirent ensuite dans ces
+lois par inversion de la fonction de répartition : même résultat qu'un
+tirage match par match, pour un seul tirage par joueur et par simulation.
+Le résultat (quantiles, probabilité de finir meilleur buteur) est mémorisé
+par version des données.
+"""
+
+import numpy as np
+import pandas as pd
+
+from scoutonze.data_store import derived
+from scoutonze.features import get_features
+from scoutonze.teams import get_team_directory
+
+DEFAULT_SIMS = 100_000
+
+# Tirages (joueurs x simulations) faits à la fois : borne la mémoire quel que soit l'effectif
+SIM_CELLS = 5_000_000
+
+# Nombre de buts maximal modélisé sur le reste de la saison (au-delà : tronqué)
+MAX_GOALS = 40
+
+# Probabilité en deçà de laquelle un nombre de buts n'est plus tiré
+SUPPORT_EPSILON = 1e-12
+
+# Minutes (en matchs de 90 min) de la moyenne du poste ajoutées au taux de chaque joueur
+PRIOR_90S = 3.0
+
+HOME_FACTOR = 1.1
+AWAY_FACTOR = 1 / HOME_FACTOR
+
+QUANTILES = {'P10': 0.1, 'P50': 0.5, 'P90': 0.9}
+
+SEED = 2025
+
+
+def _goal_rates(features):
+    """Buts par 90 minutes, rapprochés de la moyenne du poste pour les petits temps de jeu"""
+    nineties = features['Minutes'].to_numpy(dtype=float) / 90
+    goals = features['Buts'].to_numpy(dtype=float)
+    by_position = pd.DataFrame({'goals': goals, 'nineties': nineties}).groupby(
+        features['Poste_simplifie'].to_numpy()
+    ).transform('sum')
+    position_rate = np.divide(
+        by_position['goals'].to_numpy(), by_position['nineties'].to_numpy(),
+        out=np.zeros(len(goals)), where=by_position['nineties'].to_numpy() > 0,
+    )
+    return (goals + PRIOR_90S * position_rate) / (nineties + PRIOR_90S)
+
+
+def fixture_rates(features, teams, standings, scheduled):
+    """Buts attendus de chaque joueur dans chacun de ses matchs restants, s'il joue.
+
+    Retourne (taux joueurs x matchs, disponibilité par joueur, matchs restants
+    par joueur). Les cases au-delà des matchs d'un joueur valent 0.
+    """
+    standings = standings.set_index('team_id')
+    played = standings['played_games'].to_numpy(dtype=float)
+    conceded = np.divide(standings['goals_against'].to_numpy(dtype=float), played,
+                         out=np.zeros(len(played)), where=played > 0)
+    weakness = pd.Series(conceded / conceded.mean(), index=standings.index)
+
+    # Matchs restants de chaque équipe : (adversaire, facteur terrain)
+    fixtures = pd.concat([
+        pd.DataFrame({'team_id': scheduled['home_team_id'], 'opponent': scheduled['away_team_id'],
+                      'venue': HOME_FACTOR}),
+        pd.DataFrame({'team_id': scheduled['away_team_id'], 'opponent': scheduled['home_team_id'],
+                      'venue': AWAY_FACTOR}),
+    ], ignore_index=True)
+    fixtures['factor'] = fixtures['venue'] * fixtures['opponent'].map(weakness).fillna(1.0)
+    by_team = {int(team_id): group['factor'].to_numpy() for team_id, group in fixtures.groupby('team_id')}
+
+    team_ids = teams.primary_team_id
+    n_fixtures = np.array([len(by_team.get(int(t), ())) for t in team_ids])
+    factors = np.zeros((len(team_ids), max(n_fixtures.max(initial=0), 1)))
+    for row, team_id in enumerate(team_ids):
+        team_factors = by_team.get(int(team_id))
+        if team_factors is not None:
+            factors[row, :len(team_factors)] = team_factors
+
+    team_played = pd.Series(team_ids).map(standings['played_games']).to_numpy(dtype=float)
+    matchs = features['Matchs'].to_numpy(dtype=float)
+    availability = np.clip(np.divide(matchs, team_played, out=np.zeros(len(matchs)), where=team_played > 0), 0, 1)
+
+    minutes_share = np.clip(features['Pct_temps_jeu'].to_numpy(dtype=float) / 100, 0, 1)
+    rates = (_goal_rates(features) * minutes_share)[:, None] * factors
+    return rates, availability, n_fixtures
+
+
+def goal_distributions(rates, availability, max_goals=MAX_GOALS):
+    """Loi exacte des buts restants (joueurs x 0..max_goals).
+
+    Chaque match est un mélange : 0 but si le joueur ne joue pas, Poisson(taux) sinon.
+    """
+    goals = np.arange(max_goals + 1)
+    log_factorial = np.concatenate([[0.0], np.cumsum(np.log(goals[1:]))])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_rates = np.log(rates)[..., None]
+        per_match = np.exp(goals * log_rates - rates[..., None] - log_factorial)
+    per_match[rates == 0] = 0.0
+    per_match *= availability[:, None, None]
+    per_match[..., 0] += 1 - availability[:, None] * (rates > 0)
+
+    pmf = np.zeros((len(rates), max_goals + 1))
+    pmf[:, 0] = 1.0
+    for match in range(rates.shape[1]):
+        step = per_match[:, match]
+        new = np.zeros_like(pmf)
+        for g in range(max_goals + 1):
+            new[:, g:] += pmf[:, g, None] * step[:, :max_goals + 1 - g]
+        pmf = new
+
+    # Masse tronquée reportée sur le dernier cas
+    pmf[:, -1] += np.clip(1 - pmf.sum(axis=1), 0, None)
+    return pmf
+
+
+def simulate(pmf, current_goals, n_sims=DEFAULT_SIMS, seed=SEED):
+    """Tire `n_sims` fins de saison.
+
+    Retourne (histogramme joueurs x buts restants, probabilité de finir
+    meilleur buteur, égalités partagées).
+    """
+    n_players, width = pmf.shape
+    cdf = np.cumsum(pmf, axis=1)
+    cdf[:, -1] = 1.0
+
+    # Inversion de la répartition : buts = nombre de seuils cdf[g] dépassés par le
+    # tirage. Les joueurs sont rangés par support décroissant, pour ne comparer
+    # à chaque seuil g que ceux qui peuvent encore le dépasser.
+    support = (cdf < 1 - SUPPORT_EPSILON).sum(axis=1)
+    order = np.argsort(-support, kind='stable')
+    cdf, support = cdf[order], support[order]
+    active = [int((support > g).sum()) for g in range(support.max(initial=0))]
+    current_goals = np.asarray(current_goals, dtype=np.int16)[order, None]
+    offsets = np.arange(n_players)[:, None] * width
+
+    rng = np.random.default_rng(seed)
+    counts = np.zeros(n_players * width, dtype=np.int64)
+    wins = np.zeros(n_players)
+    chunk = max(1, SIM_CELLS // max(n_players, 1))
+    for start in range(0, n_sims, chunk):
+        draws = rng.random((n_players, min(chunk, n_sims - start)))
+        goals = np.zeros(draws.shape, dtype=np.int16)
+        for g, rows in enumerate(active):
+            goals[:rows] += draws[:rows] > cdf[:rows, g, None]
+        counts += np.bincount((goals + offsets).ravel(), minlength=n_players * width)
+
+        final = goals + current_goals
+        leaders = final == final.max(axis=0)
+        wins += (leaders / leaders.sum(axis=0)).sum(axis=1)
+
+    inverse = np.argsort(order)
+    return counts.reshape(n_players, width)[inverse], wins[inverse] / n_sims
+
+
+def _quantile(counts, q):
+    """Quantile q de chaque ligne d'un histogramme"""
+    cumulative = np.cumsum(counts, axis=1)
+    return (cumulative < q * cumulative[:, -1:]).sum(axis=1)
+
+
+def build_projections(features, teams, standings, scheduled, n_sims=DEFAULT_SIMS):
+    """Projection de fin de saison de chaque joueur (indexée comme `features`)"""
+    rates, availability, n_fixtures = fixture_rates(features, teams, standings, scheduled)
+    pmf = goal_distributions(rates, availability)
+    counts, golden_boot = simulate(pmf, features['Buts'].to_numpy(), n_sims)
+
+    current = features['Buts'].to_numpy()
+    remaining = counts @ np.arange(counts.shape[1]) / n_sims
+    columns = {
+        'Matchs_restants': n_fixtures,
+        'Disponibilite': availability,
+        'Buts_restants': remaining,
+        'Projection_buts': current + remaining,
+    }
+    for name, q in QUANTILES.items():
+        columns[f'Projection_{name}'] = current + _quantile(counts, q)
+    columns['Proba_meilleur_buteur'] = golden_boot
+    return pd.DataFrame(columns, index=features.index)
+
+
+def get_projections(n_sims=DEFAULT_SIMS, data_dir=None):
+    """Projections de fin de saison, simulées une fois par version des données"""
+    return derived(
+        f'projections:{n_sims}',
+        lambda players, standings, scheduled: build_projections(
+            get_features(data_dir), get_team_directory(data_dir), standings, scheduled, n_sims,
+        ),
+        ['players', 'standings', 'scheduled'],
+        data_dir,
+    )
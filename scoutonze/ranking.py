@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Index de classement par score de forme
+
+Les joueurs sont triés une seule fois par `Score_Forme` (globalement, par
+poste, par équipe et par équipe + poste). Les pages lisent ensuite des
+tranches de ces ordres au lieu de refaire `nlargest` sur tout le DataFrame :
+top-k en O(k), rang au poste en O(1).
+"""
+
+import numpy as np
+
+from scoutonze.data_store import derived
+from scoutonze.features import get_features
+from scoutonze.teams import get_team_directory
+
+SCORE_COL = 'Score_Forme'
+
+
+def _group_orders(keys, scores, rows=None):
+    """Ordonne `rows` par clé puis par score décroissant, et découpe par clé.
+
+    À score égal, l'ordre d'origine est conservé (comme `nlargest`).
+    """
+    if rows is None:
+        rows = np.arange(len(keys))
+    if len(rows) == 0:
+        return {}
+
+    uniques, codes = np.unique(keys, return_inverse=True)
+    order = np.lexsort((-scores[rows], codes))
+    bounds = np.flatnonzero(np.diff(codes[order])) + 1
+    return {uniques[codes[chunk[0]]].item(): rows[chunk] for chunk in np.split(order, bounds)}
+
+
+class RankingIndex:
+    """Classements pré-calculés d'un DataFrame de joueurs"""
+
+    def __init__(self, players, teams):
+        self.players = players
+        self.teams = teams
+        scores = players[SCORE_COL].to_numpy(dtype=float)
+        positions = players['Poste_simplifie'].to_numpy(dtype=object)
+
+        self.order = np.argsort(-scores, kind='stable')
+        self.by_position = _group_orders(positions.astype(str), scores)
+
+        # Un joueur passé par plusieurs clubs apparaît dans chacun d'eux
+        member_rows = players.index.get_indexer(teams.membership['player'])
+        member_teams = teams.membership['team_id'].to_numpy()
+        self.by_team = _group_orders(member_teams, scores, member_rows)
+
+        self.by_team_position = {}
+        for team_id, rows in self.by_team.items():
+            team_positions = positions[rows]
+            for position in np.unique(team_positions):
+                self.by_team_position[(team_id, position)] = rows[team_positions == position]
+
+        # Rang de compétition au poste (1 + nombre de joueurs strictement meilleurs)
+        self.position_rank = np.zeros(len(players), dtype=np.int64)
+        self.position_size = {}
+        self.position_mean = {}
+        for position, rows in self.by_position.items():
+            sorted_scores = -scores[rows]
+            self.position_rank[rows] = np.searchsorted(sorted_scores, sorted_scores, side='left') + 1
+            self.position_size[position] = len(rows)
+            self.position_mean[position] = float(scores[rows].mean())
+
+    def rows(self, position=None, team=None):
+        """Positions de lignes triées par score décroissant"""
+        if team is not None:
+            team_id = self.teams.team_id(team)
+            if position is not None:
+                return self.by_team_position.get((team_id, position), np.empty(0, dtype=np.int64))
+            return self.by_team.get(team_id, np.empty(0, dtype=np.int64))
+        if position is not None:
+            return self.by_position.get(position, np.empty(0, dtype=np.int64))
+        return self.order
+
+    def top(self, k=None, position=None, team=None):
+        """Les `k` meilleurs joueurs (tous si `k` est None), triés par score"""
+        return self.players.iloc[self.rows(position, team)[:k]]
+
+    def rank(self, label):
+        """(rang au poste, effectif du poste) du joueur d'index `label`"""
+        row = self.players.index.get_loc(label)
+        position = str(self.players['Poste_simplifie'].iat[row])
+        return int(self.position_rank[row]), self.position_size[position]
+
+
+def get_ranking_index(data_dir=None):
+    """Index de classement des joueurs (lignes des features), partagé entre les sessions"""
+    return derived(
+        'ranking',
+        lambda players, standings: RankingIndex(get_features(data_dir), get_team_directory(data_dir)),
+        ['players', 'standings'],
+        data_dir,
+    )
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Calendrier des matchs restants
+
+Le calendrier est trié par date une seule fois, avec ses colonnes
+d'affichage déjà formatées, et indexé par journée et par équipe
+(positions de lignes). Un filtre journée / équipe puis une page de
+résultats ne sont qu'une intersection de tableaux et une tranche.
+"""
+
+import numpy as np
+import pandas as pd
+
+from scoutonze.data_store import derived
+from scoutonze.difficulty import short_name
+
+PAGE_SIZE = 20
+
+_ALL = np.empty(0, dtype=np.int64)
+
+
+def _positions(keys):
+    """{clé: positions de lignes (croissantes)}"""
+    return {key.item(): rows for key, rows in pd.Series(np.arange(len(keys))).groupby(keys).indices.items()}
+
+
+class FixtureList:
+    """Matchs restants triés par date, filtrables par journée et par équipe"""
+
+    def __init__(self, scheduled):
+        fixtures = scheduled.sort_values(['datetime', 'match_id'], kind='stable')
+        self.frame = pd.DataFrame({
+            'Journée': fixtures['matchday'].to_numpy(),
+            'Date': fixtures['datetime'].dt.strftime('%d/%m/%Y %H:%M').to_numpy(),
+            'Domicile': [short_name(name) for name in fixtures['home_team_name'].astype(str)],
+            'Extérieur': [short_name(name) for name in fixtures['away_team_name'].astype(str)],
+        })
+
+        self.matchdays = np.sort(fixtures['matchday'].unique())
+        self.by_matchday = _positions(fixtures['matchday'].to_numpy())
+
+        # Un match apparaît pour ses deux équipes
+        home = self.frame['Domicile'].to_numpy()
+        away = self.frame['Extérieur'].to_numpy()
+        self.teams = sorted(set(home) | set(away))
+        self.by_team = {
+            team: np.union1d(np.flatnonzero(home == team), np.flatnonzero(away == team))
+            for team in self.teams
+        }
+
+    def rows(self, matchday=None, team=None):
+        """Positions des matchs retenus par les filtres, dans l'ordre des dates"""
+        rows = None
+        if matchday is not None:
+            rows = self.by_matchday.get(matchday, _ALL)
+        if team is not None:
+            team_rows = self.by_team.get(team, _ALL)
+            rows = team_rows if rows is None else np.intersect1d(rows, team_rows, assume_unique=True)
+        return np.arange(len(self.frame)) if rows is None else rows
+
+    def page(self, page=1, page_size=PAGE_SIZE, matchday=None, team=None):
+        """(matchs de la page `page`, nombre total de matchs retenus)"""
+        rows = self.rows(matchday, team)
+        start = (max(page, 1) - 1) * page_size
+        return self.frame.iloc[rows[start:start + page_size]], len(rows)
+
+
+def get_fixture_list(data_dir=None):
+    """Calendrier trié et indexé, partagé entre les sessions"""
+    return derived('fixtures', FixtureList, ['scheduled'], data_dir)
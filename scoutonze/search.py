@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Recherche de joueurs approximative
+
+Index construit une seule fois au chargement sur les noms normalisés
+(minuscules, sans accents : "Ødegaard" -> "odegaard") :
+- un index de trigrammes (trigramme -> joueurs) pour la tolérance aux fautes,
+- un index de préfixes (mots triés) pour la saisie en cours de frappe.
+
+Une requête ne parcourt que les listes des trigrammes qu'elle contient.
+"""
+
+import unicodedata
+
+import numpy as np
+
+from scoutonze.data_store import derived
+from scoutonze.features import get_features
+
+DEFAULT_LIMIT = 20
+
+# Lettres que la décomposition Unicode ne ramène pas à l'ASCII
+_SPECIAL_LETTERS = str.maketrans({
+    'ø': 'o', 'æ': 'ae', 'œ': 'oe', 'ß': 'ss', 'ł': 'l', 'đ': 'd', 'ð': 'd', 'þ': 'th', 'ı': 'i',
+})
+
+# Score minimal (similarité de trigrammes) pour une correspondance approximative
+MIN_SIMILARITY = 0.4
+
+# Poids de la part de la requête retrouvée dans le nom
+CONTAINMENT_WEIGHT = 0.75
+
+# Nombre maximal de joueurs examinés par requête via les trigrammes rares
+CANDIDATE_BUDGET = 2000
+
+
+def fold(text):
+    """Texte en minuscules, sans accents ni ponctuation"""
+    text = str(text).lower().translate(_SPECIAL_LETTERS)
+    text = unicodedata.normalize('NFKD', text)
+    text = ''.join(c if c.isalnum() else ' ' for c in text if not unicodedata.combining(c))
+    return ' '.join(text.split())
+
+
+def trigrams(folded):
+    """Trigrammes d'un texte normalisé, bordés d'espaces"""
+    padded = f'  {folded} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class PlayerSearchIndex:
+    """Index trigrammes + préfixes sur la colonne `Joueur`"""
+
+    def __init__(self, players, column='Joueur', tiebreak='Score_Forme'):
+        self.players = players
+        self.names = [fold(name) for name in players[column]]
+        # À pertinence égale, les joueurs les plus en forme d'abord
+        self.tiebreak = players[tiebreak].to_numpy(dtype=float)
+
+        postings = {}
+        self.trigram_counts = np.zeros(len(self.names), dtype=np.int32)
+        for doc, name in enumerate(self.names):
+            grams = trigrams(name)
+            self.trigram_counts[doc] = len(grams)
+            for gram in grams:
+                postings.setdefault(gram, []).append(doc)
+        self.postings = {gram: np.array(docs, dtype=np.int32) for gram, docs in postings.items()}
+
+        # Index de préfixes : chaque mot du nom, trié
+        words = [(word, doc) for doc, name in enumerate(self.names) for word in name.split()]
+        words.sort()
+        self.words = np.array([word for word, _ in words], dtype=str)
+        self.word_docs = np.array([doc for _, doc in words], dtype=np.int32)
+
+    def _prefix_docs(self, token):
+        """Joueurs dont un mot commence par `token`"""
+        # Une clé plus longue que le dtype forcerait numpy à convertir tout le tableau
+        width = self.words.dtype.itemsize // 4
+        if len(token) > width:
+            return self.word_docs[:0]
+        lo = np.searchsorted(self.words, token, side='left')
+        if len(token) == width:
+            hi = np.searchsorted(self.words, token, side='right')
+        else:
+            hi = np.searchsorted(self.words, token + '\uffff', side='left')
+        return self.word_docs[lo:hi]
+
+    def search_rows(self, query, limit=DEFAULT_LIMIT):
+        """Positions de lignes des meilleurs résultats, par pertinence décroissante"""
+        folded = fold(query)
+        if not folded:
+            return np.empty(0, dtype=np.int64)
+
+        # Trigrammes en commun avec chaque joueur (listes sans doublon : += suffit)
+        query_grams = trigrams(folded)
+        grams = sorted((g for g in query_grams if g in self.postings), key=lambda g: len(self.postings[g]))
+        hits = np.zeros(len(self.names), dtype=np.int16)
+        for gram in grams:
+            hits[self.postings[gram]] += 1
+
+        # Candidats : joueurs des trigrammes les plus rares + correspondances de préfixe
+        prefix_match = None
+        for token in folded.split():
+            docs = self._prefix_docs(token)
+            prefix_match = docs if prefix_match is None else np.intersect1d(prefix_match, docs)
+        pools, budget = [prefix_match], CANDIDATE_BUDGET
+        for gram in grams:
+            if len(pools) > 1 and len(self.postings[gram]) > budget:
+                break
+            pools.append(self.postings[gram])
+            budget -= len(self.postings[gram])
+        candidates = np.unique(np.concatenate(pools))
+
+        # Similarité : Jaccard, ou part de la requête retrouvée dans le nom (un nom
+        # de famille seul face à un nom complet), + 1 si chaque mot de la requête
+        # débute un mot du nom
+        shared = hits[candidates]
+        similarity = np.maximum(
+            shared / (len(query_grams) + self.trigram_counts[candidates] - shared),
+            CONTAINMENT_WEIGHT * shared / len(query_grams),
+        )
+        is_prefix = np.zeros(len(self.names), dtype=bool)
+        is_prefix[prefix_match] = True
+        score = similarity + is_prefix[candidates]
+
+        keep = score >= MIN_SIMILARITY
+        candidates, score = candidates[keep], score[keep]
+        if limit is not None and len(candidates) > limit:
+            best = np.argpartition(-score, limit - 1)[:limit]
+            candidates, score = candidates[best], score[best]
+
+        order = np.lexsort((candidates, -self.tiebreak[candidates], -score))
+        return candidates[order].astype(np.int64)
+
+    def search(self, query, limit=DEFAULT_LIMIT):
+        """Joueurs correspondant à `query`, par pertinence décroissante"""
+        return self.players.iloc[self.search_rows(query, limit)]
+
+
+def get_search_index(data_dir=None):
+    """Index de recherche des joueurs (lignes des features), partagé entre les sessions"""
+    return derived('search', lambda players: PlayerSearchIndex(get_features(data_dir)), ['players'], data_dir)
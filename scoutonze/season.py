@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Simulation du classement final
+
+Les forces d'attaque et de défense des équipes sont ajustées (modèle de
+Poisson multiplicatif) sur les buts de la saison (`standings.csv`) et,
+avec un poids plus fort, sur les derniers résultats (`matches_recent.csv`).
+Tous les matchs restants (`matches_scheduled.csv`) sont ensuite simulés
+un grand nombre de fois, en tableaux NumPy simulations x matchs puis
+simulations x équipes. On en tire la probabilité de chaque place finale,
+les chances de titre, de top 4 et de relégation.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from scoutonze.data_store import derived
+
+DEFAULT_SEASONS = 50_000
+
+# Saisons simulées à la fois (mémoire : SEASON_CHUNK x matchs)
+SEASON_CHUNK = 10_000
+
+# Poids d'un match récent par rapport à un match quelconque de la saison
+RECENT_WEIGHT = 2.0
+
+# Itérations de l'ajustement des forces
+FIT_ITERATIONS = 50
+
+# Places qualificatives et places de relégation
+TOP_PLACES = 4
+RELEGATION_PLACES = 3
+
+SEED = 2025
+
+# Forces ajustées : DataFrame (attack, defence) par team_id, buts moyens et avantage du terrain
+Strengths = namedtuple('Strengths', ['teams', 'base', 'home'])
+
+# Résultat : probabilités des places (équipes x places) et résumé par équipe
+SeasonOutlook = namedtuple('SeasonOutlook', ['positions', 'summary'])
+
+
+def _recent_matches(recent, team_ids):
+    """Matchs récents terminés en indices d'équipes : (domicile, extérieur, buts dom., buts ext.)"""
+    finished = recent[recent['Statut'].astype(str) == 'FINISHED']
+    home = team_ids.reindex(finished['Equipe_Domicile'].astype(str)).to_numpy()
+    away = team_ids.reindex(finished['Equipe_Exterieur'].astype(str)).to_numpy()
+    known = ~(np.isnan(home) | np.isnan(away))
+    return (
+        home[known].astype(np.int64),
+        away[known].astype(np.int64),
+        finished['Score_Domicile'].to_numpy(dtype=float)[known],
+        finished['Score_Exterieur'].to_numpy(dtype=float)[known],
+    )
+
+
+def fit_strengths(standings, recent):
+    """Forces d'attaque et de défense (moyenne 1) de chaque équipe du classement.
+
+    Buts attendus de A à domicile contre B : base x home x attaque(A) x défense(B),
+    à l'extérieur : base / home x attaque(A) x défense(B). Les totaux de la
+    saison comptent comme des matchs contre un adversaire moyen.
+    """
+    n_teams = len(standings)
+    team_ids = pd.Series(np.arange(n_teams), index=standings['team_name'].astype(str))
+    home, away, home_goals, away_goals = _recent_matches(recent, team_ids)
+
+    played = standings['played_games'].to_numpy(dtype=float)
+    scored = standings['goals_for'].to_numpy(dtype=float)
+    conceded = standings['goals_against'].to_numpy(dtype=float)
+    base = scored.sum() / max(played.sum(), 1)
+
+    # Avantage du terrain estimé sur les matchs récents (racine du rapport dom./ext.)
+    home_factor = np.sqrt((home_goals.sum() + 1) / (away_goals.sum() + 1))
+
+    weight = RECENT_WEIGHT
+    goals_for = scored + weight * (
+        np.bincount(home, home_goals, n_teams) + np.bincount(away, away_goals, n_teams))
+    goals_against = conceded + weight * (
+        np.bincount(home, away_goals, n_teams) + np.bincount(away, home_goals, n_teams))
+
+    attack = np.ones(n_teams)
+    defence = np.ones(n_teams)
+    for _ in range(FIT_ITERATIONS):
+        # Buts attendus à force unitaire, compte tenu des adversaires rencontrés
+        exposure = base * (played + weight * (
+            np.bincount(home, home_factor * defence[away], n_teams)
+            + np.bincount(away, defence[home] / home_factor, n_teams)))
+        attack = goals_for / exposure
+        attack /= attack.mean()
+
+        exposure = base * (played + weight * (
+            np.bincount(away, home_factor * attack[home], n_teams)
+            + np.bincount(home, attack[away] / home_factor, n_teams)))
+        defence = goals_against / exposure
+        defence /= defence.mean()
+
+    teams = pd.DataFrame({
+        'team_name': standings['team_name'].astype(str).to_numpy(),
+        'attack': attack,
+        'defence': defence,
+    }, index=standings['team_id'].to_numpy())
+    return Strengths(teams, base, home_factor)
+
+
+def simulate_season(standings, scheduled, strengths, n_sims=DEFAULT_SEASONS, seed=SEED):
+    """Simule `n_sims` fins de saison. Retourne un SeasonOutlook."""
+    team_ids = standings['team_id'].to_numpy()
+    n_teams = len(team_ids)
+    index = pd.Series(np.arange(n_teams), index=team_ids)
+    home = index.reindex(scheduled['home_team_id'].to_numpy()).to_numpy()
+    away = index.reindex(scheduled['away_team_id'].to_numpy()).to_numpy()
+    known = ~(np.isnan(home) | np.isnan(away))
+    home, away = home[known].astype(np.int64), away[known].astype(np.int64)
+
+    attack = strengths.teams['attack'].reindex(team_ids).to_numpy()
+    defence = strengths.teams['defence'].reindex(team_ids).to_numpy()
+    home_rate = strengths.base * strengths.home * attack[home] * defence[away]
+    away_rate = strengths.base / strengths.home * attack[away] * defence[home]
+
+    # Matrices d'incidence matchs x équipes
+    home_of = np.zeros((len(home), n_teams), dtype=np.float32)
+    away_of = np.zeros((len(away), n_teams), dtype=np.float32)
+    home_of[np.arange(len(home)), home] = 1
+    away_of[np.arange(len(away)), away] = 1
+
+    points_now = standings['points'].to_numpy(dtype=float)
+    goal_diff_now = standings['goal_difference'].to_numpy(dtype=float)
+    goals_now = standings['goals_for'].to_numpy(dtype=float)
+
+    rng = np.random.default_rng(seed)
+    position_counts = np.zeros(n_teams * n_teams, dtype=np.int64)
+    points_total = np.zeros(n_teams)
+    for start in range(0, n_sims, SEASON_CHUNK):
+        size = min(SEASON_CHUNK, n_sims - start)
+        home_goals = rng.poisson(home_rate, (size, len(home))).astype(np.float32)
+        away_goals = rng.poisson(away_rate, (size, len(away))).astype(np.float32)
+
+        home_points = 3 * (home_goals > away_goals) + (home_goals == away_goals)
+        away_points = 3 * (away_goals > home_goals) + (home_goals == away_goals)
+        points = points_now + home_points.astype(np.float32) @ home_of + away_points.astype(np.float32) @ away_of
+        margin = home_goals - away_goals
+        goal_diff = goal_diff_now + margin @ home_of - margin @ away_of
+        goals = goals_now + home_goals @ home_of + away_goals @ away_of
+
+        # Départage : points, différence de buts, buts marqués, puis tirage au sort
+        key = points * 1e6 + goal_diff * 1e3 + goals + rng.random((size, n_teams))
+        order = np.argsort(-key, axis=1)
+        places = np.empty_like(order)
+        np.put_along_axis(places, order, np.arange(n_teams), axis=1)
+        position_counts += np.bincount((np.arange(n_teams) * n_teams + places).ravel(),
+                                       minlength=n_teams * n_teams)
+        points_total += points.sum(axis=0)
+
+    probabilities = position_counts.reshape(n_teams, n_teams) / n_sims
+    names = standings['team_name'].astype(str).to_numpy()
+    positions = pd.DataFrame(probabilities, index=pd.Index(names, name='Equipe'),
+                             columns=pd.RangeIndex(1, n_teams + 1, name='Place'))
+    summary = pd.DataFrame({
+        'Equipe': names,
+        'Points': points_now,
+        'Points_projetes': points_total / n_sims,
+        'Place_moyenne': probabilities @ np.arange(1, n_teams + 1),
+        'Proba_titre': probabilities[:, 0],
+        'Proba_top4': probabilities[:, :TOP_PLACES].sum(axis=1),
+        'Proba_relegation': probabilities[:, n_teams - RELEGATION_PLACES:].sum(axis=1),
+        'Attaque': attack,
+        'Defense': defence,
+    }, index=pd.Index(team_ids, name='team_id')).sort_values('Place_moyenne')
+    return SeasonOutlook(positions.loc[summary['Equipe']], summary)
+
+
+def build_outlook(standings, scheduled, recent, n_sims=DEFAULT_SEASONS):
+    """Forces ajustées puis simulation des matchs restants"""
+    return simulate_season(standings, scheduled, fit_strengths(standings, recent), n_sims)
+
+
+def get_season_outlook(n_sims=DEFAULT_SEASONS, data_dir=None):
+    """Classement final simulé, recalculé une fois par version des données"""
+    return derived(
+        f'season:{n_sims}',
+        lambda standings, scheduled, recent: build_outlook(standings, scheduled, recent, n_sims),
+        ['standings', 'scheduled', 'recent'],
+        data_dir,
+    )
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Couche de services
+
+Les calculs du tableau de bord (top joueurs, meilleur XI, analyse d'équipe,
+projections, talents cachés) sous forme de fonctions Python pures, sans
+Streamlit. Elles retournent des DataFrames ou des dictionnaires et
+s'appuient sur les index partagés (classement, compositions, simulations),
+donc sur leurs caches par version des données.
+
+L'interface Streamlit et l'API HTTP (`scoutonze.api`) en sont deux clients.
+Paramètre invalide : ValueError ; équipe inconnue : LookupError.
+"""
+
+from scoutonze.data_store import TABLES, data_version, table_exists
+from scoutonze.filters import get_filter_engine
+from scoutonze.history import get_match_history
+from scoutonze.leaderboard import PAGE_SIZE, SORT_COLUMNS, get_leaderboard
+from scoutonze.lineup import FORMATIONS, POSITIONS, lineup_frame
+from scoutonze.precompute import LEAGUE_ID, get_lineups
+from scoutonze.projections import get_projections
+from scoutonze.ranking import get_ranking_index
+from scoutonze.season import get_season_outlook
+from scoutonze.teams import get_team_directory
+
+# Colonnes des joueurs exposées par les services
+PLAYER_COLUMNS = ['Joueur', 'Equipe_principale', 'Poste_simplifie', 'Score_Forme', 'Matchs', 'Minutes',
+                  'Buts', 'Passes_decisives']
+
+MAX_TOP = 500
+
+MAX_PAGE_SIZE = 100
+
+
+def current_version(data_dir=None):
+    """Version des données présentes sur disque (toutes tables confondues)"""
+    return data_version([name for name in TABLES if table_exists(name, data_dir)], data_dir)
+
+
+def _position(position):
+    if position is not None and position not in POSITIONS:
+        raise ValueError(f"Poste inconnu : {position} (attendu : {', '.join(POSITIONS)})")
+    return position
+
+
+def _team_id(team, data_dir):
+    if team is None:
+        return None
+    team_id = get_team_directory(data_dir).team_id(team)
+    if team_id is None or team_id not in get_team_directory(data_dir).teams.index:
+        raise LookupError(f"Équipe inconnue : {team}")
+    return team_id
+
+
+def teams(data_dir=None):
+    """Noms courts des équipes"""
+    return get_team_directory(data_dir).names()
+
+
+def top_players(k=10, position=None, team=None, data_dir=None):
+    """Les `k` meilleurs joueurs (d'un poste, d'une équipe), triés par score"""
+    if not 1 <= k <= MAX_TOP:
+        raise ValueError(f"k doit être compris entre 1 et {MAX_TOP}")
+    return get_ranking_index(data_dir).top(k, _position(position), _team_id(team, data_dir))
+
+
+def leaderboard(sort='Score_Forme', ascending=False, page=1, page_size=PAGE_SIZE, position=None, team=None,
+                data_dir=None):
+    """Page `page` du classement de tous les joueurs (d'un poste, d'une équipe) trié sur `sort`.
+
+    Retourne {'total', 'page', 'pages', 'players'} ; `players` a une colonne `Rang`.
+    """
+    if sort not in SORT_COLUMNS:
+        raise ValueError(f"Tri inconnu : {sort} (attendu : {', '.join(SORT_COLUMNS)})")
+    if not 1 <= page_size <= MAX_PAGE_SIZE:
+        raise ValueError(f"page_size doit être compris entre 1 et {MAX_PAGE_SIZE}")
+    players, total = get_leaderboard(data_dir).page(
+        sort, ascending, page, page_size, _position(position), _team_id(team, data_dir)
+    )
+    pages = max(-(-total // page_size), 1)
+    if not 1 <= page <= pages:
+        raise ValueError(f"page doit être comprise entre 1 et {pages}")
+    columns = ['Rang'] + PLAYER_COLUMNS + [sort] * (sort not in PLAYER_COLUMNS)
+    return {'total': total, 'page': page, 'pages': pages, 'players': players[columns]}
+
+
+def best_xi(formation='4-3-3', team=None, option=1, data_dir=None):
+    """Composition `option` (1 = la meilleure) d'une équipe, ou de la ligue si `team` est None.
+
+    Retourne {'formation', 'total', 'players'} ou None si l'effectif ne permet pas la formation.
+    """
+    if formation not in FORMATIONS:
+        raise ValueError(f"Formation inconnue : {formation} (attendu : {', '.join(FORMATIONS)})")
+    team_id = _team_id(team, data_dir)
+    lineups = get_lineups(LEAGUE_ID if team_id is None else team_id, formation, data_dir)
+    if not 1 <= option <= max(len(lineups), 1):
+        raise ValueError(f"option doit être comprise entre 1 et {max(len(lineups), 1)}")
+    if not lineups:
+        return None
+    lineup = lineups[option - 1]
+    return {
+        'formation': formation,
+        'total': lineup.total,
+        'players': lineup_frame(get_ranking_index(data_dir).players, lineup),
+    }
+
+
+def team_analysis(team, data_dir=None):
+    """Effectif trié, score moyen, meilleurs par poste et derniers résultats d'une équipe"""
+    team_id = _team_id(team, data_dir)
+    ranking = get_ranking_index(data_dir)
+    squad = ranking.top(team=team_id)
+    history = get_match_history(data_dir)
+    form, points = history.form(team_id)
+    return {
+        'team': get_team_directory(data_dir).name(team_id),
+        'squad_size': len(squad),
+        'average_score': float(squad['Score_Forme'].mean()) if len(squad) else None,
+        'best_by_position': {position: ranking.top(5, position, team_id) for position in POSITIONS},
+        'squad': squad,
+        'form': form,
+        'form_points': points,
+        'last_results': history.last(team_id, 5),
+    }
+
+
+def scorer_projections(limit=10, data_dir=None):
+    """Projection de fin de saison des `limit` meilleurs buteurs projetés"""
+    if not 1 <= limit <= MAX_TOP:
+        raise ValueError(f"limit doit être compris entre 1 et {MAX_TOP}")
+    players = get_ranking_index(data_dir).players
+    projections = get_projections(data_dir=data_dir)
+    return players[PLAYER_COLUMNS].join(projections).nlargest(limit, 'Projection_buts')
+
+
+def season_outlook(data_dir=None):
+    """Classement final simulé : points projetés, chances de titre, top 4 et relégation"""
+    return get_season_outlook(data_dir=data_dir).summary
+
+
+def hidden_gems(criteria, positions=None, limit=50, data_dir=None):
+    """Joueurs qui vérifient les critères (scoutonze.filters.Criterion), triés par score"""
+    if not 1 <= limit <= MAX_TOP:
+        raise ValueError(f"limit doit être compris entre 1 et {MAX_TOP}")
+    for position in positions or ():
+        _position(position)
+    try:
+        return get_filter_engine(data_dir).query(tuple(criteria), positions).head(limit)
+    except KeyError as e:
+        raise ValueError(f"Colonne inconnue : {e.args[0]}") from None
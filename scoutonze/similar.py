@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Joueurs similaires
+
+Chaque joueur est décrit par un vecteur normalisé (forme, part du temps de
+jeu, buts et passes par 90 minutes, matchs joués), rangé une seule fois
+dans une matrice NumPy float32 triée par poste. Une requête « joueurs
+comme X » calcule les distances bloc par bloc (BLOCK_ROWS lignes à la
+fois) en ne gardant que les k meilleurs candidats : la mémoire reste
+bornée et une recherche limitée à un poste ne lit que la tranche de ce
+poste.
+"""
+
+import numpy as np
+
+from scoutonze.data_store import derived
+from scoutonze.features import get_features
+from scoutonze.teams import get_team_directory
+
+# Colonnes de features -> poids dans la distance
+SIMILARITY_FEATURES = {
+    'Score_Forme': 1.0,
+    'Pct_temps_jeu': 1.0,
+    'Buts_90': 1.0,
+    'Passes_90': 1.0,
+    'Matchs': 0.5,
+}
+
+# Percentile auquel sont plafonnées les valeurs (les taux par 90 min explosent sur peu de minutes)
+CLIP_PERCENTILE = 99
+
+# Lignes comparées à la fois
+BLOCK_ROWS = 16_384
+
+DEFAULT_NEIGHBOURS = 5
+
+
+def feature_matrix(players, features=SIMILARITY_FEATURES):
+    """Vecteurs centrés-réduits (float32) et pondérés de chaque joueur"""
+    values = players[list(features)].to_numpy(dtype=float)
+    values = np.minimum(values, np.percentile(values, CLIP_PERCENTILE, axis=0))
+    std = values.std(axis=0)
+    scaled = (values - values.mean(axis=0)) / np.where(std > 0, std, 1)
+    return (scaled * np.array(list(features.values()))).astype(np.float32)
+
+
+class SimilarityIndex:
+    """Recherche des plus proches voisins sur les vecteurs de joueurs"""
+
+    def __init__(self, players, team_ids):
+        positions = players['Poste_simplifie'].astype(str).to_numpy()
+        self.players = players
+
+        # Lignes rangées par poste : chaque poste est une tranche contiguë
+        self.order = np.argsort(positions, kind='stable')
+        self.vectors = feature_matrix(players)[self.order]
+        self.sq_norms = (self.vectors.astype(np.float64) ** 2).sum(axis=1)
+        self.team_ids = np.asarray(team_ids)[self.order]
+        self.slot = np.empty(len(self.order), dtype=np.int64)
+        self.slot[self.order] = np.arange(len(self.order))
+
+        sorted_positions = positions[self.order]
+        names, starts = np.unique(sorted_positions, return_index=True)
+        ends = np.append(starts[1:], len(sorted_positions))
+        self.slices = {name: (int(start), int(end)) for name, start, end in zip(names, starts, ends)}
+
+    def nearest_rows(self, row, k=DEFAULT_NEIGHBOURS, position=None, exclude_team=False):
+        """(positions de lignes des k plus proches voisins de la ligne `row`, distances)"""
+        slot = self.slot[row]
+        query = self.vectors[slot].astype(np.float64)
+        start, end = self.slices.get(position, (0, 0)) if position is not None else (0, len(self.vectors))
+
+        best_slots = np.empty(0, dtype=np.int64)
+        best_dist = np.empty(0)
+        for block in range(start, end, BLOCK_ROWS):
+            stop = min(block + BLOCK_ROWS, end)
+            # |x - q|² = |x|² - 2 x.q + |q|²
+            dist = self.sq_norms[block:stop] - 2 * (self.vectors[block:stop] @ query) + query @ query
+            if block <= slot < stop:
+                dist[slot - block] = np.inf
+            if exclude_team:
+                dist[self.team_ids[block:stop] == self.team_ids[slot]] = np.inf
+
+            # Meilleurs candidats du bloc fusionnés avec les meilleurs déjà retenus
+            keep = min(k, stop - block)
+            candidates = np.argpartition(dist, keep - 1)[:keep] if keep < stop - block else np.arange(stop - block)
+            best_slots = np.concatenate([best_slots, candidates + block])
+            best_dist = np.concatenate([best_dist, dist[candidates]])
+            if len(best_slots) > k:
+                kept = np.argpartition(best_dist, k - 1)[:k]
+                best_slots, best_dist = best_slots[kept], best_dist[kept]
+
+        ranked = np.argsort(best_dist, kind='stable')
+        best_slots, best_dist = best_slots[ranked], best_dist[ranked]
+        valid = np.isfinite(best_dist)
+        return self.order[best_slots[valid]], np.sqrt(np.maximum(best_dist[valid], 0))
+
+    def nearest(self, label, k=DEFAULT_NEIGHBOURS, position=None, exclude_team=False):
+        """Les k joueurs les plus proches du joueur `label`, avec leur distance et similarité (%)"""
+        rows, distances = self.nearest_rows(self.players.index.get_loc(label), k, position, exclude_team)
+        return self.players.iloc[rows].assign(
+            Distance=distances,
+            Similarite=100 / (1 + distances),
+        )
+
+
+def get_similarity_index(data_dir=None):
+    """Index des joueurs similaires, partagé entre les sessions"""
+    return derived(
+        'similar',
+        lambda players, standings: SimilarityIndex(get_features(data_dir), get_team_directory(data_dir).primary_team_id),
+        ['players', 'standings'],
+        data_dir,
+    )
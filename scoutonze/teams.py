@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Annuaire des équipes et appartenance joueur ↔ équipe
+
+Le champ `Equipe_principale` ("Arsenal,Crystal Palace") est découpé une seule
+fois en une table d'appartenance joueur ↔ équipe avec des identifiants
+entiers. Les noms courts du fichier joueurs ("Brighton") sont rattachés aux
+`team_id` de `standings.csv` / `matches_scheduled.csv`
+("Brighton & Hove Albion FC"), ce qui rend les tables joignables.
+"""
+
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+from scoutonze.data_store import derived
+
+# Mots ignorés pour rapprocher les noms courts des noms officiels
+_NAME_NOISE = {'fc', 'afc', '&'}
+
+
+def normalize_name(name):
+    """Nom en minuscules, sans accents"""
+    folded = unicodedata.normalize('NFKD', str(name))
+    return ''.join(c for c in folded if not unicodedata.combining(c)).lower().strip()
+
+
+def _tokens(name):
+    return set(normalize_name(name).split()) - _NAME_NOISE
+
+
+def match_team_name(short_name, official_names):
+    """Nom officiel correspondant à un nom court, ou None.
+
+    Tous les mots du nom court doivent apparaître dans le nom officiel
+    ("West Ham" -> "West Ham United FC") ; en cas d'ambiguïté, le nom
+    officiel le plus proche l'emporte.
+    """
+    wanted = _tokens(short_name)
+    candidates = [
+        (len(_tokens(official) - wanted), official)
+        for official in official_names
+        if wanted and wanted <= _tokens(official)
+    ]
+    return min(candidates)[1] if candidates else None
+
+
+class TeamDirectory:
+    """Équipes (identifiants, noms) et appartenance des joueurs"""
+
+    def __init__(self, players, standings):
+        official = dict(zip(standings['team_name'].astype(str), standings['team_id'].astype(int)))
+        # Matchs d'une saison par équipe (aller-retour), selon le nombre d'équipes du championnat
+        self.season_matches = 2 * max(len(official) - 1, 1)
+
+        # Clubs de chaque joueur, dans l'ordre du champ (le premier est le club principal)
+        clubs = [[team.strip() for team in str(value).split(',')] for value in players['Equipe_principale']]
+        short_names = sorted({team for player_clubs in clubs for team in player_clubs})
+
+        # Les clubs absents du classement reçoivent des identifiants négatifs
+        rows = []
+        next_unknown = -1
+        for short_name in short_names:
+            official_name = match_team_name(short_name, official)
+            if official_name is not None:
+                rows.append((official[official_name], short_name, official_name))
+            else:
+                rows.append((next_unknown, short_name, short_name))
+                next_unknown -= 1
+
+        self.teams = pd.DataFrame(rows, columns=['team_id', 'short_name', 'team_name']).set_index('team_id')
+        self._ids = {}
+        for team_id, short_name, team_name in rows:
+            self._ids[short_name] = team_id
+            self._ids[team_name] = team_id
+
+        counts = [len(player_clubs) for player_clubs in clubs]
+        self.membership = pd.DataFrame({
+            'player': np.repeat(players.index.to_numpy(), counts),
+            'team_id': np.array([self._ids[t] for player_clubs in clubs for t in player_clubs], dtype=np.int64),
+            'is_primary': np.concatenate([np.arange(n) == 0 for n in counts]) if counts else np.empty(0, dtype=bool),
+        })
+        self.primary_team_id = self.membership.loc[self.membership['is_primary'], 'team_id'].to_numpy()
+
+        # Lignes (positions) des joueurs de chaque équipe
+        player_rows = players.index.get_indexer(self.membership['player'])
+        self._squads = {
+            int(team_id): player_rows[group]
+            for team_id, group in self.membership.groupby('team_id').indices.items()
+        }
+
+    def team_id(self, team):
+        """Identifiant d'une équipe à partir de son id, nom court ou nom officiel"""
+        if isinstance(team, (int, np.integer)):
+            return int(team)
+        return self._ids.get(str(team).strip())
+
+    def name(self, team):
+        """Nom court d'une équipe"""
+        return self.teams.at[self.team_id(team), 'short_name']
+
+    def names(self):
+        """Noms courts des équipes ayant au moins un joueur, triés"""
+        return sorted(self.teams['short_name'])
+
+    def squad_rows(self, team):
+        """Positions de lignes des joueurs d'une équipe"""
+        return self._squads.get(self.team_id(team), np.empty(0, dtype=np.int64))
+
+
+def get_team_directory(data_dir=None):
+    """Annuaire des équipes, partagé entre les sessions"""
+    return derived('teams', TeamDirectory, ['players', 'standings'], data_dir)
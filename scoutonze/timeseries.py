@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Séries par match des joueurs
+
+Les statistiques brutes par match (`player_match_stats.csv`) sont rangées
+en matrices joueurs x journées (note du match, minutes, buts, passes
+décisives). La journée est le numéro du match de l'équipe du joueur. Une
+case vaut NaN quand l'équipe n'a pas joué ce match-là (ou pas encore avec
+ce joueur), et 0 quand le joueur n'est pas entré en jeu. Un joueur qui a
+changé d'équipe peut avoir deux matchs sur une même journée : la case
+additionne alors leurs minutes, buts et passes (les totaux de la saison
+sont conservés) et prend la moyenne de leurs notes.
+
+La courbe de forme (moyenne glissante des notes, pondérée vers les matchs
+récents comme `Score_Forme`) est calculée pour tous les joueurs à la
+construction ; les pages n'en lisent que les lignes voulues.
+"""
+
+import numpy as np
+import pandas as pd
+
+from scoutonze.data_store import derived, table_exists
+from scoutonze.form_pipeline import FORM_WINDOW, RECENCY_DECAY, match_ratings
+
+
+def rolling_form(ratings, window=FORM_WINDOW, decay=RECENCY_DECAY):
+    """Moyenne glissante pondérée de chaque ligne (les NaN sont ignorés)"""
+    total = np.zeros(ratings.shape)
+    weights = np.zeros(ratings.shape)
+    known = ~np.isnan(ratings)
+    values = np.where(known, ratings, 0.0)
+    for lag in range(window):
+        weight = decay ** lag
+        total[:, lag:] += weight * values[:, :ratings.shape[1] - lag]
+        weights[:, lag:] += weight * known[:, :ratings.shape[1] - lag]
+    with np.errstate(invalid='ignore'):
+        return np.where(known, total / weights, np.nan)
+
+
+class FormSeries:
+    """Matrices joueurs x journées de la note, des minutes, des buts et des passes"""
+
+    def __init__(self, stats):
+        stats = stats.assign(Equipe=stats['Equipe'].astype(str))
+
+        # Journée = numéro du match de l'équipe (1 = premier match)
+        team_matches = stats[['Equipe', 'Date']].drop_duplicates()
+        number = team_matches.groupby('Equipe')['Date'].rank(method='dense').astype(int)
+        matchday = stats.merge(team_matches.assign(Journee=number), on=['Equipe', 'Date'], how='left')['Journee']
+
+        self.names = pd.Index(np.sort(stats['Joueur'].astype(str).unique()), name='Joueur')
+        self.matchdays = np.arange(1, matchday.max() + 1) if len(stats) else np.empty(0, dtype=int)
+        shape = (len(self.names), len(self.matchdays))
+
+        # Un joueur transféré en cours de saison a deux matchs sur une même journée
+        # (le n-ième de chacune de ses équipes) : comptes additionnés, note moyenne
+        cells = pd.DataFrame({
+            'rating': np.asarray(match_ratings(stats), dtype=float),
+            'minutes': stats['Minutes'].to_numpy(dtype=float),
+            'goals': stats['Buts'].to_numpy(dtype=float),
+            'assists': stats['Passes_decisives'].to_numpy(dtype=float),
+        }).groupby([self.names.get_indexer(stats['Joueur'].astype(str)), matchday.to_numpy() - 1]).agg(
+            {'rating': 'mean', 'minutes': 'sum', 'goals': 'sum', 'assists': 'sum'}
+        )
+        rows, cols = cells.index.get_level_values(0), cells.index.get_level_values(1)
+
+        def matrix(values, dtype):
+            out = np.full(shape, np.nan, dtype=dtype)
+            out[rows, cols] = values
+            return out
+
+        self.rating = matrix(cells['rating'].to_numpy(), np.float32)
+        self.minutes = matrix(cells['minutes'].to_numpy(), np.float32)
+        self.goals = matrix(cells['goals'].to_numpy(), np.float32)
+        self.assists = matrix(cells['assists'].to_numpy(), np.float32)
+        self.form = rolling_form(self.rating)
+
+        for values in (self.rating, self.minutes, self.goals, self.assists, self.form):
+            values.flags.writeable = False
+
+    def rows(self, players):
+        """Lignes des joueurs `players` (noms), ceux absents ignorés"""
+        rows = self.names.get_indexer(list(players))
+        return rows[rows >= 0]
+
+    def curves(self, players, window=FORM_WINDOW):
+        """Courbes de forme (DataFrame joueurs x journées) des joueurs `players`"""
+        rows = self.rows(players)
+        form = self.form[rows] if window == FORM_WINDOW else rolling_form(self.rating[rows], window)
+        return pd.DataFrame(form, index=self.names[rows], columns=self.matchdays)
+
+    def last_values(self, values):
+        """Dernière valeur connue et la précédente de chaque ligne"""
+        known = ~np.isnan(values)
+        count = known.sum(axis=1)
+        ordered = np.take_along_axis(values, np.argsort(~known, axis=1, kind='stable'), axis=1)
+        last = np.where(count > 0, ordered[np.arange(len(values)), np.maximum(count - 1, 0)], np.nan)
+        previous = np.where(count > 1, ordered[np.arange(len(values)), np.maximum(count - 2, 0)], np.nan)
+        return last, previous
+
+    def delta(self, players):
+        """Forme actuelle et variation depuis le match précédent (DataFrame par joueur)"""
+        rows = self.rows(players)
+        last, previous = self.last_values(self.form[rows])
+        return pd.DataFrame({'Forme': last, 'Variation': last - previous}, index=self.names[rows])
+
+
+def get_form_series(data_dir=None):
+    """Séries par match, partagées entre les sessions (None sans statistiques par match)"""
+    if not table_exists('match_stats', data_dir):
+        return None
+    return derived('form_series', FormSeries, ['match_stats'], data_dir)
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+ScoutOnze - Rechargement à chaud de `données/`
+
+Un fil d'arrière-plan surveille les CSV du dossier de données. Quand le
+pipeline de calcul en dépose de nouveaux, il attend que les fichiers ne
+bougent plus (les deux CSV du pipeline sont écrits l'un après l'autre),
+prépare la nouvelle version avec `data_store.refresh()` pendant que les
+sessions continuent sur l'ancienne, puis relance les sessions Streamlit
+qui affichent ce dossier une fois la nouvelle version publiée.
+"""
+
+import logging
+import threading
+
+from scoutonze.data_store import TABLES, disk_fingerprint, refresh, table_exists
+
+# Intervalle entre deux relevés des fichiers (secondes)
+POLL_SECONDS = 2.0
+
+# Version de Streamlit (requirements.txt) dont les API internes de relance ont été vérifiées
+STREAMLIT_VERSION = '1.31'
+
+logger = logging.getLogger(__name__)
+
+# Surveillances actives : dossier -> DataWatcher
+_WATCHERS = {}
+_LOCK = threading.Lock()
+
+# Sessions Streamlit : id de session -> dossier de la partition affichée
+_SESSIONS = {}
+
+
+def _active_sessions():
+    """Sessions connectées au serveur Streamlit, ou None (hors serveur, ou version de Streamlit non vérifiée)"""
+    import streamlit
+    from streamlit.runtime import Runtime
+
+    # API internes de Streamlit : vérifiées avec la version de requirements.txt seulement
+    if not streamlit.__version__.startswith(STREAMLIT_VERSION + '.') or not Runtime.exists():
+        return None
+    manager = getattr(Runtime.instance(), '_session_mgr', None)
+    if not hasattr(manager, 'list_active_sessions'):
+        return None
+    return manager.list_active_sessions()
+
+
+def follow(data_dir=None):
+    """Associe la session Streamlit en cours au dossier qu'elle affiche (sans effet hors session)"""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx(suppress_warning=True)
+    if ctx is not None:
+        with _LOCK:
+            _SESSIONS[ctx.session_id] = str(data_dir)
+
+
+def rerun_sessions(data_dir=None):
+    """Relance le script des sessions Streamlit qui affichent `data_dir` (toutes si None).
+
+    Sans effet hors serveur Streamlit ; une erreur est journalisée sans
+    interrompre la surveillance. Retourne le nombre de sessions relancées.
+    """
+    try:
+        sessions = _active_sessions()
+        if sessions is None:
+            return 0
+        with _LOCK:
+            # Sessions fermées depuis : oubliées
+            active = {info.session.id for info in sessions}
+            for session_id in set(_SESSIONS) - active:
+                del _SESSIONS[session_id]
+            followed = dict(_SESSIONS)
+
+        rerun = 0
+        for info in sessions:
+            session = info.session
+            if data_dir is not None and followed.get(session.id) != str(data_dir):
+                continue
+            # Pas d'API publique : même appel que Streamlit quand le script source change
+            if hasattr(session, 'request_rerun') and hasattr(session, '_client_state'):
+                session.request_rerun(session._client_state)
+                rerun += 1
+        return rerun
+    except Exception:
+        logger.exception("Relance des sessions Streamlit impossible")
+        return 0
+
+
+class DataWatcher(threading.Thread):
+    """Relève les empreintes des CSV et publie chaque nouvelle version stable"""
+
+    def __init__(self, data_dir=None, interval=POLL_SECONDS, on_refresh=None):
+        super().__init__(name='scoutonze-watcher', daemon=True)
+        self.data_dir = data_dir
+        self.interval = interval
+        self.on_refresh = on_refresh
+        self._pending = None
+        self._stop_event = threading.Event()
+
+    def _snapshot(self):
+        return {
+            name: disk_fingerprint(name, self.data_dir)
+            for name in TABLES if table_exists(name, self.data_dir)
+        }
+
+    def check(self):
+        """Publie la version sur disque si elle n'a pas bougé depuis le relevé précédent"""
+        snapshot = self._snapshot()
+        if snapshot != self._pending:
+            # Fichiers en cours d'écriture : on attend le relevé suivant
+            self._pending = snapshot
+            return None
+
+        result = refresh(self.data_dir)
+        if result is not None:
+            changed = ', '.join(
+                f"{name} ({'?' if diff is None else f'+{len(diff.added)} -{len(diff.removed)} ~{len(diff.updated)}'})"
+                for name, diff in result.changes.items()
+            )
+            logger.info("Données : génération %d publiée en %.2f s [%s]", result.generation, result.seconds, changed)
+            if self.on_refresh is not None:
+                self.on_refresh(self.data_dir)
+        return result
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                # Nouvelle version illisible : l'ancienne reste servie, on réessaie au prochain changement
+                logger.exception("Rechargement des données impossible")
+
+    def stop(self):
+        self._stop_event.set()
+
+
+def start(data_dir=None, interval=POLL_SECONDS, on_refresh=rerun_sessions):
+    """Démarre (une fois par processus et par dossier) la surveillance de `data_dir`.
+
+    La version présente sur disque est publiée immédiatement. La session
+    Streamlit appelante est associée à `data_dir` : `on_refresh(data_dir)`
+    (par défaut `rerun_sessions`) ne relance que les sessions de ce dossier.
+    """
+    key = str(data_dir)
+    with _LOCK:
+        watcher = _WATCHERS.get(key)
+        if watcher is None:
+            refresh(data_dir)
+            watcher = DataWatcher(data_dir, interval, on_refresh)
+            watcher._pending = watcher._snapshot()
+            watcher.start()
+            _WATCHERS[key] = watcher
+    follow(data_dir)
+    return watcher
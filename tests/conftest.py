@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+Fixtures communes : copie des données réelles dans un dossier temporaire
+(chaque test a ses propres caches et fichiers Arrow) et statistiques par
+match synthétiques.
+"""
+
+import shutil
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from scoutonze.data_store import DATA_DIR, TABLES  # noqa: E402
+
+
+def copy_league(path):
+    """Copie dans `path` les CSV de `données/`"""
+    path.mkdir(parents=True, exist_ok=True)
+    for spec in TABLES.values():
+        if (DATA_DIR / spec['file']).exists():
+            shutil.copy(DATA_DIR / spec['file'], path / spec['file'])
+    return path
+
+
+@pytest.fixture
+def league_dir(tmp_path):
+    """Dossier de données temporaire, copie de `données/`"""
+    return copy_league(tmp_path / 'données')
+
+
+@pytest.fixture
+def match_stats():
+    """Statistiques par match de 6 équipes sur 10 journées (dates croissantes).
+
+    À la dernière date, seules Equipe0 et Equipe1 jouent ; le joueur
+    Equipe0-J0 rejoint Equipe2 à partir de la 6e journée.
+    """
+    rng = np.random.default_rng(0)
+    positions = ['GK', 'DEF', 'DEF', 'DEF', 'DEF', 'MID', 'MID', 'MID', 'FWD', 'FWD', 'FWD', 'MID']
+    rows = []
+    for day in range(10):
+        date = pd.Timestamp('2025-08-16', tz='UTC') + pd.Timedelta(days=7 * day)
+        for team in range(2 if day == 9 else 6):
+            for i, position in enumerate(positions):
+                club = 2 if (team, i) == (0, 0) and day >= 5 else team
+                rows.append({
+                    'Joueur': f'Equipe{team}-J{i}', 'Equipe': f'Equipe{club}', 'Poste': position,
+                    'Date': date, 'Minutes': int(rng.choice([0, 30, 90])),
+                    'Buts': int(rng.poisson(0.2)), 'Passes_decisives': int(rng.poisson(0.2)),
+                })
+    return pd.DataFrame(rows).sort_values('Date', kind='stable', ignore_index=True)
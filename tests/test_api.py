@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import json
+
+import pytest
+import tornado.httpserver
+from tornado.httpclient import AsyncHTTPClient
+from tornado.testing import bind_unused_port
+
+from scoutonze import service
+from scoutonze.api import make_app
+
+
+def _get(data_dir, path):
+    """(statut, corps JSON) d'une requête GET sur l'API servie depuis `data_dir`"""
+    async def fetch():
+        sock, port = bind_unused_port()
+        server = tornado.httpserver.HTTPServer(make_app(data_dir))
+        server.add_sockets([sock])
+        try:
+            response = await AsyncHTTPClient().fetch(f'http://127.0.0.1:{port}{path}', raise_error=False)
+        finally:
+            server.stop()
+        return response.code, json.loads(response.body)
+
+    return asyncio.run(fetch())
+
+
+@pytest.mark.parametrize('limit', [0, -1, service.MAX_TOP + 1])
+def test_hidden_gems_rejects_out_of_range_limit(league_dir, limit):
+    status, body = _get(league_dir, f'/api/hidden-gems?c=Score_Forme>5&limit={limit}')
+    assert status == 400
+    assert 'limit' in body['error']
+
+
+def test_hidden_gems_limit(league_dir):
+    status, body = _get(league_dir, '/api/hidden-gems?c=Score_Forme>0&limit=3')
+    assert status == 200
+    assert len(body['data']) == 3
+
+
+def test_service_rejects_out_of_range_limit(league_dir):
+    with pytest.raises(ValueError):
+        service.hidden_gems([], limit=0, data_dir=league_dir)
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+import os
+
+import pandas as pd
+
+from scoutonze import data_store, precompute
+from scoutonze.data_store import TABLES, data_generation, derived, diff_rows, disk_fingerprint, fingerprint
+from scoutonze.data_store import load_table, refresh
+
+
+def _rewrite(data_dir, name, df):
+    """Réécrit le CSV d'une table (mtime avancé : l'empreinte change même à taille égale)"""
+    path = data_dir / TABLES[name]['file']
+    mtime = os.stat(path).st_mtime_ns
+    df.to_csv(path, index=False)
+    os.utime(path, ns=(mtime + 10 ** 9, mtime + 10 ** 9))
+
+
+def test_diff_rows():
+    old = pd.DataFrame({'Joueur': ['A', 'B', 'C'], 'Buts': [1, 2, None]})
+    new = pd.DataFrame({'Joueur': ['B', 'C', 'D'], 'Buts': [3, None, 0]})
+
+    changes = diff_rows(old, new, ['Joueur'])
+
+    assert changes.added == ['D']
+    assert changes.removed == ['A']
+    # NaN -> NaN n'est pas une modification
+    assert changes.updated == ['B']
+
+
+def test_diff_rows_with_ambiguous_key_replaces_everything():
+    old = pd.DataFrame({'Joueur': ['A', 'A'], 'Buts': [1, 2]})
+    new = pd.DataFrame({'Joueur': ['A', 'B'], 'Buts': [1, 2]})
+
+    changes = diff_rows(old, new, ['Joueur'])
+
+    assert changes.added == ['A', 'B']
+    assert changes.removed == ['A', 'A']
+    assert changes.updated == []
+
+
+def test_refresh_generations(league_dir):
+    assert refresh(league_dir).generation == 1
+    assert refresh(league_dir) is None
+    players = load_table('players', league_dir)
+    count = derived('count', len, ['players'], league_dir)
+    summary = derived('summary', lambda players: {'rows': len(players)}, ['players'], league_dir)
+    published = fingerprint('players', league_dir)
+
+    # Même contenu réécrit : pas de nouvelle génération, objets dérivés gardés, mais
+    # nouvelle empreinte (celle que voient les autres processus, ex. le pré-calcul)
+    _rewrite(league_dir, 'players', pd.read_csv(league_dir / TABLES['players']['file']))
+    assert refresh(league_dir) is None
+    assert fingerprint('players', league_dir) == disk_fingerprint('players', league_dir) != published
+    assert data_generation(league_dir) == 1
+    assert derived('summary', lambda players: {'rows': -1}, ['players'], league_dir) is summary
+    assert not data_store._arrow_file('players', league_dir, published).exists()
+
+    # Une ligne modifiée, une ajoutée
+    source = pd.read_csv(league_dir / TABLES['players']['file'])
+    first = tuple(source.loc[0, TABLES['players']['key']])
+    source.loc[0, 'Buts'] += 1
+    extra = source.iloc[[1]].assign(Joueur='Nouveau Joueur')
+    _rewrite(league_dir, 'players', pd.concat([source, extra], ignore_index=True))
+
+    result = refresh(league_dir)
+
+    assert result.generation == data_generation(league_dir) == 2
+    assert result.changes['players'].updated == [first]
+    assert result.changes['players'].added == [('Nouveau Joueur', extra['Equipe_principale'].iat[0])]
+    assert result.changes['players'].removed == []
+    assert len(load_table('players', league_dir)) == len(players) + 1
+    assert derived('count', len, ['players'], league_dir) == count + 1
+
+
+def test_stale_conversions_keep_the_published_version(league_dir):
+    refresh(league_dir)
+    load_table('players', league_dir)
+    published = data_store._arrow_file('players', league_dir, fingerprint('players', league_dir))
+
+    source = pd.read_csv(league_dir / TABLES['players']['file'])
+    _rewrite(league_dir, 'players', source.iloc[:-1])
+    on_disk = data_store._arrow_path('players', league_dir, data_store.disk_fingerprint('players', league_dir))
+
+    # Conversion de la version sur disque : la version publiée reste
+    assert published.exists() and on_disk.exists()
+
+    # Après publication, l'ancienne version n'est plus utilisée
+    refresh(league_dir)
+    assert on_disk.exists()
+    assert not published.exists()
+
+
+def test_refresh_of_another_directory_does_not_hold_old_versions(league_dir, tmp_path, monkeypatch):
+    # Un autre dossier en cours de préparation
+    monkeypatch.setattr(data_store, '_STAGING_ROOTS', {str(tmp_path / 'autre')})
+    load_table('players', league_dir)
+    old = data_store._arrow_file('players', league_dir, fingerprint('players', league_dir))
+
+    _rewrite(league_dir, 'players', pd.read_csv(league_dir / TABLES['players']['file']).iloc[:-1])
+    load_table('players', league_dir)
+
+    assert list(data_store._RESIDENT[(str(league_dir), 'players')]) == [fingerprint('players', league_dir)]
+    assert not old.exists()
+
+
+def test_identical_rewrite_finds_the_precomputed_lineups(league_dir, monkeypatch):
+    refresh(league_dir)
+    load_table('players', league_dir)
+    _rewrite(league_dir, 'players', pd.read_csv(league_dir / TABLES['players']['file']))
+
+    # Le pré-calcul (autre processus, sans empreinte publiée) nomme son fichier d'après le disque
+    with monkeypatch.context() as patch:
+        patch.setattr(data_store, '_PINNED', {})
+        other_process = precompute.artifact_path(league_dir).name
+
+    refresh(league_dir)
+    assert precompute.artifact_path(league_dir).name == other_process
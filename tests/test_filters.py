@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from scoutonze.filters import Criterion, get_filter_engine
+from scoutonze.lineup import POSITIONS
+
+
+@pytest.fixture
+def engine(league_dir):
+    return get_filter_engine(league_dir)
+
+
+def test_empty_positions_select_no_player(engine):
+    assert len(engine.query((), ())) == 0
+    assert len(engine.query((), [])) == 0
+    assert not engine.mask([], ()).any()
+
+
+def test_no_positions_select_every_player(engine):
+    assert len(engine.query((), None)) == len(engine.players)
+    assert len(engine.query((), POSITIONS)) == len(engine.players)
+
+
+def test_positions_filter(engine):
+    forwards = engine.query((), ['FWD'])
+    assert len(forwards) > 0
+    assert set(forwards['Poste_simplifie']) == {'FWD'}
+
+
+def test_criteria_and_positions(engine):
+    criteria = (Criterion('Score_Forme', '>=', 5.0),)
+    gems = engine.query(criteria, ['MID', 'FWD'])
+    assert (gems['Score_Forme'] >= 5.0).all()
+    assert set(gems['Poste_simplifie']) <= {'MID', 'FWD'}
+    assert list(gems['Score_Forme']) == sorted(gems['Score_Forme'], reverse=True)
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+import pandas as pd
+
+from scoutonze import form_pipeline
+from scoutonze.data_store import TABLES
+
+
+def _write(stats, data_dir):
+    data_dir.mkdir(exist_ok=True)
+    stats.to_csv(data_dir / TABLES['match_stats']['file'], index=False)
+
+
+def _scores(data_dir):
+    return pd.read_csv(data_dir / TABLES['players']['file']).sort_values('Joueur', ignore_index=True)
+
+
+def test_incremental_run_matches_full_run(tmp_path, match_stats):
+    incremental, full = tmp_path / 'incremental', tmp_path / 'full'
+    last_day = match_stats['Date'] == match_stats['Date'].max()
+
+    _write(match_stats[~last_day], incremental)
+    form_pipeline.run(incremental)
+    _write(match_stats, incremental)
+    recomputed, total = form_pipeline.run(incremental)
+
+    _write(match_stats, full)
+    form_pipeline.run(full, full=True)
+
+    # Seules Equipe0 et Equipe1 ont joué depuis le premier calcul
+    assert 0 < recomputed < total
+    pd.testing.assert_frame_equal(_scores(incremental), _scores(full))
+
+
+def test_rewritten_history_falls_back_to_full_run(tmp_path, match_stats):
+    data_dir = tmp_path / 'données'
+    _write(match_stats, data_dir)
+    form_pipeline.run(data_dir)
+
+    # Historique modifié (pas seulement allongé) : tout est recalculé
+    _write(match_stats.assign(Minutes=90), data_dir)
+    recomputed, total = form_pipeline.run(data_dir)
+
+    assert recomputed == total
+    assert (_scores(data_dir)['Minutes'] % 90 == 0).all()
+
+
+def test_reordered_history_falls_back_to_full_run(tmp_path, match_stats):
+    data_dir = tmp_path / 'données'
+    _write(match_stats, data_dir)
+    form_pipeline.run(data_dir)
+
+    # Deux lignes échangées : même contenu, autre ordre
+    swapped = match_stats.copy()
+    swapped.iloc[[0, 1]] = swapped.iloc[[1, 0]].to_numpy()
+    _write(swapped, data_dir)
+    recomputed, total = form_pipeline.run(data_dir)
+
+    assert recomputed == total
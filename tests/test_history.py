@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+import os
+
+import pandas as pd
+import pytest
+
+from scoutonze import history
+from scoutonze.data_store import TABLES
+
+
+def _write_recent(data_dir, df):
+    path = data_dir / TABLES['recent']['file']
+    mtime = os.stat(path).st_mtime_ns
+    df.to_csv(path, index=False)
+    os.utime(path, ns=(mtime + 10 ** 9, mtime + 10 ** 9))
+
+
+@pytest.fixture
+def builds(monkeypatch):
+    """Nombre d'historiques reconstruits en entier"""
+    calls = []
+    build = history.build_history
+    monkeypatch.setattr(history, 'build_history', lambda *args: calls.append(1) or build(*args))
+    return calls
+
+
+def _match(recent, row, **changes):
+    return recent.iloc[[row]].assign(**changes)
+
+
+def test_appended_results_extend_the_history(league_dir, builds):
+    recent = pd.read_csv(league_dir / TABLES['recent']['file'])
+    first = history.get_match_history(league_dir)
+
+    _write_recent(league_dir, pd.concat([recent, _match(recent, 0, Date='2026-05-02', Score_Domicile=7)]))
+    extended = history.get_match_history(league_dir)
+
+    assert builds == [1]
+    assert extended.source_rows == first.source_rows + 1
+    assert extended.last(recent['Equipe_Domicile'].iat[0], 1)['Buts_pour'].iat[0] == 7
+
+
+def test_rewritten_results_rebuild_the_history(league_dir, builds):
+    recent = pd.read_csv(league_dir / TABLES['recent']['file'])
+    history.get_match_history(league_dir)
+
+    # Premier résultat corrigé, puis un résultat ajouté : la dernière ligne lue n'a pas changé
+    rewritten = pd.concat([_match(recent, 0, Score_Domicile=9), recent.iloc[1:],
+                           _match(recent, 1, Date='2026-05-02')])
+    _write_recent(league_dir, rewritten)
+    rebuilt = history.get_match_history(league_dir)
+
+    assert builds == [1, 1]
+    home, away = recent['Equipe_Domicile'].iat[0], recent['Equipe_Exterieur'].iat[0]
+    assert 9 in list(rebuilt.head_to_head(home, away)['Score_Domicile'])
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from scoutonze import service
+from scoutonze.leaderboard import get_leaderboard
+from scoutonze.precompute import LEAGUE_ID, get_lineups
+from scoutonze.teams import get_team_directory
+
+
+@pytest.fixture
+def leaderboard(league_dir):
+    return get_leaderboard(league_dir)
+
+
+def test_unknown_team_has_no_player(leaderboard):
+    assert len(leaderboard.rows(team='Équipe inconnue')) == 0
+    players, total = leaderboard.page(team='Équipe inconnue')
+    assert total == 0 and players.empty
+
+
+def test_team_filter(leaderboard):
+    team = leaderboard.ranking.teams.names()[0]
+    players = leaderboard.players.iloc[leaderboard.rows(team=team)]
+    assert len(players) > 0
+    assert len(players) < len(leaderboard.players)
+    assert players['Equipe_principale'].astype(str).str.contains(team, regex=False).all()
+
+
+def test_rows_are_sorted(leaderboard):
+    goals = leaderboard.players['Buts'].to_numpy()[leaderboard.rows('Buts', ascending=True, position='FWD')]
+    assert list(goals) == sorted(goals)
+    assert len(leaderboard.rows(position='FWD')) < len(leaderboard.players)
+
+
+def test_pages_cover_the_ranking(leaderboard):
+    first, total = leaderboard.page(page=1, page_size=10)
+    second, _ = leaderboard.page(page=2, page_size=10)
+    assert total == len(leaderboard.players)
+    assert list(first['Rang']) + list(second['Rang']) == list(range(1, 21))
+    assert first['Score_Forme'].min() >= second['Score_Forme'].max()
+
+
+def test_service_unknown_team(league_dir):
+    with pytest.raises(LookupError):
+        service.leaderboard(team='Équipe inconnue', data_dir=league_dir)
+
+
+def test_unknown_team_has_no_lineup(league_dir):
+    with pytest.raises(LookupError):
+        get_lineups('Équipe inconnue', '4-3-3', league_dir)
+    team = get_team_directory(league_dir).names()[0]
+    assert get_lineups(team, '4-3-3', league_dir)
+    assert get_lineups(LEAGUE_ID, '4-3-3', league_dir)
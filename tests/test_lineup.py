@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pandas as pd
+import pytest
+
+from scoutonze.lineup import POSITIONS, LineupSolver, formation_needs
+
+
+def _squad(seed, counts=(('GK', 2), ('DEF', 5), ('MID', 4), ('FWD', 3))):
+    rng = np.random.default_rng(seed)
+    positions = [position for position, n in counts for _ in range(n)]
+    return pd.DataFrame({
+        'Score_Forme': rng.uniform(0, 10, len(positions)).round(2),
+        'Poste_simplifie': positions,
+    }, index=[f'J{i}' for i in range(len(positions))])
+
+
+def _brute_force(values, needs):
+    """Totaux de toutes les compositions possibles, du meilleur au moins bon"""
+    totals = []
+
+    def visit(player, needs, total):
+        if not any(needs):
+            totals.append(total)
+            return
+        if len(values) - player < sum(needs):
+            return
+        for col, need in enumerate(needs):
+            if need and values[player, col] > -np.inf:
+                visit(player + 1, needs[:col] + (need - 1,) + needs[col + 1:], total + values[player, col])
+        visit(player + 1, needs, total)
+
+    visit(0, tuple(needs), 0.0)
+    return sorted(totals, reverse=True)
+
+
+@pytest.mark.parametrize('formation', ['4-3-3', '3-5-2', '5-4-1'])
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_best_matches_brute_force(formation, seed):
+    solver = LineupSolver(_squad(seed))
+    needs = [formation_needs(formation)[position] for position in POSITIONS]
+    expected = _brute_force(solver.values, needs)[:5]
+
+    lineups = solver.best(formation, k=5)
+
+    assert [lineup.total for lineup in lineups] == pytest.approx(expected)
+    for lineup in lineups:
+        assert len({label for label, _, _ in lineup.picks}) == 11
+        assert [position for _, position, _ in lineup.picks].count('GK') == 1
+
+
+def test_best_without_goalkeeper_is_empty():
+    solver = LineupSolver(_squad(0, (('DEF', 6), ('MID', 5), ('FWD', 3))))
+    assert solver.best('4-3-3') == []
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+import os
+
+import pandas as pd
+import pytest
+
+from scoutonze import partitions
+from scoutonze.data_store import TABLES
+
+from conftest import copy_league
+
+
+@pytest.fixture
+def root(tmp_path):
+    for season in ('2024-2025', '2025-2026'):
+        copy_league(tmp_path / 'premier-league' / season)
+    return tmp_path
+
+
+def test_player_seasons(root):
+    found = partitions.discover(root)
+    name = pd.read_csv(root / 'premier-league' / '2025-2026' / TABLES['players']['file'])['Joueur'].iat[0]
+
+    seasons = partitions.player_seasons([name], 'premier-league', partitions=found)
+
+    assert sorted(seasons['season']) == ['2024-2025', '2025-2026']
+    assert set(seasons['Joueur']) == {name}
+
+
+def test_player_seasons_are_memoized_per_version(root, monkeypatch):
+    found = partitions.discover(root)
+    names = pd.read_csv(root / 'premier-league' / '2025-2026' / TABLES['players']['file'])['Joueur'].iloc[:3]
+    first = partitions.player_seasons(names, 'premier-league', partitions=found)
+
+    # Partitions fournies : ni nouvelle découverte, ni nouvelle lecture
+    def fail(*args, **kwargs):
+        raise AssertionError("lecture inattendue")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(partitions, 'discover', fail)
+        patch.setattr(partitions, 'scan', fail)
+        assert partitions.player_seasons(list(reversed(names)), 'premier-league', partitions=found) is first
+
+    # Table des joueurs d'une saison réécrite : relue
+    path = root / 'premier-league' / '2024-2025' / TABLES['players']['file']
+    players = pd.read_csv(path)
+    players.loc[players['Joueur'] == names.iat[0], 'Buts'] = 99
+    mtime = os.stat(path).st_mtime_ns
+    players.to_csv(path, index=False)
+    os.utime(path, ns=(mtime + 10 ** 9, mtime + 10 ** 9))
+
+    updated = partitions.player_seasons(names, 'premier-league', partitions=found)
+    assert updated is not first
+    assert 99 in list(updated['Buts'])
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pandas as pd
+
+from scoutonze.form_pipeline import match_ratings
+from scoutonze.timeseries import FormSeries
+
+
+def test_matches_on_the_same_matchday_add_up(match_stats):
+    # Equipe1-J5 joue aussi le 5e match d'Equipe3 : deux matchs sur la 5e journée
+    day = match_stats['Date'].drop_duplicates().sort_values().iloc[4]
+    own = match_stats[(match_stats['Joueur'] == 'Equipe1-J5') & (match_stats['Date'] == day)]
+    loan = own.assign(Equipe='Equipe3', Minutes=90 - own['Minutes'].iat[0], Buts=1, Passes_decisives=0)
+    stats = pd.concat([match_stats, loan], ignore_index=True)
+
+    series = FormSeries(stats)
+    row = series.rows(['Equipe1-J5'])[0]
+    both = pd.concat([own, loan])
+    player = stats[stats['Joueur'] == 'Equipe1-J5']
+
+    # Comptes additionnés : les totaux de la saison sont conservés
+    assert series.minutes[row, 4] == both['Minutes'].sum()
+    assert series.goals[row, 4] == both['Buts'].sum()
+    assert series.assists[row, 4] == both['Passes_decisives'].sum()
+    assert np.nansum(series.minutes[row]) == player['Minutes'].sum()
+    assert np.nansum(series.goals[row]) == player['Buts'].sum()
+    assert np.nansum(series.assists[row]) == player['Passes_decisives'].sum()
+    # Note : moyenne des deux matchs
+    assert series.rating[row, 4] == np.float32(match_ratings(both).mean())
+
+
+def test_series_without_duplicates_keep_match_values(match_stats):
+    series = FormSeries(match_stats)
+    stats = match_stats[match_stats['Joueur'] == 'Equipe4-J8']
+    row = series.rows(['Equipe4-J8'])[0]
+
+    assert list(series.minutes[row, :len(stats)]) == list(stats['Minutes'])
+    assert np.isnan(series.minutes[row, len(stats):]).all()
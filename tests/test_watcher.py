@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from scoutonze import watcher
+from scoutonze.data_store import TABLES, refresh
+
+
+class FakeSession:
+    def __init__(self, session_id):
+        self.id = session_id
+        self._client_state = object()
+        self.reruns = 0
+
+    def request_rerun(self, client_state):
+        assert client_state is self._client_state
+        self.reruns += 1
+
+
+@pytest.fixture
+def sessions(monkeypatch):
+    sessions = {session_id: FakeSession(session_id) for session_id in ('a', 'b', 'c')}
+    monkeypatch.setattr(watcher, '_SESSIONS', {'a': '/ligue-1', 'b': '/premier-league', 'closed': '/ligue-1'})
+    monkeypatch.setattr(watcher, '_active_sessions',
+                        lambda: [SimpleNamespace(session=session) for session in sessions.values()])
+    return sessions
+
+
+def test_rerun_only_sessions_of_the_refreshed_partition(sessions):
+    assert watcher.rerun_sessions('/ligue-1') == 1
+    assert [s.reruns for s in sessions.values()] == [1, 0, 0]
+    # Sessions fermées oubliées
+    assert set(watcher._SESSIONS) == {'a', 'b'}
+
+
+def test_rerun_every_session_without_directory(sessions):
+    assert watcher.rerun_sessions() == 3
+
+
+def test_rerun_errors_are_logged(monkeypatch, caplog):
+    def broken():
+        raise RuntimeError("API interne modifiée")
+
+    monkeypatch.setattr(watcher, '_active_sessions', broken)
+    assert watcher.rerun_sessions('/ligue-1') == 0
+    assert "Relance des sessions Streamlit impossible" in caplog.text
+
+
+def test_rerun_outside_streamlit_server():
+    assert watcher.rerun_sessions() == 0
+
+
+def test_check_waits_for_stable_files_and_passes_directory(league_dir):
+    refresh(league_dir)
+    refreshed = []
+    data_watcher = watcher.DataWatcher(league_dir, on_refresh=refreshed.append)
+    data_watcher._pending = data_watcher._snapshot()
+    assert data_watcher.check() is None
+
+    path = league_dir / TABLES['players']['file']
+    pd.read_csv(path).iloc[:-1].to_csv(path, index=False)
+
+    # Premier relevé après l'écriture : on attend que le fichier ne bouge plus
+    assert data_watcher.check() is None
+    assert data_watcher.check().changes == {'players': None}
+    assert refreshed == [league_dir]